@@ -3,11 +3,18 @@ from __future__ import annotations
 import base64
 import json
 import mimetypes
+import shutil
 from pathlib import Path
 from typing import Any, Protocol
 
 from app.ocr_client.quality import evaluate_ocr_quality
 from app.ocr_client.types import OCROptions, OCRResult
+from app.storage.artifact_store import (
+    ArtifactStore,
+    LocalArtifactStore,
+    PackedArtifactStore,
+)
+from app.storage.artifacts import OCR_PACK_FILENAME
 from app.utils.error_taxonomy import (
     OCRParseError,
     UnsupportedFileTypeError,
@@ -69,47 +76,66 @@ class MistralOCRClient:
         tables_dir = output_dir / "tables"
         images_dir = output_dir / "images"
         page_renders_dir = output_dir / "page_renders"
-
-        pages_dir.mkdir(parents=True, exist_ok=True)
-        tables_dir.mkdir(parents=True, exist_ok=True)
-        images_dir.mkdir(parents=True, exist_ok=True)
         page_renders_dir.mkdir(parents=True, exist_ok=True)
 
         payload = self._request_ocr(input_path=input_path, options=options)
 
         raw_response_path = output_dir / "raw_response.json"
-        raw_response_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-
         pages = payload.get("pages")
         if not isinstance(pages, list):
+            _write_raw_response(raw_response_path, payload)
             raise OCRParseError("OCR response missing pages list")
 
+        # A retry or re-run may switch layouts, so whatever the other layout
+        # (or an earlier attempt) left behind is cleared first; readers would
+        # otherwise prefer a stale pack or list stale pages.
+        pack_path: Path | None = output_dir / OCR_PACK_FILENAME
+        pack_path.unlink(missing_ok=True)
+        for layout_dir in (pages_dir, tables_dir, images_dir):
+            shutil.rmtree(layout_dir, ignore_errors=True)
+        if options.artifact_layout == "packed":
+            store: ArtifactStore = PackedArtifactStore(pack_path)
+        else:
+            pack_path = None
+            pages_dir.mkdir(parents=True, exist_ok=True)
+            tables_dir.mkdir(parents=True, exist_ok=True)
+            images_dir.mkdir(parents=True, exist_ok=True)
+            store = LocalArtifactStore(output_dir)
+
         page_markdowns: list[str] = []
+        raw_pages: list[Any] = []
         table_index = 0
         image_index = 0
 
-        for page_offset, page_payload in enumerate(pages, start=1):
-            page_data = page_payload if isinstance(page_payload, dict) else {}
-            markdown = str(page_data.get("markdown") or "")
-            page_markdowns.append(markdown)
-
-            page_path = pages_dir / f"{page_offset:04d}.md"
-            page_path.write_text(markdown, encoding="utf-8")
+        with store:
+            try:
+                for page_offset, page_payload in enumerate(pages, start=1):
+                    page_data = page_payload if isinstance(page_payload, dict) else {}
+                    markdown = str(page_data.get("markdown") or "")
+                    page_markdowns.append(markdown)
+
+                    store.write_text(f"pages/{page_offset:04d}.md", markdown)
+
+                    table_index = _write_tables(
+                        page_data=page_data,
+                        table_index=table_index,
+                        table_format=options.table_format,
+                        store=store,
+                    )
+                    image_index, raw_images = _write_images(
+                        page_data=page_data,
+                        image_index=image_index,
+                        store=store,
+                    )
+                    if isinstance(page_payload, dict) and raw_images is not None:
+                        page_payload = {**page_payload, "images": raw_images}
+                    raw_pages.append(page_payload)
+            except OCRParseError:
+                # Keep the untouched response for debugging the failed page.
+                _write_raw_response(raw_response_path, payload)
+                raise
 
-            table_index = _write_tables(
-                page_data=page_data,
-                table_index=table_index,
-                table_format=options.table_format,
-                tables_dir=tables_dir,
-            )
-            image_index = _write_images(
-                page_data=page_data,
-                image_index=image_index,
-                images_dir=images_dir,
-            )
+        _write_raw_response(raw_response_path, {**payload, "pages": raw_pages})
 
         combined_path = output_dir / "combined.md"
         combined_path.write_text("\n\n".join(page_markdowns), encoding="utf-8")
@@ -139,12 +165,15 @@ class MistralOCRClient:
             pages_count=len(page_markdowns),
             combined_markdown_path=str(combined_path.resolve()),
             raw_response_path=str(raw_response_path.resolve()),
-            tables_dir=str(tables_dir.resolve()),
-            images_dir=str(images_dir.resolve()),
+            tables_dir=None if pack_path is not None else str(tables_dir.resolve()),
+            images_dir=None if pack_path is not None else str(images_dir.resolve()),
             page_renders_dir=str(page_renders_dir.resolve()),
             quality_path=str(quality_path.resolve()),
             quality_warnings=quality_warnings,
             converted_pdf_path=converted_pdf_path,
+            artifacts_pack_path=(
+                str(pack_path.resolve()) if pack_path is not None else None
+            ),
         )
 
     def _request_ocr(self, *, input_path: Path, options: OCROptions) -> dict[str, Any]:
@@ -224,12 +253,19 @@ def _response_to_dict(response: Any) -> dict[str, Any]:
     raise OCRParseError("Unsupported response type")
 
 
+def _write_raw_response(path: Path, payload: dict[str, Any]) -> None:
+    path.write_text(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8",
+    )
+
+
 def _write_tables(
     *,
     page_data: dict[str, Any],
     table_index: int,
     table_format: str,
-    tables_dir: Path,
+    store: ArtifactStore,
 ) -> int:
     if table_format == "none":
         return table_index
@@ -247,8 +283,7 @@ def _write_tables(
             extension = "html"
             content = str(table_data.get("html") or table_data.get("content") or "")
 
-        table_path = tables_dir / f"tbl-{table_index}.{extension}"
-        table_path.write_text(content, encoding="utf-8")
+        store.write_text(f"tables/tbl-{table_index}.{extension}", content)
         table_index += 1
 
     return table_index
@@ -258,24 +293,37 @@ def _write_images(
     *,
     page_data: dict[str, Any],
     image_index: int,
-    images_dir: Path,
-) -> int:
+    store: ArtifactStore,
+) -> tuple[int, list[Any] | None]:
+    """Store decoded images and return the page's images for raw_response.json.
+
+    The returned list replaces each ``image_base64`` payload with an
+    ``image_ref`` naming the stored artifact, so the raw response does not
+    carry a second copy of every image.
+    """
     images = page_data.get("images")
     if not isinstance(images, list):
-        return image_index
+        return image_index, None
 
+    raw_images: list[Any] = []
     for image in images:
         image_data = image if isinstance(image, dict) else {}
         encoded = str(image_data.get("image_base64") or "")
         if not encoded:
+            raw_images.append(image)
             continue
 
         payload, extension = _decode_image_payload(encoded, image_data)
-        image_path = images_dir / f"img-{image_index}.{extension}"
-        image_path.write_bytes(payload)
+        image_key = f"images/img-{image_index}.{extension}"
+        store.write_bytes(image_key, payload)
+        raw_image = {
+            key: value for key, value in image_data.items() if key != "image_base64"
+        }
+        raw_image["image_ref"] = image_key
+        raw_images.append(raw_image)
         image_index += 1
 
-    return image_index
+    return image_index, raw_images
 
 
 def _decode_image_payload(
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 TableFormat = Literal["html", "markdown", "none"]
+OCRArtifactLayout = Literal["packed", "files"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,6 +14,9 @@ class OCROptions:
     include_image_base64: bool = True
     extract_header: bool = False
     extract_footer: bool = False
+    # "packed" keeps pages, tables and images in one ocr.pack per document;
+    # "files" writes the legacy pages/, tables/ and images/ trees.
+    artifact_layout: OCRArtifactLayout = "packed"
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,9 +26,12 @@ class OCRResult:
     pages_count: int
     combined_markdown_path: str
     raw_response_path: str
-    tables_dir: str
-    images_dir: str
+    # Set for the "files" layout; packed results keep tables and images in
+    # ``artifacts_pack_path`` instead.
+    tables_dir: str | None
+    images_dir: str | None
     page_renders_dir: str
     quality_path: str
     quality_warnings: list[str]
     converted_pdf_path: str | None = None
+    artifacts_pack_path: str | None = None
@@ -105,6 +105,7 @@ def _seed_single_run(
     original_file = document_artifacts.original_dir / "contract.pdf"
     original_file.write_bytes(b"%PDF-1.4\n% deterministic-e2e-seed\n")
 
+    document_artifacts.pages_dir.mkdir(parents=True, exist_ok=True)
     (document_artifacts.pages_dir / "0001.md").write_text(
         spec.combined_markdown,
         encoding="utf-8",
@@ -182,6 +183,7 @@ def _seed_single_run(
         usage_json=_dict_or_empty(spec.metrics.get("usage")),
         usage_normalized_json=_dict_or_empty(spec.metrics.get("usage_normalized")),
         cost_json=_dict_or_empty(spec.metrics.get("cost")),
+        parsed_json=spec.parsed_payload,
     )
     repo.update_run_status(run_id=run.run_id, status="completed")
 
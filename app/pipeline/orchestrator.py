@@ -49,6 +49,8 @@ class OCRDocumentStageResult:
     combined_markdown_path: str
     ocr_artifacts_path: str
     ocr_error: str | None
+    # The OCR container file when pages, tables and images are packed.
+    ocr_artifacts_pack_path: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -557,6 +559,7 @@ class OCRPipelineOrchestrator:
                 usage_json=llm_result.usage_raw,
                 usage_normalized_json=llm_result.usage_normalized,
                 cost_json=llm_result.cost,
+                parsed_json=llm_result.parsed_json,
             )
             update_run_manifest(
                 artifacts_root_path=run.artifacts_root_path,
@@ -1020,6 +1023,7 @@ class OCRPipelineOrchestrator:
                         combined_markdown_path=ocr_result.combined_markdown_path,
                         ocr_artifacts_path=str(document_artifacts.ocr_dir.resolve()),
                         ocr_error=None,
+                        ocr_artifacts_pack_path=ocr_result.artifacts_pack_path,
                     )
                 )
                 packed_documents.append(
@@ -1379,6 +1383,7 @@ def _manifest_document_entries(
                 "pages_count": document.pages_count,
                 "combined_markdown_path": document.combined_markdown_path,
                 "ocr_artifacts_path": document.ocr_artifacts_path,
+                "ocr_artifacts_pack_path": document.ocr_artifacts_pack_path,
                 "ocr_error": document.ocr_error,
             }
         )
@@ -1,34 +1,222 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
+from app.storage.artifact_store import (
+    ArtifactStore,
+    ArtifactStoreError,
+    LocalArtifactStore,
+    PackedArtifactStore,
+)
+from app.storage.artifacts import OCR_PACK_FILENAME
 
-def safe_read_text(path: Path | str) -> tuple[str | None, str | None]:
+_DEFAULT_CACHE_MAX_ENTRIES = 256
+_DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_OCR_PACK_CACHE_MAX_ENTRIES = 32
+
+_CacheKind = Literal["text", "json"]
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactCacheStats:
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+    max_entries: int
+    max_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    mtime_ns: int
+    size_bytes: int
+    value: Any
+
+
+class _ArtifactReadCache:
+    """LRU of decoded artifact contents, validated against file mtime and size.
+
+    Entries are charged by on-disk size. Cached values are shared between
+    callers, so parsed JSON must be treated as read-only.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[_CacheKind, str], _CacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        kind: _CacheKind,
+        path: str,
+        file_stat: os.stat_result,
+    ) -> tuple[bool, Any]:
+        key = (kind, path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.mtime_ns == file_stat.st_mtime_ns
+                and entry.size_bytes == file_stat.st_size
+            ):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, entry.value
+            self._misses += 1
+            if entry is not None:
+                self._discard(key)
+            return False, None
+
+    def put(
+        self,
+        kind: _CacheKind,
+        path: str,
+        file_stat: os.stat_result,
+        value: Any,
+    ) -> None:
+        if file_stat.st_size > self.max_bytes or self.max_entries < 1:
+            return
+        key = (kind, path)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = _CacheEntry(
+                mtime_ns=file_stat.st_mtime_ns,
+                size_bytes=file_stat.st_size,
+                value=value,
+            )
+            self._size_bytes += file_stat.st_size
+            while (
+                len(self._entries) > self.max_entries
+                or self._size_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> ArtifactCacheStats:
+        with self._lock:
+            return ArtifactCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+            )
+
+    def _discard(self, key: tuple[_CacheKind, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
+
+
+_ARTIFACT_CACHE = _ArtifactReadCache(
+    max_entries=_DEFAULT_CACHE_MAX_ENTRIES,
+    max_bytes=_DEFAULT_CACHE_MAX_BYTES,
+)
+
+
+_OCR_PACKS: OrderedDict[str, tuple[tuple[int, int], PackedArtifactStore]] = (
+    OrderedDict()
+)
+_OCR_PACKS_LOCK = threading.Lock()
+
+
+def artifact_cache_stats() -> ArtifactCacheStats:
+    return _ARTIFACT_CACHE.stats()
+
+
+def clear_artifact_cache() -> None:
+    _ARTIFACT_CACHE.clear()
+    with _OCR_PACKS_LOCK:
+        _OCR_PACKS.clear()
+
+
+def safe_read_text(
+    path: Path | str,
+    *,
+    cache: bool = True,
+) -> tuple[str | None, str | None]:
+    """Read a UTF-8 artifact; ``cache=False`` suits files that keep growing."""
     file_path = Path(path)
-    if not file_path.exists():
-        return None, f"File not found: {file_path}"
-    if not file_path.is_file():
-        return None, f"Path is not a file: {file_path}"
+    file_stat, error = _stat_regular_file(file_path)
+    if file_stat is None:
+        return None, error
+    if not cache:
+        return _read_text(file_path)
 
-    try:
-        return file_path.read_text(encoding="utf-8"), None
-    except OSError as error:
-        return None, f"Failed to read file {file_path}: {error}"
+    cache_key = os.path.abspath(file_path)
+    hit, cached = _ARTIFACT_CACHE.get("text", cache_key, file_stat)
+    if hit:
+        return cached, None
+
+    text, error = _read_text(file_path)
+    if text is not None:
+        _ARTIFACT_CACHE.put("text", cache_key, file_stat, text)
+    return text, error
 
 
 def safe_read_json(
     path: Path | str,
 ) -> tuple[dict[str, Any] | list[Any] | None, str | None]:
-    text, error = safe_read_text(path)
+    """Read a JSON artifact; the payload may be shared, so never mutate it."""
+    file_path = Path(path)
+    file_stat, error = _stat_regular_file(file_path)
+    if file_stat is None:
+        return None, error
+
+    cache_key = os.path.abspath(file_path)
+    hit, cached = _ARTIFACT_CACHE.get("json", cache_key, file_stat)
+    if hit:
+        return cached, None
+
+    text, error = _read_text(file_path)
     if error is not None:
         return None, error
 
     try:
-        return json.loads(text or ""), None
+        payload = json.loads(text or "")
     except json.JSONDecodeError as decode_error:
         return None, f"Invalid JSON in {Path(path)}: {decode_error}"
+    _ARTIFACT_CACHE.put("json", cache_key, file_stat, payload)
+    return payload, None
+
+
+def _stat_regular_file(file_path: Path) -> tuple[os.stat_result | None, str | None]:
+    # The stat taken before reading also validates the cache entry: content
+    # read afterwards is never older than the mtime it is stored under.
+    try:
+        file_stat = file_path.stat()
+    except (OSError, ValueError):
+        return None, f"File not found: {file_path}"
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None, f"Path is not a file: {file_path}"
+    return file_stat, None
+
+
+def _read_text(file_path: Path) -> tuple[str | None, str | None]:
+    try:
+        return file_path.read_text(encoding="utf-8"), None
+    except OSError as error:
+        return None, f"Failed to read file {file_path}: {error}"
 
 
 def safe_load_run_manifest(
@@ -78,3 +266,87 @@ def safe_load_combined_markdown(
     ocr_artifacts_path: Path | str,
 ) -> tuple[str | None, str | None]:
     return safe_read_text(Path(ocr_artifacts_path) / "combined.md")
+
+
+def safe_load_ocr_page(
+    ocr_artifacts_path: Path | str,
+    page_number: int,
+) -> tuple[str | None, str | None]:
+    """Read one OCR page from ``ocr.pack``, or from ``pages/`` for older runs."""
+    return _read_ocr_artifact_text(ocr_artifacts_path, f"pages/{page_number:04d}.md")
+
+
+def safe_read_ocr_artifact_bytes(
+    ocr_artifacts_path: Path | str,
+    key: str,
+) -> tuple[bytes | None, str | None]:
+    """Read a table or image such as ``images/img-0.png`` from either layout."""
+    store, error = _open_ocr_store(ocr_artifacts_path)
+    if store is None:
+        return None, error
+    try:
+        return store.read_bytes(key), None
+    except (OSError, ValueError, ArtifactStoreError) as read_error:
+        return None, f"Failed to read OCR artifact {key}: {read_error}"
+
+
+def safe_list_ocr_pages(
+    ocr_artifacts_path: Path | str,
+) -> tuple[list[int], str | None]:
+    """Return the stored page numbers in ascending order."""
+    store, error = _open_ocr_store(ocr_artifacts_path)
+    if store is None:
+        return [], error
+    page_numbers: list[int] = []
+    for key in store.list_keys("pages"):
+        name = key.rsplit("/", maxsplit=1)[-1]
+        stem, _, suffix = name.partition(".")
+        if suffix == "md" and stem.isdigit():
+            page_numbers.append(int(stem))
+    return sorted(page_numbers), None
+
+
+def _read_ocr_artifact_text(
+    ocr_artifacts_path: Path | str,
+    key: str,
+) -> tuple[str | None, str | None]:
+    payload, error = safe_read_ocr_artifact_bytes(ocr_artifacts_path, key)
+    if payload is None:
+        return None, error
+    try:
+        return payload.decode("utf-8"), None
+    except UnicodeDecodeError as decode_error:
+        return None, f"Failed to read OCR artifact {key}: {decode_error}"
+
+
+def _open_ocr_store(
+    ocr_artifacts_path: Path | str,
+) -> tuple[ArtifactStore | None, str | None]:
+    ocr_dir = Path(ocr_artifacts_path)
+    pack_path = ocr_dir / OCR_PACK_FILENAME
+    try:
+        pack_stat = pack_path.stat()
+    except (OSError, ValueError):
+        return LocalArtifactStore(ocr_dir), None
+    if not stat.S_ISREG(pack_stat.st_mode):
+        return LocalArtifactStore(ocr_dir), None
+
+    # Opened packs are kept so repeated page reads skip loading the index.
+    # They are only read here, and any rewrite changes mtime or size.
+    cache_key = os.path.abspath(pack_path)
+    version = (pack_stat.st_mtime_ns, pack_stat.st_size)
+    with _OCR_PACKS_LOCK:
+        cached = _OCR_PACKS.get(cache_key)
+        if cached is not None and cached[0] == version:
+            _OCR_PACKS.move_to_end(cache_key)
+            return cached[1], None
+    try:
+        store = PackedArtifactStore(pack_path)
+    except (OSError, ArtifactStoreError) as error:
+        return None, f"Failed to open OCR pack {pack_path}: {error}"
+    with _OCR_PACKS_LOCK:
+        _OCR_PACKS[cache_key] = (version, store)
+        _OCR_PACKS.move_to_end(cache_key)
+        while len(_OCR_PACKS) > _OCR_PACK_CACHE_MAX_ENTRIES:
+            _OCR_PACKS.popitem(last=False)
+    return store, None
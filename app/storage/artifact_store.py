@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import struct
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_PACK_MAGIC = b"KAUCJAPK\x01\n"
+# key length, payload length, payload crc32
+_PACK_RECORD_HEADER = struct.Struct("<IQI")
+# One index entry: key length, payload offset, payload length, payload crc32.
+_PACK_INDEX_ENTRY = struct.Struct("<IQQI")
+# Last bytes of a closed pack: offset of the index record, trailer magic.
+_PACK_TRAILER = struct.Struct("<Q8s")
+_PACK_TRAILER_MAGIC = b"KPKINDEX"
+_S3_MISSING_KEY_CODES = frozenset({"NoSuchKey", "404", "NotFound"})
+
+
+class ArtifactStoreError(RuntimeError):
+    """Raised when an artifact store is corrupt or cannot be written."""
+
+
+class ArtifactStore(ABC):
+    """Key/value view of one run's artifacts.
+
+    Keys are POSIX paths relative to the run root, e.g.
+    ``documents/0000001/ocr/combined.md``. Missing keys raise
+    ``FileNotFoundError`` from every implementation.
+    """
+
+    @abstractmethod
+    def write_bytes(self, key: str, data: bytes) -> None: ...
+
+    @abstractmethod
+    def read_bytes(self, key: str) -> bytes: ...
+
+    @abstractmethod
+    def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    def list_keys(self, prefix: str = "") -> list[str]:
+        """Return stored keys under ``prefix`` in sorted order."""
+
+    def write_text(self, key: str, text: str) -> None:
+        self.write_bytes(key, text.encode("utf-8"))
+
+    def read_text(self, key: str) -> str:
+        return self.read_bytes(key).decode("utf-8")
+
+    def close(self) -> None:
+        return None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class LocalArtifactStore(ArtifactStore):
+    """One plain file per key under ``root``; the historical layout."""
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def read_bytes(self, key: str) -> bytes:
+        return self._path(key).read_bytes()
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def list_keys(self, prefix: str = "") -> list[str]:
+        base = self.root / _normalize_prefix(prefix)
+        if not base.is_dir():
+            return []
+        return sorted(
+            path.relative_to(self.root).as_posix()
+            for path in base.rglob("*")
+            if path.is_file() and not path.is_symlink()
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.root / _normalize_key(key)
+
+
+class PackedArtifactStore(ArtifactStore):
+    """All artifacts of a run in one append-only container file.
+
+    Each record is a fixed header (key length, payload length, CRC32), the
+    UTF-8 key and the payload. Rewriting a key appends a new record that
+    supersedes the earlier one.
+
+    Closing a store that was written to appends an index footer: a record
+    with an empty key whose payload maps every key to its latest payload
+    offset, followed by a trailer pointing at that record. Opening a closed
+    pack reads the index with one seek. The next append truncates the
+    footer, and ``close`` writes a fresh one. A pack left without a valid
+    footer (e.g. by a crash) is indexed by walking its record headers
+    instead, and a torn trailing record is dropped before the next append.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._index: dict[str, tuple[int, int, int]] = {}
+        self._end = len(_PACK_MAGIC)
+        self._writer: BinaryIO | None = None
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self._load_index()
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        normalized = _normalize_key(key)
+        encoded_key = normalized.encode("utf-8")
+        crc = zlib.crc32(data)
+        with self._lock:
+            writer = self._open_writer()
+            writer.write(_PACK_RECORD_HEADER.pack(len(encoded_key), len(data), crc))
+            writer.write(encoded_key)
+            writer.write(data)
+            data_offset = self._end + _PACK_RECORD_HEADER.size + len(encoded_key)
+            self._index[normalized] = (data_offset, len(data), crc)
+            self._end = data_offset + len(data)
+
+    def read_bytes(self, key: str) -> bytes:
+        normalized = _normalize_key(key)
+        with self._lock:
+            entry = self._index.get(normalized)
+            if self._writer is not None:
+                self._writer.flush()
+        if entry is None:
+            raise FileNotFoundError(f"Artifact not found in {self.path}: {normalized}")
+        offset, size, crc = entry
+        with self.path.open("rb") as source:
+            source.seek(offset)
+            data = source.read(size)
+        if len(data) != size or zlib.crc32(data) != crc:
+            raise ArtifactStoreError(f"Corrupt artifact in {self.path}: {normalized}")
+        return data
+
+    def exists(self, key: str) -> bool:
+        with self._lock:
+            return _normalize_key(key) in self._index
+
+    def list_keys(self, prefix: str = "") -> list[str]:
+        normalized_prefix = _normalize_prefix(prefix)
+        with self._lock:
+            keys = list(self._index)
+        if not normalized_prefix:
+            return sorted(keys)
+        return sorted(
+            key
+            for key in keys
+            if key == normalized_prefix or key.startswith(f"{normalized_prefix}/")
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._write_index_footer(self._writer)
+                self._writer.close()
+                self._writer = None
+
+    def _open_writer(self) -> BinaryIO:
+        if self._writer is not None:
+            return self._writer
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists() or self._end == len(_PACK_MAGIC):
+            # Also covers an empty file left by a crash before the magic.
+            self.path.write_bytes(_PACK_MAGIC)
+        writer = self.path.open("r+b")
+        # Drops a torn trailing record so new records stay reachable.
+        writer.truncate(self._end)
+        writer.seek(self._end)
+        self._writer = writer
+        return writer
+
+    def _write_index_footer(self, writer: BinaryIO) -> None:
+        entries = bytearray()
+        for key, (offset, size, crc) in self._index.items():
+            encoded_key = key.encode("utf-8")
+            entries += _PACK_INDEX_ENTRY.pack(len(encoded_key), offset, size, crc)
+            entries += encoded_key
+        writer.seek(self._end)
+        writer.write(_PACK_RECORD_HEADER.pack(0, len(entries), zlib.crc32(entries)))
+        writer.write(entries)
+        writer.write(_PACK_TRAILER.pack(self._end, _PACK_TRAILER_MAGIC))
+        writer.truncate()
+
+    def _load_index(self) -> None:
+        file_size = self.path.stat().st_size
+        with self.path.open("rb") as source:
+            magic = source.read(len(_PACK_MAGIC))
+            if magic != _PACK_MAGIC:
+                if _PACK_MAGIC.startswith(magic):
+                    # Created but never written: treat as a new pack.
+                    return
+                raise ArtifactStoreError(f"Not an artifact pack: {self.path}")
+            if not self._load_index_footer(source, file_size):
+                self._scan_records(source, file_size)
+
+    def _load_index_footer(self, source: BinaryIO, file_size: int) -> bool:
+        footer_floor = len(_PACK_MAGIC) + _PACK_RECORD_HEADER.size
+        if file_size < footer_floor + _PACK_TRAILER.size:
+            return False
+        source.seek(file_size - _PACK_TRAILER.size)
+        index_offset, trailer_magic = _PACK_TRAILER.unpack(
+            source.read(_PACK_TRAILER.size)
+        )
+        if trailer_magic != _PACK_TRAILER_MAGIC or not (
+            len(_PACK_MAGIC) <= index_offset <= file_size - footer_floor
+        ):
+            return False
+        source.seek(index_offset)
+        key_length, size, crc = _PACK_RECORD_HEADER.unpack(
+            source.read(_PACK_RECORD_HEADER.size)
+        )
+        payload_end = index_offset + _PACK_RECORD_HEADER.size + size
+        if key_length != 0 or payload_end + _PACK_TRAILER.size != file_size:
+            return False
+        entries = source.read(size)
+        if zlib.crc32(entries) != crc:
+            return False
+        index: dict[str, tuple[int, int, int]] = {}
+        position = 0
+        while position < len(entries):
+            key_length, offset, size, crc = _PACK_INDEX_ENTRY.unpack_from(
+                entries, position
+            )
+            position += _PACK_INDEX_ENTRY.size
+            key = entries[position : position + key_length].decode("utf-8")
+            index[key] = (offset, size, crc)
+            position += key_length
+        self._index = index
+        self._end = index_offset
+        return True
+
+    def _scan_records(self, source: BinaryIO, file_size: int) -> None:
+        offset = len(_PACK_MAGIC)
+        source.seek(offset)
+        while offset + _PACK_RECORD_HEADER.size <= file_size:
+            key_length, size, crc = _PACK_RECORD_HEADER.unpack(
+                source.read(_PACK_RECORD_HEADER.size)
+            )
+            data_offset = offset + _PACK_RECORD_HEADER.size + key_length
+            if key_length == 0 or data_offset + size > file_size:
+                # An index record only ever ends the data; past it lies the
+                # footer, which the next append replaces.
+                break
+            key = source.read(key_length).decode("utf-8", errors="replace")
+            self._index[key] = (data_offset, size, crc)
+            offset = data_offset + size
+            source.seek(offset)
+        self._end = offset
+
+
+class S3ArtifactStore(ArtifactStore):
+    """Artifacts stored as objects under ``prefix`` in an S3-compatible bucket.
+
+    ``client`` is a boto3-style S3 client (``put_object``, ``get_object``,
+    ``head_object`` and ``list_objects_v2``); any object with that surface
+    works, which keeps this module free of an SDK dependency. Nothing in the
+    app writes runs through it yet; it is a library-level backend only.
+    """
+
+    def __init__(self, *, client: Any, bucket: str, prefix: str = "") -> None:
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._object_key(key), Body=data)
+
+    def read_bytes(self, key: str) -> bytes:
+        object_key = self._object_key(key)
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=object_key)
+        except Exception as error:
+            if _is_missing_object_error(error):
+                raise FileNotFoundError(
+                    f"Artifact not found in s3://{self.bucket}: {object_key}"
+                ) from error
+            raise
+        return response["Body"].read()
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        except Exception as error:
+            if _is_missing_object_error(error):
+                return False
+            raise
+        return True
+
+    def list_keys(self, prefix: str = "") -> list[str]:
+        normalized_prefix = _normalize_prefix(prefix)
+        list_prefix = "/".join(
+            part for part in (self.prefix, normalized_prefix) if part
+        )
+        if list_prefix:
+            list_prefix = f"{list_prefix}/"
+        strip_length = len(f"{self.prefix}/") if self.prefix else 0
+
+        keys: list[str] = []
+        request: dict[str, Any] = {"Bucket": self.bucket, "Prefix": list_prefix}
+        while True:
+            response = self.client.list_objects_v2(**request)
+            keys.extend(
+                str(item["Key"])[strip_length:] for item in response.get("Contents", [])
+            )
+            token = response.get("NextContinuationToken")
+            if not response.get("IsTruncated") or not token:
+                break
+            request["ContinuationToken"] = token
+        return sorted(keys)
+
+    def _object_key(self, key: str) -> str:
+        normalized = _normalize_key(key)
+        return f"{self.prefix}/{normalized}" if self.prefix else normalized
+
+
+def _normalize_key(key: str) -> str:
+    normalized = _normalize_prefix(key)
+    if not normalized:
+        raise ValueError(f"Artifact key must not be empty: {key!r}")
+    return normalized
+
+
+def _normalize_prefix(prefix: str) -> str:
+    if "\\" in prefix or prefix.startswith("/"):
+        raise ValueError(f"Artifact key must be a relative POSIX path: {prefix!r}")
+    parts = [part for part in PurePosixPath(prefix).parts if part != "."]
+    if ".." in parts:
+        raise ValueError(f"Artifact key must not contain '..': {prefix!r}")
+    return "/".join(parts)
+
+
+def _is_missing_object_error(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return False
+    code = str((response.get("Error") or {}).get("Code") or "")
+    return code in _S3_MISSING_KEY_CODES
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+OCR_PACK_FILENAME = "ocr.pack"
+
 
 @dataclass(frozen=True, slots=True)
 class RunArtifacts:
@@ -77,10 +79,9 @@ class ArtifactsManager:
         page_renders_dir = ocr_dir / "page_renders"
 
         original_dir.mkdir(parents=True, exist_ok=True)
-        pages_dir.mkdir(parents=True, exist_ok=True)
-        tables_dir.mkdir(parents=True, exist_ok=True)
-        images_dir.mkdir(parents=True, exist_ok=True)
         page_renders_dir.mkdir(parents=True, exist_ok=True)
+        # pages/, tables/ and images/ only exist for the "files" OCR layout;
+        # the OCR client creates them when it writes that layout.
 
         return DocumentArtifacts(
             doc_id=doc_id,
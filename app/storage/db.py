@@ -59,7 +59,35 @@ CREATE TABLE IF NOT EXISTS llm_outputs (
     FOREIGN KEY (run_id) REFERENCES runs (run_id) ON DELETE CASCADE
 );
 
+CREATE TABLE IF NOT EXISTS run_summaries (
+    run_id TEXT PRIMARY KEY,
+    total_cost_usd REAL,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    total_tokens INTEGER,
+    t_ocr_total_ms REAL,
+    t_llm_total_ms REAL,
+    t_total_ms REAL,
+    checklist_items INTEGER NOT NULL DEFAULT 0,
+    checklist_confirmed INTEGER NOT NULL DEFAULT 0,
+    checklist_ambiguous INTEGER NOT NULL DEFAULT 0,
+    checklist_conflict INTEGER NOT NULL DEFAULT 0,
+    checklist_missing INTEGER NOT NULL DEFAULT 0,
+    critical_gaps_count INTEGER NOT NULL DEFAULT 0,
+    next_questions_count INTEGER NOT NULL DEFAULT 0,
+    comparison_json TEXT,
+    updated_at TEXT NOT NULL,
+    FOREIGN KEY (run_id) REFERENCES runs (run_id) ON DELETE CASCADE
+);
+
 CREATE INDEX IF NOT EXISTS idx_runs_session_id ON runs (session_id);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs (created_at, run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_provider_created_at
+    ON runs (provider, created_at, run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_model_created_at
+    ON runs (model, created_at, run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_prompt_version_created_at
+    ON runs (prompt_version, created_at, run_id);
 CREATE INDEX IF NOT EXISTS idx_documents_run_id ON documents (run_id);
 CREATE UNIQUE INDEX IF NOT EXISTS ux_documents_run_doc_id ON documents (run_id, doc_id);
 """
@@ -36,6 +36,45 @@ class RunRecord:
     cost_json: dict[str, Any] | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class RunSummaryRecord:
+    """Scalar metrics and checklist counts materialised when a run finalises.
+
+    ``comparison_json`` keeps the checklist, critical gaps and next questions
+    used by run comparison; it is ``None`` when no parsed LLM output exists.
+    """
+
+    run_id: str
+    updated_at: str
+    total_cost_usd: float | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    total_tokens: int | None = None
+    t_ocr_total_ms: float | None = None
+    t_llm_total_ms: float | None = None
+    t_total_ms: float | None = None
+    checklist_items: int = 0
+    checklist_confirmed: int = 0
+    checklist_ambiguous: int = 0
+    checklist_conflict: int = 0
+    checklist_missing: int = 0
+    critical_gaps_count: int = 0
+    next_questions_count: int = 0
+    comparison_json: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RunCursor:
+    """Keyset position in a ``(created_at, run_id)`` ordered run listing."""
+
+    created_at: str
+    run_id: str
+
+    @classmethod
+    def after_run(cls, run: RunRecord) -> RunCursor:
+        return cls(created_at=run.created_at, run_id=run.run_id)
+
+
 @dataclass(frozen=True, slots=True)
 class DocumentRecord:
     id: int
@@ -112,3 +151,18 @@ class RestoreRunResult:
     verify_only: bool
     rollback_attempted: bool
     rollback_succeeded: bool | None
+
+
+@dataclass(frozen=True, slots=True)
+class BulkRestoreArchiveResult:
+    zip_path: str
+    result: RestoreRunResult
+
+
+@dataclass(frozen=True, slots=True)
+class BulkRestoreResult:
+    archives_total: int
+    restored_archives: int
+    verified_archives: int
+    failed_archives: int
+    archives: list[BulkRestoreArchiveResult]
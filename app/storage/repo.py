@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
-import shutil
+import os
 import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -16,10 +19,60 @@ from app.storage.models import (
     LLMOutputRecord,
     OCRStatus,
     RunBundle,
+    RunCursor,
     RunRecord,
     RunStatus,
+    RunSummaryRecord,
     SessionRecord,
 )
+from app.storage.run_summary import build_run_summary
+from app.storage.trash import RunTrash
+
+_RUN_COLUMNS = (
+    "run_id",
+    "session_id",
+    "created_at",
+    "provider",
+    "model",
+    "openai_reasoning_effort",
+    "gemini_thinking_level",
+    "prompt_name",
+    "prompt_version",
+    "schema_version",
+    "status",
+    "error_code",
+    "error_message",
+    "artifacts_root_path",
+)
+_RUN_JSON_COLUMNS = (
+    "timings_json",
+    "usage_json",
+    "usage_normalized_json",
+    "cost_json",
+)
+_RUN_SUMMARY_COLUMNS = (
+    "run_id",
+    "total_cost_usd",
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "t_ocr_total_ms",
+    "t_llm_total_ms",
+    "t_total_ms",
+    "checklist_items",
+    "checklist_confirmed",
+    "checklist_ambiguous",
+    "checklist_conflict",
+    "checklist_missing",
+    "critical_gaps_count",
+    "next_questions_count",
+    "comparison_json",
+    "updated_at",
+)
+# Deleted run trees are parked here until the trash reaper removes them.
+_TRASH_DIRNAME = ".trash"
+# Stays below SQLITE_MAX_VARIABLE_NUMBER of older SQLite builds (999).
+_SQL_IN_CHUNK_SIZE = 500
 
 
 class StorageRepo:
@@ -27,12 +80,18 @@ class StorageRepo:
         self,
         db_path: Path | str,
         artifacts_manager: ArtifactsManager | None = None,
+        *,
+        reap_trash_in_background: bool = True,
     ) -> None:
         self.db_path = Path(db_path)
         self.artifacts_manager = artifacts_manager or ArtifactsManager(
             self.db_path.parent
         )
         init_db(self.db_path)
+        self.trash = RunTrash(
+            self.artifacts_manager.data_dir / _TRASH_DIRNAME,
+            background=reap_trash_in_background,
+        )
 
     def create_session(self, session_id: str | None = None) -> SessionRecord:
         session_identifier = session_id or str(uuid4())
@@ -160,7 +219,20 @@ class StorageRepo:
         usage_json: dict[str, Any],
         usage_normalized_json: dict[str, Any],
         cost_json: dict[str, Any],
+        parsed_json: dict[str, Any] | None = None,
     ) -> None:
+        """Store run metrics and refresh the run summary in one transaction.
+
+        ``parsed_json`` is the parsed LLM response; when given, the summary
+        also carries the checklist counts and the comparison payload.
+        """
+        summary = build_run_summary(
+            run_id=run_id,
+            timings=timings_json,
+            usage_normalized=usage_normalized_json,
+            cost=cost_json,
+            parsed_json=parsed_json,
+        )
         with connection(self.db_path) as conn:
             result = conn.execute(
                 """
@@ -180,9 +252,60 @@ class StorageRepo:
                     run_id,
                 ),
             )
+            if result.rowcount == 0:
+                raise KeyError(f"Run not found: {run_id}")
+            _upsert_run_summary(conn, summary)
 
-        if result.rowcount == 0:
-            raise KeyError(f"Run not found: {run_id}")
+    def upsert_run_summary(self, summary: RunSummaryRecord) -> None:
+        with connection(self.db_path) as conn:
+            _upsert_run_summary(conn, summary)
+
+    def get_run_summary(self, run_id: str) -> RunSummaryRecord | None:
+        with connection(self.db_path) as conn:
+            row = conn.execute(
+                f"""
+                SELECT {", ".join(_RUN_SUMMARY_COLUMNS)}
+                FROM run_summaries
+                WHERE run_id = ?
+                """,
+                (run_id,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return _row_to_run_summary_record(row)
+
+    def get_run_summaries(self, run_ids: list[str]) -> dict[str, RunSummaryRecord]:
+        """Return summaries keyed by run_id for list views.
+
+        Runs without a stored summary (finalised before the table existed, or
+        restored from a bundle) are summarised from the metrics columns of
+        ``runs`` without writing; such summaries carry no comparison payload.
+        """
+        summaries: dict[str, RunSummaryRecord] = {}
+        unique_run_ids = list(dict.fromkeys(run_ids))
+        with connection(self.db_path) as conn:
+            for start in range(0, len(unique_run_ids), _SQL_IN_CHUNK_SIZE):
+                chunk = unique_run_ids[start : start + _SQL_IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"""
+                    SELECT {", ".join(_RUN_SUMMARY_COLUMNS)}
+                    FROM run_summaries
+                    WHERE run_id IN ({placeholders})
+                    """,
+                    tuple(chunk),
+                ).fetchall()
+                for row in rows:
+                    summary = _row_to_run_summary_record(row)
+                    summaries[summary.run_id] = summary
+
+        missing_run_ids = [
+            run_id for run_id in unique_run_ids if run_id not in summaries
+        ]
+        if missing_run_ids:
+            summaries.update(self._summarize_runs_from_metrics(missing_run_ids))
+        return summaries
 
     def get_run(self, run_id: str) -> RunRecord | None:
         with connection(self.db_path) as conn:
@@ -228,7 +351,17 @@ class StorageRepo:
         date_from: str | None = None,
         date_to: str | None = None,
         limit: int = 50,
+        after: RunCursor | None = None,
+        oldest_first: bool = False,
+        include_json: bool = True,
     ) -> list[RunRecord]:
+        """List runs ordered by ``(created_at, run_id)``, newest first by default.
+
+        ``after`` continues a listing from the last run of a previous page
+        (keyset pagination), so deep pages cost the same as the first one.
+        With ``include_json=False`` the metrics JSON columns are neither read
+        nor parsed and the corresponding ``RunRecord`` fields stay ``None``.
+        """
         filters: list[str] = []
         params: list[object] = []
 
@@ -258,37 +391,63 @@ class StorageRepo:
             filters.append("created_at <= ?")
             params.append(normalized_to)
 
-        query = """
-            SELECT
-                run_id,
-                session_id,
-                created_at,
-                provider,
-                model,
-                openai_reasoning_effort,
-                gemini_thinking_level,
-                prompt_name,
-                prompt_version,
-                schema_version,
-                status,
-                error_code,
-                error_message,
-                timings_json,
-                usage_json,
-                usage_normalized_json,
-                cost_json,
-                artifacts_root_path
-            FROM runs
-        """
+        if after is not None:
+            comparison = ">" if oldest_first else "<"
+            filters.append(f"(created_at, run_id) {comparison} (?, ?)")
+            params.extend((after.created_at, after.run_id))
+
+        columns = _RUN_COLUMNS + _RUN_JSON_COLUMNS if include_json else _RUN_COLUMNS
+        query = f"SELECT {', '.join(columns)} FROM runs"
         if filters:
             query += f" WHERE {' AND '.join(filters)}"
-        query += " ORDER BY created_at DESC LIMIT ?"
+        direction = "ASC" if oldest_first else "DESC"
+        query += f" ORDER BY created_at {direction}, run_id {direction} LIMIT ?"
         params.append(max(limit, 1))
 
         with connection(self.db_path) as conn:
             rows = conn.execute(query, tuple(params)).fetchall()
 
-        return [_row_to_run_record(row) for row in rows]
+        return [_row_to_run_record(row, include_json=include_json) for row in rows]
+
+    def iter_runs(
+        self,
+        *,
+        session_id: str | None = None,
+        provider: str | None = None,
+        model: str | None = None,
+        prompt_version: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        page_size: int = 500,
+        oldest_first: bool = False,
+        include_json: bool = True,
+    ) -> Iterator[RunRecord]:
+        """Yield every matching run, fetching ``page_size`` rows per query.
+
+        Pages are chained with keyset cursors, so memory stays bounded by one
+        page and runs deleted behind the cursor do not shift later pages.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        after: RunCursor | None = None
+        while True:
+            page = self.list_runs(
+                session_id=session_id,
+                provider=provider,
+                model=model,
+                prompt_version=prompt_version,
+                date_from=date_from,
+                date_to=date_to,
+                limit=page_size,
+                after=after,
+                oldest_first=oldest_first,
+                include_json=include_json,
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            after = RunCursor.after_run(page[-1])
 
     def get_run_bundle(self, run_id: str) -> RunBundle | None:
         run = self.get_run(run_id)
@@ -300,6 +459,80 @@ class StorageRepo:
         return RunBundle(run=run, documents=documents, llm_output=llm_output)
 
     def delete_run(self, run_id: str) -> DeleteRunResult:
+        """Delete a run's metadata and detach its artifact tree.
+
+        The tree is renamed into the trash area rather than removed in place,
+        so latency does not grow with the number of artifact files; disk space
+        is reclaimed by ``self.trash`` (see ``reap_trash``).
+        """
+        result = self._delete_run_artifacts(run_id)
+        if not result.deleted:
+            return result
+
+        try:
+            metadata_deleted = self._delete_run_metadata(run_id=result.run_id)
+        except sqlite3.Error as error:
+            return _metadata_delete_failed(result, error)
+
+        if not metadata_deleted:
+            return _metadata_row_missing(result)
+        return result
+
+    def delete_runs(
+        self,
+        run_ids: list[str],
+        *,
+        workers: int = 1,
+        metadata_batch_size: int = 1,
+    ) -> list[DeleteRunResult]:
+        """Delete many runs, returning one result per run id in input order.
+
+        Artifact trees are moved to the trash on up to ``workers`` threads;
+        metadata rows of the runs whose artifacts were detached are then deleted
+        in transactions of ``metadata_batch_size`` runs. Per-run failure semantics match
+        ``delete_run``; with the defaults it is called once per run.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if metadata_batch_size < 1:
+            raise ValueError("metadata_batch_size must be >= 1")
+        if workers == 1 and metadata_batch_size == 1:
+            return [self.delete_run(run_id) for run_id in run_ids]
+
+        if workers > 1 and len(run_ids) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(workers, len(run_ids)),
+                thread_name_prefix="kaucja-delete-run",
+            ) as executor:
+                results = list(executor.map(self._delete_run_artifacts, run_ids))
+        else:
+            results = [self._delete_run_artifacts(run_id) for run_id in run_ids]
+
+        pending = [index for index, result in enumerate(results) if result.deleted]
+        for offset in range(0, len(pending), metadata_batch_size):
+            batch = pending[offset : offset + metadata_batch_size]
+            try:
+                deleted_run_ids = self._delete_runs_metadata(
+                    run_ids=[results[index].run_id for index in batch]
+                )
+            except sqlite3.Error as error:
+                for index in batch:
+                    results[index] = _metadata_delete_failed(results[index], error)
+                continue
+            for index in batch:
+                if results[index].run_id not in deleted_run_ids:
+                    results[index] = _metadata_row_missing(results[index])
+        return results
+
+    def reap_trash(self) -> int:
+        """Synchronously reclaim trashed artifact trees; returns entries removed."""
+        return self.trash.reap()
+
+    def _delete_run_artifacts(self, run_id: str) -> DeleteRunResult:
+        """Validate and trash a run's artifact tree, leaving its metadata.
+
+        Returns a ``deleted=True`` result when metadata deletion may proceed.
+        """
         target_run_id = run_id.strip()
         if not target_run_id:
             return DeleteRunResult(
@@ -352,8 +585,6 @@ class StorageRepo:
                 artifacts_missing=False,
             )
 
-        artifacts_deleted = False
-        artifacts_missing = False
         try:
             artifacts_deleted, artifacts_missing = self._delete_artifacts_tree(
                 artifacts_root=artifacts_root
@@ -369,30 +600,6 @@ class StorageRepo:
                 artifacts_missing=False,
             )
 
-        try:
-            metadata_deleted = self._delete_run_metadata(run_id=target_run_id)
-        except sqlite3.Error as error:
-            return DeleteRunResult(
-                run_id=target_run_id,
-                deleted=False,
-                error_code="DELETE_DB_ERROR",
-                error_message="Failed to delete run metadata from database.",
-                technical_details=f"{error.__class__.__name__}: {error}",
-                artifacts_deleted=artifacts_deleted,
-                artifacts_missing=artifacts_missing,
-            )
-
-        if not metadata_deleted:
-            return DeleteRunResult(
-                run_id=target_run_id,
-                deleted=False,
-                error_code="RUN_NOT_FOUND",
-                error_message=f"Run not found: {target_run_id}",
-                technical_details="Metadata row disappeared before delete.",
-                artifacts_deleted=artifacts_deleted,
-                artifacts_missing=artifacts_missing,
-            )
-
         return DeleteRunResult(
             run_id=target_run_id,
             deleted=True,
@@ -623,6 +830,33 @@ class StorageRepo:
             ),
         )
 
+    def _summarize_runs_from_metrics(
+        self,
+        run_ids: list[str],
+    ) -> dict[str, RunSummaryRecord]:
+        summaries: dict[str, RunSummaryRecord] = {}
+        with connection(self.db_path) as conn:
+            for start in range(0, len(run_ids), _SQL_IN_CHUNK_SIZE):
+                chunk = run_ids[start : start + _SQL_IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"""
+                    SELECT run_id, timings_json, usage_normalized_json, cost_json
+                    FROM runs
+                    WHERE run_id IN ({placeholders})
+                    """,
+                    tuple(chunk),
+                ).fetchall()
+                for row in rows:
+                    summary = build_run_summary(
+                        run_id=str(row["run_id"]),
+                        timings=_from_json_text(row["timings_json"]),
+                        usage_normalized=_from_json_text(row["usage_normalized_json"]),
+                        cost=_from_json_text(row["cost_json"]),
+                    )
+                    summaries[summary.run_id] = summary
+        return summaries
+
     def _safe_artifacts_root_for_delete(
         self,
         *,
@@ -660,13 +894,11 @@ class StorageRepo:
         if not artifacts_root.is_dir():
             raise OSError(f"Artifacts root is not a directory: {artifacts_root}")
 
-        for candidate in artifacts_root.rglob("*"):
-            if candidate.is_symlink():
-                raise OSError(
-                    f"Refusing to delete run with symlinked path: {candidate}"
-                )
+        symlink = _find_symlink(artifacts_root)
+        if symlink is not None:
+            raise OSError(f"Refusing to delete run with symlinked path: {symlink}")
 
-        shutil.rmtree(artifacts_root)
+        self.trash.discard(artifacts_root, label=artifacts_root.name)
         self._cleanup_empty_parents(artifacts_root)
         return True, False
 
@@ -681,6 +913,21 @@ class StorageRepo:
             )
         return result.rowcount > 0
 
+    def _delete_runs_metadata(self, *, run_ids: list[str]) -> set[str]:
+        deleted_run_ids: set[str] = set()
+        with connection(self.db_path) as conn:
+            for run_id in run_ids:
+                result = conn.execute(
+                    """
+                    DELETE FROM runs
+                    WHERE run_id = ?
+                    """,
+                    (run_id,),
+                )
+                if result.rowcount > 0:
+                    deleted_run_ids.add(run_id)
+        return deleted_run_ids
+
     def _cleanup_empty_parents(self, artifacts_root: Path) -> None:
         data_root = self.artifacts_manager.data_dir.resolve()
         session_path = artifacts_root.parent.parent
@@ -692,14 +939,51 @@ class StorageRepo:
             except ValueError:
                 continue
 
+            # Concurrent deletes may empty or remove the same parent; losing
+            # that race is not an error.
             try:
-                next(path.iterdir())
-            except StopIteration:
-                path.rmdir()
+                if next(path.iterdir(), None) is None:
+                    path.rmdir()
             except OSError:
                 continue
 
 
+def _find_symlink(root: Path) -> Path | None:
+    """Return the first symlink below ``root`` using directory entries only."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    return Path(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+    return None
+
+
+def _metadata_delete_failed(
+    result: DeleteRunResult,
+    error: sqlite3.Error,
+) -> DeleteRunResult:
+    return replace(
+        result,
+        deleted=False,
+        error_code="DELETE_DB_ERROR",
+        error_message="Failed to delete run metadata from database.",
+        technical_details=f"{error.__class__.__name__}: {error}",
+    )
+
+
+def _metadata_row_missing(result: DeleteRunResult) -> DeleteRunResult:
+    return replace(
+        result,
+        deleted=False,
+        error_code="RUN_NOT_FOUND",
+        error_message=f"Run not found: {result.run_id}",
+        technical_details="Metadata row disappeared before delete.",
+    )
+
+
 def _utc_now() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
@@ -732,7 +1016,12 @@ def _to_optional_int(value: object) -> int | None:
     return int(value)
 
 
-def _row_to_run_record(row: object) -> RunRecord:
+def _row_to_run_record(row: object, *, include_json: bool = True) -> RunRecord:
+    json_fields: dict[str, dict[str, Any] | None] = {}
+    if include_json:
+        json_fields = {
+            column: _from_json_text(row[column]) for column in _RUN_JSON_COLUMNS
+        }
     return RunRecord(
         run_id=str(row["run_id"]),
         session_id=str(row["session_id"]),
@@ -747,14 +1036,80 @@ def _row_to_run_record(row: object) -> RunRecord:
         status=str(row["status"]),
         error_code=_to_optional_str(row["error_code"]),
         error_message=_to_optional_str(row["error_message"]),
-        timings_json=_from_json_text(row["timings_json"]),
-        usage_json=_from_json_text(row["usage_json"]),
-        usage_normalized_json=_from_json_text(row["usage_normalized_json"]),
-        cost_json=_from_json_text(row["cost_json"]),
         artifacts_root_path=str(row["artifacts_root_path"]),
+        **json_fields,
+    )
+
+
+def _upsert_run_summary(conn: sqlite3.Connection, summary: RunSummaryRecord) -> None:
+    placeholders = ", ".join("?" for _ in _RUN_SUMMARY_COLUMNS)
+    assignments = ", ".join(
+        f"{column} = excluded.{column}" for column in _RUN_SUMMARY_COLUMNS[1:]
+    )
+    conn.execute(
+        f"""
+        INSERT INTO run_summaries ({", ".join(_RUN_SUMMARY_COLUMNS)})
+        VALUES ({placeholders})
+        ON CONFLICT(run_id) DO UPDATE SET {assignments}
+        """,
+        _run_summary_params(summary),
     )
 
 
+def _run_summary_params(summary: RunSummaryRecord) -> tuple[object, ...]:
+    return (
+        summary.run_id,
+        summary.total_cost_usd,
+        summary.input_tokens,
+        summary.output_tokens,
+        summary.total_tokens,
+        summary.t_ocr_total_ms,
+        summary.t_llm_total_ms,
+        summary.t_total_ms,
+        summary.checklist_items,
+        summary.checklist_confirmed,
+        summary.checklist_ambiguous,
+        summary.checklist_conflict,
+        summary.checklist_missing,
+        summary.critical_gaps_count,
+        summary.next_questions_count,
+        (
+            None
+            if summary.comparison_json is None
+            else _to_json_text(summary.comparison_json)
+        ),
+        summary.updated_at,
+    )
+
+
+def _row_to_run_summary_record(row: object) -> RunSummaryRecord:
+    return RunSummaryRecord(
+        run_id=str(row["run_id"]),
+        updated_at=str(row["updated_at"]),
+        total_cost_usd=_to_optional_float(row["total_cost_usd"]),
+        input_tokens=_to_optional_int(row["input_tokens"]),
+        output_tokens=_to_optional_int(row["output_tokens"]),
+        total_tokens=_to_optional_int(row["total_tokens"]),
+        t_ocr_total_ms=_to_optional_float(row["t_ocr_total_ms"]),
+        t_llm_total_ms=_to_optional_float(row["t_llm_total_ms"]),
+        t_total_ms=_to_optional_float(row["t_total_ms"]),
+        checklist_items=int(row["checklist_items"]),
+        checklist_confirmed=int(row["checklist_confirmed"]),
+        checklist_ambiguous=int(row["checklist_ambiguous"]),
+        checklist_conflict=int(row["checklist_conflict"]),
+        checklist_missing=int(row["checklist_missing"]),
+        critical_gaps_count=int(row["critical_gaps_count"]),
+        next_questions_count=int(row["next_questions_count"]),
+        comparison_json=_from_json_text(row["comparison_json"]),
+    )
+
+
+def _to_optional_float(value: object) -> float | None:
+    if value is None:
+        return None
+    return float(value)
+
+
 def _normalize_date_from(value: str | None) -> str | None:
     if value is None:
         return None
@@ -6,7 +6,12 @@ import hmac
 import json
 import mimetypes
 import shutil
+import sqlite3
 import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import asdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -14,9 +19,14 @@ from pathlib import Path, PurePosixPath
 from typing import Any
 from zipfile import BadZipFile, ZipFile, ZipInfo
 
-from app.storage.artifacts import ArtifactsManager
+from app.storage.artifact_reader import safe_list_ocr_pages
+from app.storage.artifacts import OCR_PACK_FILENAME, ArtifactsManager
 from app.storage.db import connection
-from app.storage.models import RestoreRunResult
+from app.storage.models import (
+    BulkRestoreArchiveResult,
+    BulkRestoreResult,
+    RestoreRunResult,
+)
 from app.storage.repo import StorageRepo
 
 _REQUIRED_MANIFEST_FILE = "run.json"
@@ -29,6 +39,9 @@ _ZIP_BOMB_DEFAULT_MAX_ENTRIES = 1_000
 _ZIP_BOMB_DEFAULT_MAX_TOTAL_UNCOMPRESSED_BYTES = 512 * 1024 * 1024
 _ZIP_BOMB_DEFAULT_MAX_SINGLE_FILE_BYTES = 128 * 1024 * 1024
 _ZIP_BOMB_DEFAULT_MAX_COMPRESSION_RATIO = 200.0
+_DEFAULT_RESTORE_WORKERS = 4
+_DEFAULT_RESTORE_METADATA_BATCH_SIZE = 50
+_RESTORE_CHUNK_BYTES = 1024 * 1024
 
 
 @dataclass(frozen=True, slots=True)
@@ -53,6 +66,48 @@ class BundleVerification:
     signed: bool
     signature_verification_status: str
     warnings: list[str]
+    expected_files: dict[str, tuple[int, str]]
+
+
+@dataclass(frozen=True, slots=True)
+class _StagedRestore:
+    """A bundle whose files are in place and whose metadata is still pending."""
+
+    run_id: str
+    session_id: str
+    target_root: Path
+    data_root: Path
+    manifest: dict[str, Any]
+    warnings: list[str]
+    manifest_verification_status: str
+    files_checked: int
+    signature_verification_status: str
+    archive_signed: bool
+    signature_required: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _RunMetadataRows:
+    run_id: str
+    session_row: tuple[str, str]
+    run_row: tuple[Any, ...]
+    document_rows: list[tuple[Any, ...]]
+    llm_output_row: tuple[Any, ...] | None
+
+
+class _RunReservations:
+    """Claims run_ids so two archives of one bulk restore never share a tree."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._run_ids: set[str] = set()
+
+    def reserve(self, run_id: str) -> bool:
+        with self._lock:
+            if run_id in self._run_ids:
+                return False
+            self._run_ids.add(run_id)
+            return True
 
 
 class RestoreArchiveError(RuntimeError):
@@ -73,7 +128,150 @@ def restore_run_bundle(
     signing_key: str | None = None,
     require_signature: bool = False,
     verify_only: bool = False,
+    workers: int = _DEFAULT_RESTORE_WORKERS,
 ) -> RestoreRunResult:
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    staged = _stage_run_bundle(
+        repo=repo,
+        zip_path=zip_path,
+        data_dir=data_dir,
+        overwrite_existing=overwrite_existing,
+        safety_limits=safety_limits,
+        signing_key=signing_key,
+        require_signature=require_signature,
+        verify_only=verify_only,
+        workers=workers,
+    )
+    if isinstance(staged, RestoreRunResult):
+        return staged
+
+    metadata_warnings, metadata_errors = _restore_metadata(
+        repo=repo,
+        manifest=staged.manifest,
+        target_root=staged.target_root,
+        session_id=staged.session_id,
+        run_id=staged.run_id,
+    )
+    return _finish_restore(
+        staged=staged,
+        metadata_warnings=metadata_warnings,
+        metadata_errors=metadata_errors,
+        rollback_on_metadata_failure=rollback_on_metadata_failure,
+    )
+
+
+def restore_run_bundles(
+    *,
+    repo: StorageRepo,
+    zip_paths: Iterable[Path | str],
+    data_dir: Path | str | None = None,
+    overwrite_existing: bool = False,
+    rollback_on_metadata_failure: bool = True,
+    safety_limits: RestoreSafetyLimits | None = None,
+    signing_key: str | None = None,
+    require_signature: bool = False,
+    verify_only: bool = False,
+    workers: int = _DEFAULT_RESTORE_WORKERS,
+    metadata_batch_size: int = _DEFAULT_RESTORE_METADATA_BATCH_SIZE,
+) -> BulkRestoreResult:
+    """Restore many bundles, extracting archives concurrently.
+
+    Metadata for up to ``metadata_batch_size`` extracted runs is committed in
+    one transaction while later archives are still being extracted. Every
+    archive keeps its own result, and a metadata failure only rolls back the
+    run tree of the archive that caused it.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if metadata_batch_size < 1:
+        raise ValueError("metadata_batch_size must be >= 1")
+
+    archive_paths = [Path(zip_path) for zip_path in zip_paths]
+    reservations = _RunReservations()
+    results: list[RestoreRunResult | None] = [None] * len(archive_paths)
+    pending: list[tuple[int, _StagedRestore]] = []
+
+    def stage(archive_path: Path) -> _StagedRestore | RestoreRunResult:
+        return _stage_run_bundle(
+            repo=repo,
+            zip_path=archive_path,
+            data_dir=data_dir,
+            overwrite_existing=overwrite_existing,
+            safety_limits=safety_limits,
+            signing_key=signing_key,
+            require_signature=require_signature,
+            verify_only=verify_only,
+            workers=1,
+            reservations=reservations,
+        )
+
+    def flush_pending() -> None:
+        outcomes = _restore_metadata_batch(
+            repo=repo,
+            staged_restores=[staged for _, staged in pending],
+        )
+        for (index, staged), (metadata_warnings, metadata_errors) in zip(
+            pending, outcomes, strict=True
+        ):
+            results[index] = _finish_restore(
+                staged=staged,
+                metadata_warnings=metadata_warnings,
+                metadata_errors=metadata_errors,
+                rollback_on_metadata_failure=rollback_on_metadata_failure,
+            )
+        pending.clear()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for index, staged in enumerate(executor.map(stage, archive_paths)):
+            if isinstance(staged, RestoreRunResult):
+                results[index] = staged
+                continue
+            pending.append((index, staged))
+            if len(pending) >= metadata_batch_size:
+                flush_pending()
+    if pending:
+        flush_pending()
+
+    archives = [
+        BulkRestoreArchiveResult(zip_path=str(archive_path), result=result)
+        for archive_path, result in zip(archive_paths, results, strict=True)
+        if result is not None
+    ]
+    return BulkRestoreResult(
+        archives_total=len(archives),
+        restored_archives=sum(
+            1 for archive in archives if archive.result.status == "restored"
+        ),
+        verified_archives=sum(
+            1 for archive in archives if archive.result.status == "verified"
+        ),
+        failed_archives=sum(
+            1 for archive in archives if archive.result.status == "failed"
+        ),
+        archives=archives,
+    )
+
+
+def _stage_run_bundle(
+    *,
+    repo: StorageRepo,
+    zip_path: Path | str,
+    data_dir: Path | str | None,
+    overwrite_existing: bool,
+    safety_limits: RestoreSafetyLimits | None,
+    signing_key: str | None,
+    require_signature: bool,
+    verify_only: bool,
+    workers: int,
+    reservations: _RunReservations | None = None,
+) -> _StagedRestore | RestoreRunResult:
+    """Verify and extract one bundle into its run directory.
+
+    Returns the staged restore, ready for metadata, or a final result when the
+    archive is rejected or ``verify_only`` is set.
+    """
     archive_path = Path(zip_path)
     data_root = (
         Path(data_dir).resolve()
@@ -108,6 +306,7 @@ def restore_run_bundle(
             inspection = _validate_archive_entries(archive, limits=limits)
             file_entries = inspection.file_entries
 
+            bundle_verification: BundleVerification | None = None
             if inspection.has_bundle_manifest:
                 manifest_verification_status = "verifying"
                 signature_verification_status = "verifying"
@@ -117,14 +316,8 @@ def restore_run_bundle(
                     signing_key=normalized_signing_key,
                     require_signature=require_signature,
                 )
-                files_checked = bundle_verification.files_checked
                 bundle_manifest_run_id = bundle_verification.run_id
                 bundle_manifest_session_id = bundle_verification.session_id
-                manifest_verification_status = "verified"
-                archive_signed = bundle_verification.signed
-                signature_verification_status = (
-                    bundle_verification.signature_verification_status
-                )
                 warnings.extend(bundle_verification.warnings)
             else:
                 manifest_verification_status = "legacy_missing_manifest"
@@ -148,9 +341,15 @@ def restore_run_bundle(
                         verify_only=verify_only,
                     )
 
+            expected_files = (
+                None
+                if bundle_verification is None
+                else bundle_verification.expected_files
+            )
             manifest = _load_run_manifest_from_archive(
                 archive=archive,
                 file_entries=file_entries,
+                expected_files=expected_files,
             )
 
             run_id = str(manifest.get("run_id") or "").strip()
@@ -166,41 +365,69 @@ def restore_run_bundle(
                 bundle_run_id=bundle_manifest_run_id,
                 bundle_session_id=bundle_manifest_session_id,
             )
+            if reservations is not None and not reservations.reserve(run_id):
+                raise RestoreArchiveError(
+                    code="RESTORE_RUN_EXISTS",
+                    message=(
+                        f"Run {run_id} is contained in more than one archive of "
+                        "this restore."
+                    ),
+                )
 
             target_root = _build_target_root(
                 data_root=data_root,
                 session_id=session_id,
                 run_id=run_id,
             )
-            if verify_only:
-                return RestoreRunResult(
-                    status="verified",
-                    run_id=run_id,
-                    session_id=session_id,
-                    artifacts_root_path=str(target_root),
-                    restored_paths=[],
-                    warnings=warnings,
-                    errors=[],
-                    error_code=None,
-                    error_message=None,
-                    manifest_verification_status=manifest_verification_status,
-                    files_checked=files_checked,
-                    signature_verification_status=signature_verification_status,
-                    archive_signed=archive_signed,
-                    signature_required=require_signature,
-                    verify_only=True,
-                    rollback_attempted=False,
-                    rollback_succeeded=None,
-                )
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                extract_root = Path(temp_dir) / "run_bundle"
-                extract_root.mkdir(parents=True, exist_ok=True)
+            # Members are hashed while they are streamed to the staging
+            # directory, so each byte is decompressed once; verify-only runs
+            # the same pass without writing anything.
+            extract_context = (
+                nullcontext(None) if verify_only else tempfile.TemporaryDirectory()
+            )
+            with extract_context as temp_dir:
+                extract_root: Path | None = None
+                if temp_dir is not None:
+                    extract_root = Path(temp_dir) / "run_bundle"
+                    extract_root.mkdir(parents=True, exist_ok=True)
                 _extract_archive_entries(
                     archive=archive,
+                    archive_path=archive_path,
                     file_entries=file_entries,
                     extract_root=extract_root,
+                    expected_files=expected_files,
+                    workers=workers,
                 )
+                if bundle_verification is not None:
+                    files_checked = bundle_verification.files_checked
+                    manifest_verification_status = "verified"
+                    archive_signed = bundle_verification.signed
+                    signature_verification_status = (
+                        bundle_verification.signature_verification_status
+                    )
+
+                if verify_only or extract_root is None:
+                    return RestoreRunResult(
+                        status="verified",
+                        run_id=run_id,
+                        session_id=session_id,
+                        artifacts_root_path=str(target_root),
+                        restored_paths=[],
+                        warnings=warnings,
+                        errors=[],
+                        error_code=None,
+                        error_message=None,
+                        manifest_verification_status=manifest_verification_status,
+                        files_checked=files_checked,
+                        signature_verification_status=signature_verification_status,
+                        archive_signed=archive_signed,
+                        signature_required=require_signature,
+                        verify_only=True,
+                        rollback_attempted=False,
+                        rollback_succeeded=None,
+                    )
+
                 if target_root.exists():
                     if not overwrite_existing:
                         return _restore_error(
@@ -239,68 +466,18 @@ def restore_run_bundle(
 
                 _move_extracted_tree(extract_root=extract_root, target_root=target_root)
 
-                metadata_warnings, metadata_errors = _restore_metadata(
-                    repo=repo,
-                    manifest=manifest,
-                    target_root=target_root,
-                    session_id=session_id,
-                    run_id=run_id,
-                )
-                warnings.extend(metadata_warnings)
-                restored_paths = _restored_paths(target_root)
-
-                if metadata_errors:
-                    rollback_attempted = False
-                    rollback_succeeded: bool | None = None
-                    if rollback_on_metadata_failure:
-                        rollback_attempted = True
-                        rollback_succeeded = _rollback_restored_tree(
-                            target_root=target_root,
-                            data_root=data_root,
-                        )
-                        if not rollback_succeeded:
-                            warnings.append(
-                                "Rollback failed after metadata restore failure; "
-                                "restored files may remain on disk."
-                            )
-                    return RestoreRunResult(
-                        status="failed",
-                        run_id=run_id,
-                        session_id=session_id,
-                        artifacts_root_path=str(target_root),
-                        restored_paths=restored_paths,
-                        warnings=warnings,
-                        errors=metadata_errors,
-                        error_code="RESTORE_DB_ERROR",
-                        error_message="Metadata restore failed for one or more entities.",
-                        manifest_verification_status=manifest_verification_status,
-                        files_checked=files_checked,
-                        signature_verification_status=signature_verification_status,
-                        archive_signed=archive_signed,
-                        signature_required=require_signature,
-                        verify_only=False,
-                        rollback_attempted=rollback_attempted,
-                        rollback_succeeded=rollback_succeeded,
-                    )
-
-                return RestoreRunResult(
-                    status="restored",
+                return _StagedRestore(
                     run_id=run_id,
                     session_id=session_id,
-                    artifacts_root_path=str(target_root),
-                    restored_paths=restored_paths,
+                    target_root=target_root,
+                    data_root=data_root,
+                    manifest=manifest,
                     warnings=warnings,
-                    errors=[],
-                    error_code=None,
-                    error_message=None,
                     manifest_verification_status=manifest_verification_status,
                     files_checked=files_checked,
                     signature_verification_status=signature_verification_status,
                     archive_signed=archive_signed,
                     signature_required=require_signature,
-                    verify_only=False,
-                    rollback_attempted=False,
-                    rollback_succeeded=None,
                 )
 
     except RestoreArchiveError as error:
@@ -353,6 +530,71 @@ def restore_run_bundle(
         )
 
 
+def _finish_restore(
+    *,
+    staged: _StagedRestore,
+    metadata_warnings: list[str],
+    metadata_errors: list[str],
+    rollback_on_metadata_failure: bool,
+) -> RestoreRunResult:
+    warnings = [*staged.warnings, *metadata_warnings]
+    restored_paths = _restored_paths(staged.target_root)
+
+    if metadata_errors:
+        rollback_attempted = False
+        rollback_succeeded: bool | None = None
+        if rollback_on_metadata_failure:
+            rollback_attempted = True
+            rollback_succeeded = _rollback_restored_tree(
+                target_root=staged.target_root,
+                data_root=staged.data_root,
+            )
+            if not rollback_succeeded:
+                warnings.append(
+                    "Rollback failed after metadata restore failure; "
+                    "restored files may remain on disk."
+                )
+        return RestoreRunResult(
+            status="failed",
+            run_id=staged.run_id,
+            session_id=staged.session_id,
+            artifacts_root_path=str(staged.target_root),
+            restored_paths=restored_paths,
+            warnings=warnings,
+            errors=metadata_errors,
+            error_code="RESTORE_DB_ERROR",
+            error_message="Metadata restore failed for one or more entities.",
+            manifest_verification_status=staged.manifest_verification_status,
+            files_checked=staged.files_checked,
+            signature_verification_status=staged.signature_verification_status,
+            archive_signed=staged.archive_signed,
+            signature_required=staged.signature_required,
+            verify_only=False,
+            rollback_attempted=rollback_attempted,
+            rollback_succeeded=rollback_succeeded,
+        )
+
+    return RestoreRunResult(
+        status="restored",
+        run_id=staged.run_id,
+        session_id=staged.session_id,
+        artifacts_root_path=str(staged.target_root),
+        restored_paths=restored_paths,
+        warnings=warnings,
+        errors=[],
+        error_code=None,
+        error_message=None,
+        manifest_verification_status=staged.manifest_verification_status,
+        files_checked=staged.files_checked,
+        signature_verification_status=staged.signature_verification_status,
+        archive_signed=staged.archive_signed,
+        signature_required=staged.signature_required,
+        verify_only=False,
+        rollback_attempted=False,
+        rollback_succeeded=None,
+    )
+
+
 def _validate_archive_entries(
     archive: ZipFile,
     *,
@@ -496,28 +738,164 @@ def _is_symlink_entry(info: ZipInfo) -> bool:
 def _extract_archive_entries(
     *,
     archive: ZipFile,
+    archive_path: Path,
     file_entries: list[ZipInfo],
-    extract_root: Path,
+    extract_root: Path | None,
+    expected_files: dict[str, tuple[int, str]] | None,
+    workers: int,
 ) -> None:
-    resolved_root = extract_root.resolve()
+    """Stream members into ``extract_root``, checking manifest size and sha256.
+
+    With ``extract_root=None`` members are only hashed. Work is spread over up
+    to ``workers`` threads, each reading through its own ``ZipFile`` handle;
+    inflating, hashing and writing all release the GIL.
+    """
+    if extract_root is None and expected_files is None:
+        return
 
+    planned: list[tuple[ZipInfo, str, Path | None]] = []
+    resolved_root = None if extract_root is None else extract_root.resolve()
     for info in file_entries:
-        relative = _validate_archive_path(info)
-        if relative.as_posix() == _BUNDLE_MANIFEST_FILE:
+        relative_path = _validate_archive_path(info).as_posix()
+        if relative_path == _BUNDLE_MANIFEST_FILE:
             continue
-        target_path = extract_root / relative.as_posix()
-        resolved_target = target_path.resolve()
-        try:
-            resolved_target.relative_to(resolved_root)
-        except ValueError as error:
-            raise RestoreArchiveError(
-                code="RESTORE_INVALID_ARCHIVE",
-                message=f"Path traversal detected in archive entry: {info.filename}",
-            ) from error
+        target_path: Path | None = None
+        if extract_root is not None and resolved_root is not None:
+            target_path = extract_root / relative_path
+            try:
+                target_path.resolve().relative_to(resolved_root)
+            except ValueError as error:
+                raise RestoreArchiveError(
+                    code="RESTORE_INVALID_ARCHIVE",
+                    message=(
+                        f"Path traversal detected in archive entry: {info.filename}"
+                    ),
+                ) from error
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+        planned.append((info, relative_path, target_path))
+
+    groups = _balance_archive_entries(planned, workers=workers)
+    if len(groups) <= 1:
+        for info, relative_path, target_path in planned:
+            _extract_archive_entry(
+                archive=archive,
+                info=info,
+                relative_path=relative_path,
+                target_path=target_path,
+                expected=_expected_entry(expected_files, relative_path),
+            )
+        return
+
+    stop_event = threading.Event()
+
+    def extract_group(group: list[tuple[ZipInfo, str, Path | None]]) -> None:
+        with ZipFile(archive_path, "r") as worker_archive:
+            for info, relative_path, target_path in group:
+                if stop_event.is_set():
+                    return
+                try:
+                    _extract_archive_entry(
+                        archive=worker_archive,
+                        info=info,
+                        relative_path=relative_path,
+                        target_path=target_path,
+                        expected=_expected_entry(expected_files, relative_path),
+                    )
+                except BaseException:
+                    stop_event.set()
+                    raise
 
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        with archive.open(info, "r") as source, target_path.open("wb") as destination:
-            shutil.copyfileobj(source, destination)
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        futures = [executor.submit(extract_group, group) for group in groups]
+        for future in futures:
+            future.result()
+
+
+def _balance_archive_entries(
+    planned: list[tuple[ZipInfo, str, Path | None]],
+    *,
+    workers: int,
+) -> list[list[tuple[ZipInfo, str, Path | None]]]:
+    group_count = min(workers, len(planned))
+    if group_count <= 1:
+        return [planned] if planned else []
+
+    groups: list[list[tuple[ZipInfo, str, Path | None]]] = [
+        [] for _ in range(group_count)
+    ]
+    loads = [0] * group_count
+    for item in sorted(planned, key=lambda entry: entry[0].file_size, reverse=True):
+        lightest = loads.index(min(loads))
+        groups[lightest].append(item)
+        loads[lightest] += item[0].file_size
+    return groups
+
+
+def _expected_entry(
+    expected_files: dict[str, tuple[int, str]] | None,
+    relative_path: str,
+) -> tuple[int, str] | None:
+    if expected_files is None:
+        return None
+    return expected_files[relative_path]
+
+
+def _extract_archive_entry(
+    *,
+    archive: ZipFile,
+    info: ZipInfo,
+    relative_path: str,
+    target_path: Path | None,
+    expected: tuple[int, str] | None,
+) -> None:
+    hasher = hashlib.sha256() if expected is not None else None
+    size_bytes = 0
+    destination_context = (
+        nullcontext(None) if target_path is None else target_path.open("wb")
+    )
+    with archive.open(info, "r") as source, destination_context as destination:
+        while chunk := source.read(_RESTORE_CHUNK_BYTES):
+            size_bytes += len(chunk)
+            if expected is not None and size_bytes > expected[0]:
+                break
+            if hasher is not None:
+                hasher.update(chunk)
+            if destination is not None:
+                destination.write(chunk)
+
+    if expected is None or hasher is None:
+        return
+    _check_entry_integrity(
+        relative_path=relative_path,
+        size_bytes=size_bytes,
+        sha256_hex=hasher.hexdigest(),
+        expected=expected,
+    )
+
+
+def _check_entry_integrity(
+    *,
+    relative_path: str,
+    size_bytes: int,
+    sha256_hex: str,
+    expected: tuple[int, str],
+) -> None:
+    expected_size, expected_sha = expected
+    if size_bytes != expected_size:
+        raise RestoreArchiveError(
+            code="RESTORE_INVALID_ARCHIVE",
+            message=(
+                f"Integrity mismatch for '{relative_path}': "
+                f"size {size_bytes} != {expected_size}."
+            ),
+        )
+    if sha256_hex != expected_sha:
+        raise RestoreArchiveError(
+            code="RESTORE_INVALID_ARCHIVE",
+            message=(
+                f"Integrity mismatch for '{relative_path}': sha256 does not match."
+            ),
+        )
 
 
 def _verify_bundle_manifest(
@@ -637,29 +1015,6 @@ def _verify_bundle_manifest(
             ),
         )
 
-    for relative_path in sorted(expected_map):
-        expected_size, expected_sha = expected_map[relative_path]
-        entry = actual_map[relative_path]
-        payload = archive.read(entry)
-
-        if len(payload) != expected_size:
-            raise RestoreArchiveError(
-                code="RESTORE_INVALID_ARCHIVE",
-                message=(
-                    f"Integrity mismatch for '{relative_path}': "
-                    f"size {len(payload)} != {expected_size}."
-                ),
-            )
-
-        actual_sha = hashlib.sha256(payload).hexdigest()
-        if actual_sha != expected_sha:
-            raise RestoreArchiveError(
-                code="RESTORE_INVALID_ARCHIVE",
-                message=(
-                    f"Integrity mismatch for '{relative_path}': sha256 does not match."
-                ),
-            )
-
     signature_warnings: list[str] = []
     signed, signature_status = _verify_bundle_manifest_signature(
         manifest_payload=manifest_payload,
@@ -675,6 +1030,7 @@ def _verify_bundle_manifest(
         signed=signed,
         signature_verification_status=signature_status,
         warnings=signature_warnings,
+        expected_files=expected_map,
     )
 
 
@@ -813,6 +1169,7 @@ def _load_run_manifest_from_archive(
     *,
     archive: ZipFile,
     file_entries: list[ZipInfo],
+    expected_files: dict[str, tuple[int, str]] | None = None,
 ) -> dict[str, Any]:
     manifest_entry: ZipInfo | None = None
     for info in file_entries:
@@ -827,13 +1184,30 @@ def _load_run_manifest_from_archive(
         )
 
     try:
-        payload_text = archive.read(manifest_entry).decode("utf-8")
-    except (OSError, UnicodeDecodeError) as error:
+        payload = archive.read(manifest_entry)
+    except OSError as error:
         raise RestoreArchiveError(
             code="RESTORE_INVALID_ARCHIVE",
             message=f"Failed to read run.json: {error}",
         ) from error
 
+    # run.json is parsed before the streaming pass verifies the other members,
+    # so check it against the bundle manifest here.
+    if expected_files is not None:
+        _check_entry_integrity(
+            relative_path=_REQUIRED_MANIFEST_FILE,
+            size_bytes=len(payload),
+            sha256_hex=hashlib.sha256(payload).hexdigest(),
+            expected=expected_files[_REQUIRED_MANIFEST_FILE],
+        )
+
+    try:
+        payload_text = payload.decode("utf-8")
+    except UnicodeDecodeError as error:
+        raise RestoreArchiveError(
+            code="RESTORE_INVALID_ARCHIVE",
+            message=f"Failed to read run.json: {error}",
+        ) from error
     return _load_manifest_payload(payload_text)
 
 
@@ -899,6 +1273,84 @@ def _restore_metadata(
     warnings: list[str] = []
     errors: list[str] = []
 
+    try:
+        rows = _build_metadata_rows(
+            manifest=manifest,
+            target_root=target_root,
+            session_id=session_id,
+            run_id=run_id,
+            warnings=warnings,
+        )
+        with connection(repo.db_path) as conn:
+            _write_metadata_rows(conn, rows)
+    except Exception as error:  # noqa: BLE001
+        errors.append(f"{error.__class__.__name__}: {error}")
+
+    return warnings, errors
+
+
+def _restore_metadata_batch(
+    *,
+    repo: StorageRepo,
+    staged_restores: list[_StagedRestore],
+) -> list[tuple[list[str], list[str]]]:
+    """Write metadata for several staged restores in one transaction.
+
+    When the shared transaction fails, each run is retried in its own
+    transaction so the failure is attributed to (and rolled back for) only
+    the offending archive.
+    """
+    outcomes: list[tuple[list[str], list[str]]] = []
+    prepared: list[tuple[int, _RunMetadataRows]] = []
+    for index, staged in enumerate(staged_restores):
+        warnings: list[str] = []
+        errors: list[str] = []
+        outcomes.append((warnings, errors))
+        try:
+            rows = _build_metadata_rows(
+                manifest=staged.manifest,
+                target_root=staged.target_root,
+                session_id=staged.session_id,
+                run_id=staged.run_id,
+                warnings=warnings,
+            )
+        except Exception as error:  # noqa: BLE001
+            errors.append(f"{error.__class__.__name__}: {error}")
+            continue
+        prepared.append((index, rows))
+
+    if not prepared:
+        return outcomes
+
+    try:
+        with connection(repo.db_path) as conn:
+            for _, rows in prepared:
+                _write_metadata_rows(conn, rows)
+        return outcomes
+    except sqlite3.Error as error:
+        batch_error = f"{error.__class__.__name__}: {error}"
+
+    for index, rows in prepared:
+        outcomes[index][0].append(
+            "Batched metadata write failed; retried in a separate transaction: "
+            f"{batch_error}"
+        )
+        try:
+            with connection(repo.db_path) as conn:
+                _write_metadata_rows(conn, rows)
+        except Exception as error:  # noqa: BLE001
+            outcomes[index][1].append(f"{error.__class__.__name__}: {error}")
+    return outcomes
+
+
+def _build_metadata_rows(
+    *,
+    manifest: dict[str, Any],
+    target_root: Path,
+    session_id: str,
+    run_id: str,
+    warnings: list[str],
+) -> _RunMetadataRows:
     inputs = manifest.get("inputs") if isinstance(manifest.get("inputs"), dict) else {}
     metrics = (
         manifest.get("metrics") if isinstance(manifest.get("metrics"), dict) else {}
@@ -927,150 +1379,164 @@ def _restore_metadata(
 
     created_at = str(manifest.get("created_at") or _utc_now())
 
-    try:
-        with connection(repo.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO sessions (session_id, created_at)
-                VALUES (?, ?)
-                """,
-                (session_id, created_at),
-            )
-
-            conn.execute(
-                """
-                INSERT INTO runs (
-                    run_id,
-                    session_id,
-                    created_at,
-                    provider,
-                    model,
-                    openai_reasoning_effort,
-                    gemini_thinking_level,
-                    prompt_name,
-                    prompt_version,
-                    schema_version,
-                    status,
-                    error_code,
-                    error_message,
-                    timings_json,
-                    usage_json,
-                    usage_normalized_json,
-                    cost_json,
-                    artifacts_root_path
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(run_id) DO UPDATE SET
-                    session_id = excluded.session_id,
-                    created_at = excluded.created_at,
-                    provider = excluded.provider,
-                    model = excluded.model,
-                    openai_reasoning_effort = excluded.openai_reasoning_effort,
-                    gemini_thinking_level = excluded.gemini_thinking_level,
-                    prompt_name = excluded.prompt_name,
-                    prompt_version = excluded.prompt_version,
-                    schema_version = excluded.schema_version,
-                    status = excluded.status,
-                    error_code = excluded.error_code,
-                    error_message = excluded.error_message,
-                    timings_json = excluded.timings_json,
-                    usage_json = excluded.usage_json,
-                    usage_normalized_json = excluded.usage_normalized_json,
-                    cost_json = excluded.cost_json,
-                    artifacts_root_path = excluded.artifacts_root_path
-                """,
+    document_rows = [
+        (
+            run_id,
+            document_payload["doc_id"],
+            document_payload["original_filename"],
+            document_payload["original_mime"],
+            document_payload["original_path"],
+            document_payload["ocr_status"],
+            document_payload["ocr_model"],
+            document_payload["pages_count"],
+            document_payload["ocr_artifacts_path"],
+            document_payload["ocr_error"],
+        )
+        for document_payload in _collect_document_payloads(
+            target_root=target_root,
+            manifest=manifest,
+            ocr_model_hint=str(
                 (
-                    run_id,
-                    session_id,
-                    created_at,
-                    provider,
-                    model,
-                    openai_reasoning_effort,
-                    gemini_thinking_level,
-                    prompt_name,
-                    prompt_version,
-                    schema_version,
-                    status,
-                    _to_optional_str(manifest.get("error_code")),
-                    _to_optional_str(manifest.get("error_message")),
-                    _json_text(metrics.get("timings")),
-                    _json_text(metrics.get("usage")),
-                    _json_text(metrics.get("usage_normalized")),
-                    _json_text(metrics.get("cost")),
-                    str(target_root),
-                ),
-            )
-
-            conn.execute("DELETE FROM documents WHERE run_id = ?", (run_id,))
-            for document_payload in _collect_document_payloads(
-                target_root=target_root,
-                manifest=manifest,
-                ocr_model_hint=str(
-                    (
-                        (inputs.get("ocr_params") or {}).get("model")
-                        if isinstance(inputs.get("ocr_params"), dict)
-                        else ""
-                    )
-                    or "mistral-ocr-latest"
-                ),
-                warnings=warnings,
-            ):
-                conn.execute(
-                    """
-                    INSERT INTO documents (
-                        run_id,
-                        doc_id,
-                        original_filename,
-                        original_mime,
-                        original_path,
-                        ocr_status,
-                        ocr_model,
-                        pages_count,
-                        ocr_artifacts_path,
-                        ocr_error
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        run_id,
-                        document_payload["doc_id"],
-                        document_payload["original_filename"],
-                        document_payload["original_mime"],
-                        document_payload["original_path"],
-                        document_payload["ocr_status"],
-                        document_payload["ocr_model"],
-                        document_payload["pages_count"],
-                        document_payload["ocr_artifacts_path"],
-                        document_payload["ocr_error"],
-                    ),
+                    (inputs.get("ocr_params") or {}).get("model")
+                    if isinstance(inputs.get("ocr_params"), dict)
+                    else ""
                 )
+                or "mistral-ocr-latest"
+            ),
+            warnings=warnings,
+        )
+    ]
 
-            conn.execute("DELETE FROM llm_outputs WHERE run_id = ?", (run_id,))
-            llm_payload, llm_warning = _llm_output_payload(target_root=target_root)
-            if llm_warning is not None:
-                warnings.append(llm_warning)
-            if llm_payload is not None:
-                conn.execute(
-                    """
-                    INSERT INTO llm_outputs (
-                        run_id,
-                        response_json_path,
-                        response_valid,
-                        schema_validation_errors_path
-                    )
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        run_id,
-                        llm_payload["response_json_path"],
-                        1 if llm_payload["response_valid"] else 0,
-                        llm_payload["schema_validation_errors_path"],
-                    ),
-                )
-    except Exception as error:  # noqa: BLE001
-        errors.append(f"{error.__class__.__name__}: {error}")
+    llm_payload, llm_warning = _llm_output_payload(target_root=target_root)
+    if llm_warning is not None:
+        warnings.append(llm_warning)
+    llm_output_row = None
+    if llm_payload is not None:
+        llm_output_row = (
+            run_id,
+            llm_payload["response_json_path"],
+            1 if llm_payload["response_valid"] else 0,
+            llm_payload["schema_validation_errors_path"],
+        )
 
-    return warnings, errors
+    return _RunMetadataRows(
+        run_id=run_id,
+        session_row=(session_id, created_at),
+        run_row=(
+            run_id,
+            session_id,
+            created_at,
+            provider,
+            model,
+            openai_reasoning_effort,
+            gemini_thinking_level,
+            prompt_name,
+            prompt_version,
+            schema_version,
+            status,
+            _to_optional_str(manifest.get("error_code")),
+            _to_optional_str(manifest.get("error_message")),
+            _json_text(metrics.get("timings")),
+            _json_text(metrics.get("usage")),
+            _json_text(metrics.get("usage_normalized")),
+            _json_text(metrics.get("cost")),
+            str(target_root),
+        ),
+        document_rows=document_rows,
+        llm_output_row=llm_output_row,
+    )
+
+
+def _write_metadata_rows(conn: sqlite3.Connection, rows: _RunMetadataRows) -> None:
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO sessions (session_id, created_at)
+        VALUES (?, ?)
+        """,
+        rows.session_row,
+    )
+    conn.execute(
+        """
+        INSERT INTO runs (
+            run_id,
+            session_id,
+            created_at,
+            provider,
+            model,
+            openai_reasoning_effort,
+            gemini_thinking_level,
+            prompt_name,
+            prompt_version,
+            schema_version,
+            status,
+            error_code,
+            error_message,
+            timings_json,
+            usage_json,
+            usage_normalized_json,
+            cost_json,
+            artifacts_root_path
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(run_id) DO UPDATE SET
+            session_id = excluded.session_id,
+            created_at = excluded.created_at,
+            provider = excluded.provider,
+            model = excluded.model,
+            openai_reasoning_effort = excluded.openai_reasoning_effort,
+            gemini_thinking_level = excluded.gemini_thinking_level,
+            prompt_name = excluded.prompt_name,
+            prompt_version = excluded.prompt_version,
+            schema_version = excluded.schema_version,
+            status = excluded.status,
+            error_code = excluded.error_code,
+            error_message = excluded.error_message,
+            timings_json = excluded.timings_json,
+            usage_json = excluded.usage_json,
+            usage_normalized_json = excluded.usage_normalized_json,
+            cost_json = excluded.cost_json,
+            artifacts_root_path = excluded.artifacts_root_path
+        """,
+        rows.run_row,
+    )
+
+    # A summary left over from an earlier copy of the run is stale; history
+    # summarises the restored metrics columns instead.
+    conn.execute("DELETE FROM run_summaries WHERE run_id = ?", (rows.run_id,))
+    conn.execute("DELETE FROM documents WHERE run_id = ?", (rows.run_id,))
+    conn.executemany(
+        """
+        INSERT INTO documents (
+            run_id,
+            doc_id,
+            original_filename,
+            original_mime,
+            original_path,
+            ocr_status,
+            ocr_model,
+            pages_count,
+            ocr_artifacts_path,
+            ocr_error
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows.document_rows,
+    )
+
+    conn.execute("DELETE FROM llm_outputs WHERE run_id = ?", (rows.run_id,))
+    if rows.llm_output_row is not None:
+        conn.execute(
+            """
+            INSERT INTO llm_outputs (
+                run_id,
+                response_json_path,
+                response_valid,
+                schema_validation_errors_path
+            )
+            VALUES (?, ?, ?, ?)
+            """,
+            rows.llm_output_row,
+        )
 
 
 def _collect_document_payloads(
@@ -1159,10 +1625,14 @@ def _build_document_payload(
         warnings.append(f"Original file not found for doc_id={doc_id}")
 
     pages_count = _to_optional_int(manifest_document.get("pages_count"))
-    if pages_count is None and (ocr_dir / "pages").exists():
-        pages_count = len(
-            [path for path in (ocr_dir / "pages").iterdir() if path.suffix == ".md"]
-        )
+    if pages_count is None:
+        page_numbers, _ = safe_list_ocr_pages(ocr_dir)
+        if (
+            page_numbers
+            or (ocr_dir / "pages").exists()
+            or (ocr_dir / OCR_PACK_FILENAME).exists()
+        ):
+            pages_count = len(page_numbers)
 
     ocr_status = str(manifest_document.get("ocr_status") or "ok")
     if ocr_status not in _VALID_OCR_STATUSES:
@@ -1333,7 +1803,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Restore run artifacts and metadata from a backup ZIP bundle."
     )
-    parser.add_argument("--zip-path", required=True, help="Path to backup ZIP file.")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument("--zip-path", help="Path to backup ZIP file.")
+    source_group.add_argument(
+        "--zip-dir",
+        help="Directory whose *.zip bundles are restored in one bulk run.",
+    )
     parser.add_argument(
         "--db-path",
         default="data/kaucja.sqlite3",
@@ -1373,6 +1848,21 @@ def main() -> None:
             "(strict mode)."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_DEFAULT_RESTORE_WORKERS,
+        help=(
+            "Parallel workers that verify and extract archive members "
+            "(archives with --zip-dir)."
+        ),
+    )
+    parser.add_argument(
+        "--metadata-batch-size",
+        type=int,
+        default=_DEFAULT_RESTORE_METADATA_BATCH_SIZE,
+        help="Runs whose metadata is committed per transaction with --zip-dir.",
+    )
 
     args = parser.parse_args()
     settings = get_settings()
@@ -1389,6 +1879,27 @@ def main() -> None:
         db_path=Path(args.db_path),
         artifacts_manager=ArtifactsManager(Path(args.data_dir)),
     )
+    if args.zip_dir is not None:
+        bulk_result = restore_run_bundles(
+            repo=repo,
+            zip_paths=sorted(Path(args.zip_dir).glob("*.zip")),
+            data_dir=Path(args.data_dir),
+            overwrite_existing=bool(args.overwrite_existing),
+            rollback_on_metadata_failure=not bool(args.no_rollback_on_metadata_failure),
+            safety_limits=safety_limits,
+            signing_key=settings.bundle_signing_key,
+            require_signature=require_signature,
+            verify_only=bool(args.verify_only),
+            workers=args.workers,
+            metadata_batch_size=args.metadata_batch_size,
+        )
+        print(
+            json.dumps(
+                asdict(bulk_result), ensure_ascii=False, indent=2, sort_keys=True
+            )
+        )
+        return
+
     result = restore_run_bundle(
         repo=repo,
         zip_path=Path(args.zip_path),
@@ -1399,6 +1910,7 @@ def main() -> None:
         signing_key=settings.bundle_signing_key,
         require_signature=require_signature,
         verify_only=bool(args.verify_only),
+        workers=args.workers,
     )
     print(json.dumps(asdict(result), ensure_ascii=False, indent=2, sort_keys=True))
 
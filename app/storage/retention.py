@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
 
 from app.config.settings import get_settings
 from app.storage.artifacts import ArtifactsManager
-from app.storage.models import RetentionCleanupResult
+from app.storage.models import RetentionCleanupResult, RunRecord
 from app.storage.repo import StorageRepo
 from app.storage.zip_export import ZipExportError, export_run_bundle
 
+_EXPORT_ERRORS = (FileNotFoundError, NotADirectoryError, ZipExportError, OSError)
+
 
 def purge_runs_older_than_days(
     *,
@@ -24,21 +29,33 @@ def purge_runs_older_than_days(
     report_path: Path | str | None = None,
     report_dir: Path | str | None = None,
     signing_key: str | None = None,
+    export_workers: int = 1,
+    delete_workers: int = 1,
+    metadata_batch_size: int = 1,
+    compression_level: int | None = None,
+    store_only: bool = False,
 ) -> RetentionCleanupResult:
     if days < 0:
         raise ValueError("days must be >= 0")
+    if export_workers < 1:
+        raise ValueError("export_workers must be >= 1")
 
     reference_time = now or datetime.now(tz=timezone.utc)
     cutoff = reference_time - timedelta(days=days)
     cutoff_iso = cutoff.isoformat()
 
-    runs = repo.list_runs(date_to=cutoff_iso, limit=1_000_000)
-    candidates = sorted(runs, key=lambda run: (run.created_at, run.run_id))
+    # Retention only needs identity, timestamps and paths, so the scan skips
+    # the metrics JSON columns and pages through runs oldest first. Pages are
+    # keyset-chained, so deleting a window does not shift the runs after it.
+    candidates = repo.iter_runs(
+        date_to=cutoff_iso, oldest_first=True, include_json=False
+    )
 
     deleted_run_ids: list[str] = []
     audit_entries: list[dict[str, str | None]] = []
     errors: list[str] = []
 
+    scanned_runs = 0
     deleted_runs = 0
     failed_runs = 0
     skipped_runs = 0
@@ -52,92 +69,118 @@ def purge_runs_older_than_days(
         report_path=report_path,
         report_dir=report_dir,
     )
+    delete_action = (
+        "backup_then_delete" if export_before_delete else "delete_without_backup"
+    )
 
-    for run in candidates:
-        if dry_run:
-            audit_entries.append(
-                {
-                    "run_id": run.run_id,
-                    "created_at": run.created_at,
-                    "action": "dry_run_candidate",
-                    "status": "candidate",
-                    "error": None,
-                    "backup_zip_path": None,
-                }
-            )
-            continue
+    # Candidates are settled in windows just wide enough to keep every worker
+    # busy: the window is exported, then deleted, before the next one starts.
+    # With the defaults each run is backed up and deleted before the next, so
+    # backups never pile up ahead of the deletes they protect.
+    window_size = max(export_workers, delete_workers, metadata_batch_size)
+    with ExitStack() as stack:
+        export_executor = (
+            stack.enter_context(ProcessPoolExecutor(max_workers=export_workers))
+            if export_before_delete and export_workers > 1 and not dry_run
+            else None
+        )
+        while window := list(islice(candidates, window_size)):
+            scanned_runs += len(window)
+            if dry_run:
+                audit_entries.extend(
+                    {
+                        "run_id": run.run_id,
+                        "created_at": run.created_at,
+                        "action": "dry_run_candidate",
+                        "status": "candidate",
+                        "error": None,
+                        "backup_zip_path": None,
+                    }
+                    for run in window
+                )
+                continue
 
-        backup_zip_path: str | None = None
-        if export_before_delete:
-            try:
-                zip_path = export_run_bundle(
-                    artifacts_root_path=run.artifacts_root_path,
-                    output_dir=export_dir,
+            export_outcomes: list[tuple[str | None, str | None]] = (
+                _export_run_bundles(
+                    runs=window,
+                    export_dir=export_dir,
                     signing_key=signing_key,
+                    executor=export_executor,
+                    compression_level=compression_level,
+                    store_only=store_only,
                 )
-                backup_zip_path = str(zip_path)
-            except (
-                FileNotFoundError,
-                NotADirectoryError,
-                ZipExportError,
-                OSError,
-            ) as error:
-                details = f"{error.__class__.__name__}: {error}"
+                if export_before_delete
+                else [(None, None)] * len(window)
+            )
+
+            audit_by_run_id: dict[str, dict[str, str | None]] = {}
+            error_by_run_id: dict[str, str] = {}
+            backup_zip_paths: dict[str, str | None] = {}
+            runs_to_delete: list[RunRecord] = []
+            for run, (backup_zip_path, export_error) in zip(window, export_outcomes):
+                if export_error is None:
+                    backup_zip_paths[run.run_id] = backup_zip_path
+                    runs_to_delete.append(run)
+                    continue
                 failed_runs += 1
                 skipped_runs += 1
-                errors.append(
-                    f"run_id={run.run_id} code=BACKUP_EXPORT_FAILED details={details}"
+                error_by_run_id[run.run_id] = (
+                    f"run_id={run.run_id} code=BACKUP_EXPORT_FAILED "
+                    f"details={export_error}"
                 )
-                audit_entries.append(
-                    {
+                audit_by_run_id[run.run_id] = {
+                    "run_id": run.run_id,
+                    "created_at": run.created_at,
+                    "action": "skip_delete_backup_failed",
+                    "status": "failed",
+                    "error": export_error,
+                    "backup_zip_path": None,
+                }
+
+            delete_results = repo.delete_runs(
+                [run.run_id for run in runs_to_delete],
+                workers=delete_workers,
+                metadata_batch_size=metadata_batch_size,
+            )
+            for run, delete_result in zip(runs_to_delete, delete_results):
+                backup_zip_path = backup_zip_paths[run.run_id]
+                if delete_result.deleted:
+                    deleted_runs += 1
+                    deleted_run_ids.append(run.run_id)
+                    audit_by_run_id[run.run_id] = {
                         "run_id": run.run_id,
                         "created_at": run.created_at,
-                        "action": "skip_delete_backup_failed",
-                        "status": "failed",
-                        "error": details,
-                        "backup_zip_path": None,
+                        "action": delete_action,
+                        "status": "deleted",
+                        "error": None,
+                        "backup_zip_path": backup_zip_path,
                     }
-                )
-                continue
+                    continue
 
-        result = repo.delete_run(run.run_id)
-        if result.deleted:
-            deleted_runs += 1
-            deleted_run_ids.append(run.run_id)
-            audit_entries.append(
-                {
+                failed_runs += 1
+                error_code = delete_result.error_code or "UNKNOWN"
+                details = (
+                    delete_result.technical_details
+                    or delete_result.error_message
+                    or "Unknown error"
+                )
+                error_by_run_id[run.run_id] = (
+                    f"run_id={run.run_id} code={error_code} details={details}"
+                )
+                audit_by_run_id[run.run_id] = {
                     "run_id": run.run_id,
                     "created_at": run.created_at,
-                    "action": (
-                        "backup_then_delete"
-                        if export_before_delete
-                        else "delete_without_backup"
-                    ),
-                    "status": "deleted",
-                    "error": None,
+                    "action": delete_action,
+                    "status": "failed",
+                    "error": details,
                     "backup_zip_path": backup_zip_path,
                 }
-            )
-            continue
-
-        failed_runs += 1
-        error_code = result.error_code or "UNKNOWN"
-        details = result.technical_details or result.error_message or "Unknown error"
-        errors.append(f"run_id={run.run_id} code={error_code} details={details}")
-        audit_entries.append(
-            {
-                "run_id": run.run_id,
-                "created_at": run.created_at,
-                "action": (
-                    "backup_then_delete"
-                    if export_before_delete
-                    else "delete_without_backup"
-                ),
-                "status": "failed",
-                "error": details,
-                "backup_zip_path": backup_zip_path,
-            }
-        )
+
+            # The report keeps candidate order whichever phase settled a run.
+            for run in window:
+                audit_entries.append(audit_by_run_id[run.run_id])
+                if run.run_id in error_by_run_id:
+                    errors.append(error_by_run_id[run.run_id])
 
     result = RetentionCleanupResult(
         cutoff_created_at=cutoff_iso,
@@ -145,7 +188,7 @@ def purge_runs_older_than_days(
         export_before_delete=export_before_delete,
         export_dir=normalized_export_dir,
         report_path=str(resolved_report_path),
-        scanned_runs=len(candidates),
+        scanned_runs=scanned_runs,
         deleted_runs=deleted_runs,
         failed_runs=failed_runs,
         skipped_runs=skipped_runs,
@@ -158,6 +201,53 @@ def purge_runs_older_than_days(
     return result
 
 
+def _export_run_bundles(
+    *,
+    runs: list[RunRecord],
+    export_dir: Path | str | None,
+    signing_key: str | None,
+    executor: ProcessPoolExecutor | None,
+    compression_level: int | None,
+    store_only: bool,
+) -> list[tuple[str | None, str | None]]:
+    """Export one bundle per run, returning ``(zip_path, error)`` in run order."""
+    export_options: dict[str, object] = {}
+    if compression_level is not None:
+        export_options["compression_level"] = compression_level
+    if store_only:
+        export_options["store_only"] = True
+
+    def export_kwargs(run: RunRecord) -> dict[str, object]:
+        return {
+            "artifacts_root_path": run.artifacts_root_path,
+            "output_dir": export_dir,
+            "signing_key": signing_key,
+            **export_options,
+        }
+
+    outcomes: list[tuple[str | None, str | None]] = []
+    if executor is None or len(runs) == 1:
+        for run in runs:
+            try:
+                zip_path = export_run_bundle(**export_kwargs(run))
+            except _EXPORT_ERRORS as error:
+                outcomes.append((None, f"{error.__class__.__name__}: {error}"))
+            else:
+                outcomes.append((str(zip_path), None))
+        return outcomes
+
+    # DEFLATE is CPU-bound, so bundles are compressed in separate processes.
+    futures = [executor.submit(export_run_bundle, **export_kwargs(run)) for run in runs]
+    for future in futures:
+        try:
+            zip_path = future.result()
+        except _EXPORT_ERRORS as error:
+            outcomes.append((None, f"{error.__class__.__name__}: {error}"))
+        else:
+            outcomes.append((str(zip_path), None))
+    return outcomes
+
+
 def _build_repo(*, db_path: Path, data_dir: Path | None) -> StorageRepo:
     if data_dir is None:
         return StorageRepo(db_path=db_path)
@@ -233,6 +323,35 @@ def main() -> None:
         default=None,
         help="Directory for backup ZIP files when export-before-delete is enabled.",
     )
+    parser.add_argument(
+        "--export-workers",
+        type=int,
+        default=1,
+        help="Processes used to compress backup ZIP files in parallel.",
+    )
+    parser.add_argument(
+        "--delete-workers",
+        type=int,
+        default=1,
+        help="Threads used to delete run artifact trees in parallel.",
+    )
+    parser.add_argument(
+        "--metadata-batch-size",
+        type=int,
+        default=1,
+        help="Runs whose metadata is deleted per SQLite transaction.",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="DEFLATE level 0-9 for backup ZIP files (default: zlib default).",
+    )
+    parser.add_argument(
+        "--store-only",
+        action="store_true",
+        help="Write backup ZIP files without compression.",
+    )
     parser.add_argument(
         "--report-dir",
         default=None,
@@ -259,8 +378,15 @@ def main() -> None:
         report_dir=(Path(args.report_dir) if args.report_dir else None),
         report_path=(Path(args.report_path) if args.report_path else None),
         signing_key=settings.bundle_signing_key,
+        export_workers=args.export_workers,
+        delete_workers=args.delete_workers,
+        metadata_batch_size=args.metadata_batch_size,
+        compression_level=args.compression_level,
+        store_only=bool(args.store_only),
     )
     print(json.dumps(asdict(result), ensure_ascii=False, indent=2, sort_keys=True))
+    # The background reaper dies with the process; reclaim disk before exiting.
+    repo.reap_trash()
 
 
 if __name__ == "__main__":
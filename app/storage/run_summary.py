@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from app.storage.models import RunSummaryRecord
+
+_CHECKLIST_STATUSES = ("confirmed", "ambiguous", "conflict", "missing")
+
+
+def build_run_summary(
+    *,
+    run_id: str,
+    timings: dict[str, Any] | None,
+    usage_normalized: dict[str, Any] | None,
+    cost: dict[str, Any] | None,
+    parsed_json: dict[str, Any] | None = None,
+    updated_at: str | None = None,
+) -> RunSummaryRecord:
+    timings_payload = timings if isinstance(timings, dict) else {}
+    usage_payload = usage_normalized if isinstance(usage_normalized, dict) else {}
+    cost_payload = cost if isinstance(cost, dict) else {}
+
+    status_counts = dict.fromkeys(_CHECKLIST_STATUSES, 0)
+    checklist: list[dict[str, Any]] = []
+    critical_gaps: list[str] = []
+    next_questions: list[str] = []
+    comparison_json: dict[str, Any] | None = None
+    if isinstance(parsed_json, dict):
+        raw_checklist = parsed_json.get("checklist")
+        if isinstance(raw_checklist, list):
+            checklist = [item for item in raw_checklist if isinstance(item, dict)]
+        for item in checklist:
+            status = str(item.get("status") or "")
+            if status in status_counts:
+                status_counts[status] += 1
+        critical_gaps = _string_list(parsed_json.get("critical_gaps_summary"))
+        next_questions = _string_list(parsed_json.get("next_questions_to_user"))
+        comparison_json = {
+            "checklist": checklist,
+            "critical_gaps_summary": critical_gaps,
+            "next_questions_to_user": next_questions,
+        }
+
+    return RunSummaryRecord(
+        run_id=run_id,
+        updated_at=updated_at or datetime.now(tz=timezone.utc).isoformat(),
+        total_cost_usd=_to_float(cost_payload.get("total_cost_usd")),
+        input_tokens=_to_int(usage_payload.get("input_tokens")),
+        output_tokens=_to_int(usage_payload.get("output_tokens")),
+        total_tokens=_to_int(usage_payload.get("total_tokens")),
+        t_ocr_total_ms=_to_float(timings_payload.get("t_ocr_total_ms")),
+        t_llm_total_ms=_to_float(timings_payload.get("t_llm_total_ms")),
+        t_total_ms=_to_float(timings_payload.get("t_total_ms")),
+        checklist_items=len(checklist),
+        checklist_confirmed=status_counts["confirmed"],
+        checklist_ambiguous=status_counts["ambiguous"],
+        checklist_conflict=status_counts["conflict"],
+        checklist_missing=status_counts["missing"],
+        critical_gaps_count=len(critical_gaps),
+        next_questions_count=len(next_questions),
+        comparison_json=comparison_json,
+    )
+
+
+def _string_list(value: Any) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [str(item) for item in value]
+
+
+def _to_float(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _to_int(value: Any) -> int | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return int(value)
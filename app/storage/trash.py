@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import threading
+from pathlib import Path
+from uuid import uuid4
+
+# Pauses before re-reaping entries that failed to delete (e.g. a file still
+# held open); after the last one they wait for the next discard or restart.
+_REAP_RETRY_DELAYS = (1.0, 5.0, 30.0, 120.0)
+
+
+class RunTrash:
+    """Staging area for artifact trees whose metadata is being deleted.
+
+    ``discard`` detaches a tree with a single same-filesystem rename, so its
+    cost does not depend on how many files the tree holds. Disk space is
+    reclaimed later by ``reap``, either on a background thread or when a
+    caller invokes it directly. Every entry left in the trash directory is
+    garbage, so a reap interrupted by a crash simply resumes on the next pass.
+
+    All instances over one directory share a single reaper thread, so several
+    repositories in one process never reap the same trash concurrently.
+    """
+
+    def __init__(self, trash_dir: Path | str, *, background: bool = True) -> None:
+        self.trash_dir = Path(trash_dir)
+        self.background = background
+        self._reaper = _shared_reaper(self.trash_dir)
+        if background:
+            self._reaper.reclaim_leftovers()
+
+    def discard(self, path: Path, *, label: str) -> Path | None:
+        """Move ``path`` into the trash and return its new location.
+
+        When the trash is on another filesystem the rename fails with EXDEV;
+        the tree is then deleted in place and ``None`` is returned.
+        """
+        self.trash_dir.mkdir(parents=True, exist_ok=True)
+        target = self.trash_dir / f"{label}.{uuid4().hex}"
+        try:
+            os.replace(path, target)
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+            shutil.rmtree(path)
+            return None
+        if self.background:
+            self.schedule()
+        return target
+
+    def has_entries(self) -> bool:
+        return _has_entries(self.trash_dir)
+
+    def reap(self) -> int:
+        """Remove every trashed entry now; returns how many were removed.
+
+        Entries that fail to delete stay in place for the next pass.
+        """
+        removed, _ = self._reaper.reap()
+        return removed
+
+    def schedule(self) -> None:
+        """Ensure a background reap runs after the latest ``discard``."""
+        self._reaper.schedule()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the background reaper is idle; ``False`` on timeout."""
+        return self._reaper.wait(timeout)
+
+
+class _TrashReaper:
+    """Background reaper for one trash directory, shared across ``RunTrash``."""
+
+    def __init__(self, trash_dir: Path) -> None:
+        self.trash_dir = trash_dir
+        self._lock = threading.Lock()
+        self._reap_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pending = False
+        self._leftovers_checked = False
+
+    def reclaim_leftovers(self) -> None:
+        """Schedule a reap of entries left by an earlier process, once."""
+        with self._lock:
+            if self._leftovers_checked:
+                return
+            self._leftovers_checked = True
+        if _has_entries(self.trash_dir):
+            self.schedule()
+
+    def reap(self) -> tuple[int, int]:
+        """Return ``(removed, failed)`` entry counts for one pass."""
+        with self._reap_lock:
+            return _reap_entries(self.trash_dir)
+
+    def schedule(self) -> None:
+        with self._lock:
+            self._pending = True
+            self._wake.set()
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="kaucja-trash-reaper",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        with self._lock:
+            thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _run(self) -> None:
+        retries = 0
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                self._pending = False
+                self._wake.clear()
+            _, failed = self.reap()
+            if not failed or retries >= len(_REAP_RETRY_DELAYS):
+                retries = 0
+                continue
+            # A new discard cuts the pause short; either way, try again.
+            self._wake.wait(_REAP_RETRY_DELAYS[retries])
+            retries += 1
+            with self._lock:
+                self._pending = True
+
+
+_REAPERS: dict[Path, _TrashReaper] = {}
+_REAPERS_LOCK = threading.Lock()
+
+
+def _shared_reaper(trash_dir: Path) -> _TrashReaper:
+    key = trash_dir.resolve()
+    with _REAPERS_LOCK:
+        reaper = _REAPERS.get(key)
+        if reaper is None:
+            reaper = _REAPERS[key] = _TrashReaper(trash_dir)
+        return reaper
+
+
+def _has_entries(trash_dir: Path) -> bool:
+    try:
+        with os.scandir(trash_dir) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
+def _reap_entries(trash_dir: Path) -> tuple[int, int]:
+    try:
+        with os.scandir(trash_dir) as iterator:
+            entries = list(iterator)
+    except FileNotFoundError:
+        return 0, 0
+
+    removed = 0
+    failed = 0
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+        except FileNotFoundError:
+            # Another process's reaper got there first.
+            continue
+        except OSError:
+            failed += 1
+            continue
+        removed += 1
+    return removed, failed
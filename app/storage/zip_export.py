@@ -3,24 +3,42 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+from typing import IO, Any
+from uuid import uuid4
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 _BUNDLE_MANIFEST_FILE = "bundle_manifest.json"
 _MANIFEST_SIGNATURE_ALGORITHM = "hmac-sha256"
+_EXPORT_CHUNK_BYTES = 1024 * 1024
 
 
 class ZipExportError(RuntimeError):
     """Raised when run bundle export cannot be completed safely."""
 
 
+@dataclass(frozen=True, slots=True)
+class _ArchiveFile:
+    relative_path: str
+    source_path: Path
+    size_bytes: int
+    sha256: str
+
+
 def export_run_bundle(
     *,
     artifacts_root_path: Path | str,
     output_dir: Path | str | None = None,
     signing_key: str | None = None,
+    compression_level: int | None = None,
+    store_only: bool = False,
 ) -> Path:
+    if compression_level is not None and not 0 <= compression_level <= 9:
+        raise ValueError("compression_level must be between 0 and 9")
+
     root = Path(artifacts_root_path)
     if not root.exists():
         raise FileNotFoundError(f"Artifacts root not found: {root}")
@@ -45,35 +63,101 @@ def export_run_bundle(
         signing_key=signing_key,
     )
     manifest_bytes = _json_dumps_bytes(manifest_payload)
-    archive_entries = [
-        *archive_files,
+    archive_entries: list[tuple[str, _ArchiveFile | bytes]] = [
+        *((archive_file.relative_path, archive_file) for archive_file in archive_files),
         (_BUNDLE_MANIFEST_FILE, manifest_bytes),
     ]
 
-    with ZipFile(zip_path, mode="w") as archive:
-        for relative_path, data in sorted(archive_entries, key=lambda item: item[0]):
-            zip_info = ZipInfo(filename=relative_path)
-            zip_info.date_time = (1980, 1, 1, 0, 0, 0)
-            zip_info.compress_type = ZIP_DEFLATED
-            archive.writestr(zip_info, data)
+    # Entries are streamed one chunk at a time. ZipFile.writestr goes through
+    # the same ZipFile.open(..., "w") path, so with file_size preset the
+    # archive stays byte-identical to writing each payload in one piece. The
+    # archive is built under a temporary name so a failed export never leaves
+    # a truncated bundle behind or clobbers the previous one.
+    partial_path = destination_dir / f".{zip_path.name}.{uuid4().hex}.partial"
+    try:
+        with ZipFile(partial_path, mode="w") as archive:
+            for relative_path, source in sorted(
+                archive_entries, key=lambda item: item[0]
+            ):
+                zip_info = ZipInfo(filename=relative_path)
+                zip_info.date_time = (1980, 1, 1, 0, 0, 0)
+                zip_info.compress_type = ZIP_STORED if store_only else ZIP_DEFLATED
+                if compression_level is not None and not store_only:
+                    _set_compress_level(zip_info, compression_level)
+                if isinstance(source, bytes):
+                    archive.writestr(zip_info, source)
+                    continue
+                zip_info.file_size = source.size_bytes
+                with archive.open(zip_info, mode="w") as destination:
+                    _stream_archive_file(source, destination)
+        os.replace(partial_path, zip_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
 
     return zip_path
 
 
+def _set_compress_level(zip_info: ZipInfo, compression_level: int) -> None:
+    # ZipFile.open reads the level from the ZipInfo rather than the archive.
+    # ``compress_level`` is public from Python 3.13; earlier versions only have
+    # the private attribute ``writestr(compresslevel=...)`` sets.
+    try:
+        zip_info.compress_level = compression_level  # type: ignore[attr-defined]
+    except AttributeError:
+        zip_info._compresslevel = compression_level
+
+
 def _collect_archive_files(
     root_path: Path,
     file_paths: list[Path],
-) -> list[tuple[str, bytes]]:
-    archive_files: list[tuple[str, bytes]] = []
+) -> list[_ArchiveFile]:
+    archive_files: list[_ArchiveFile] = []
     for file_path in file_paths:
         relative_path = _safe_relative_path(
             base_path=root_path,
             target_path=file_path,
         )
-        archive_files.append((relative_path.as_posix(), file_path.read_bytes()))
+        digest = hashlib.sha256()
+        size_bytes = 0
+        for chunk in _iter_file_chunks(file_path):
+            digest.update(chunk)
+            size_bytes += len(chunk)
+        archive_files.append(
+            _ArchiveFile(
+                relative_path=relative_path.as_posix(),
+                source_path=file_path,
+                size_bytes=size_bytes,
+                sha256=digest.hexdigest(),
+            )
+        )
     return archive_files
 
 
+def _stream_archive_file(archive_file: _ArchiveFile, destination: IO[bytes]) -> None:
+    digest = hashlib.sha256()
+    size_bytes = 0
+    for chunk in _iter_file_chunks(archive_file.source_path):
+        digest.update(chunk)
+        size_bytes += len(chunk)
+        destination.write(chunk)
+    # The manifest was hashed in an earlier pass; refuse to ship a bundle whose
+    # contents no longer match it.
+    if (
+        size_bytes != archive_file.size_bytes
+        or digest.hexdigest() != archive_file.sha256
+    ):
+        raise ZipExportError(
+            f"Artifact changed during export: {archive_file.relative_path}"
+        )
+
+
+def _iter_file_chunks(file_path: Path) -> Iterator[bytes]:
+    with file_path.open("rb") as source:
+        while chunk := source.read(_EXPORT_CHUNK_BYTES):
+            yield chunk
+
+
 def _collect_artifact_files(root_path: Path) -> list[Path]:
     if root_path.is_symlink():
         raise ZipExportError(f"Artifacts root must not be a symlink: {root_path}")
@@ -142,16 +226,16 @@ def _build_bundle_manifest(
     *,
     run_id: str,
     session_id: str,
-    archive_files: list[tuple[str, bytes]],
+    archive_files: list[_ArchiveFile],
     signing_key: str | None,
 ) -> dict[str, Any]:
     files_payload: list[dict[str, Any]] = []
-    for relative_path, data in sorted(archive_files, key=lambda item: item[0]):
+    for archive_file in sorted(archive_files, key=lambda item: item.relative_path):
         files_payload.append(
             {
-                "relative_path": relative_path,
-                "size_bytes": len(data),
-                "sha256": hashlib.sha256(data).hexdigest(),
+                "relative_path": archive_file.relative_path,
+                "size_bytes": archive_file.size_bytes,
+                "sha256": archive_file.sha256,
             }
         )
 
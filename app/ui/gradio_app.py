@@ -184,13 +184,16 @@ def list_history_rows(
         date_from=date_from.strip() or None,
         date_to=date_to.strip() or None,
         limit=_to_limit(limit),
+        include_json=False,
     )
+    summaries = repo.get_run_summaries([run.run_id for run in runs])
 
     rows: list[list[str]] = []
     for run in runs:
         total_cost = ""
-        if isinstance(run.cost_json, dict) and "total_cost_usd" in run.cost_json:
-            total_cost = str(run.cost_json["total_cost_usd"])
+        summary = summaries.get(run.run_id)
+        if summary is not None and summary.total_cost_usd is not None:
+            total_cost = str(summary.total_cost_usd)
 
         rows.append(
             [
@@ -1964,7 +1967,9 @@ def _read_runtime_log(
         return "Run log is not available.", ""
 
     log_path = Path(artifacts_root) / "logs" / "run.log"
-    log_text, error = safe_read_text(log_path)
+    # The log grows while a run is active; caching every version would only
+    # churn the artifact cache.
+    log_text, error = safe_read_text(log_path, cache=False)
     if error is not None:
         return f"Run log is not available: {error}", str(log_path)
 
@@ -9,7 +9,7 @@ from app.storage.artifact_reader import (
     safe_load_run_manifest,
     safe_read_json,
 )
-from app.storage.models import RunRecord
+from app.storage.models import RunRecord, RunSummaryRecord
 from app.storage.repo import StorageRepo
 
 _STATUS_RANK = {
@@ -36,6 +36,19 @@ def build_run_snapshot(*, repo: StorageRepo, run_id: str) -> dict[str, Any]:
     if not target_run_id:
         return _missing_snapshot(run_id=run_id, reason="run_id is empty")
 
+    summary = repo.get_run_summary(target_run_id)
+    if summary is not None and summary.comparison_json is not None:
+        summary_run = repo.get_run(target_run_id)
+        if summary_run is not None:
+            # The summary is written with the run metrics at finalisation,
+            # so the comparison is answered from SQL without reading artifacts.
+            return _run_snapshot(
+                run=summary_run,
+                comparison=summary.comparison_json,
+                metrics=_summary_metrics(summary),
+                warnings=[],
+            )
+
     bundle = repo.get_run_bundle(target_run_id)
     if bundle is None:
         return _missing_snapshot(
@@ -58,26 +71,13 @@ def build_run_snapshot(*, repo: StorageRepo, run_id: str) -> dict[str, Any]:
     if parsed_warning is not None:
         warnings.append(parsed_warning)
 
-    checklist = _checklist(parsed_json)
-    critical_gaps_summary = _to_string_list(
-        parsed_json.get("critical_gaps_summary") if parsed_json else None
-    )
-    next_questions_to_user = _to_string_list(
-        parsed_json.get("next_questions_to_user") if parsed_json else None
+    return _run_snapshot(
+        run=run,
+        comparison=parsed_json,
+        metrics=_metrics_payload(run=run, manifest=manifest),
+        warnings=warnings,
     )
 
-    return {
-        "run_id": run.run_id,
-        "exists": True,
-        "run": _run_identity(run),
-        "artifacts_root_path": artifacts_root,
-        "checklist": checklist,
-        "critical_gaps_summary": critical_gaps_summary,
-        "next_questions_to_user": next_questions_to_user,
-        "metrics": _metrics_payload(run=run, manifest=manifest),
-        "warnings": sorted(set(warnings)),
-    }
-
 
 def build_run_diff(
     *,
@@ -166,6 +166,55 @@ def build_run_diff(
     }
 
 
+def _run_snapshot(
+    *,
+    run: RunRecord,
+    comparison: dict[str, Any] | None,
+    metrics: dict[str, Any],
+    warnings: list[str],
+) -> dict[str, Any]:
+    return {
+        "run_id": run.run_id,
+        "exists": True,
+        "run": _run_identity(run),
+        "artifacts_root_path": run.artifacts_root_path,
+        "checklist": _checklist(comparison),
+        "critical_gaps_summary": _to_string_list(
+            comparison.get("critical_gaps_summary") if comparison else None
+        ),
+        "next_questions_to_user": _to_string_list(
+            comparison.get("next_questions_to_user") if comparison else None
+        ),
+        "metrics": metrics,
+        "warnings": sorted(set(warnings)),
+    }
+
+
+def _summary_metrics(summary: RunSummaryRecord) -> dict[str, Any]:
+    return {
+        "timings": _without_none(
+            {
+                "t_ocr_total_ms": summary.t_ocr_total_ms,
+                "t_llm_total_ms": summary.t_llm_total_ms,
+                "t_total_ms": summary.t_total_ms,
+            }
+        ),
+        "usage": {},
+        "usage_normalized": _without_none(
+            {
+                "input_tokens": summary.input_tokens,
+                "output_tokens": summary.output_tokens,
+                "total_tokens": summary.total_tokens,
+            }
+        ),
+        "cost": _without_none({"total_cost_usd": summary.total_cost_usd}),
+    }
+
+
+def _without_none(values: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in values.items() if value is not None}
+
+
 def _missing_snapshot(*, run_id: str, reason: str) -> dict[str, Any]:
     return {
         "run_id": run_id,
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import io
 import json
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any, Protocol
+from typing import Any, BinaryIO, Protocol
 
 from openai import OpenAI
 
@@ -40,23 +39,150 @@ class BatchResultItem:
     raw_payload: dict[str, Any]
 
 
+@dataclass(frozen=True, slots=True)
+class BatchInputChunk:
+    input_path: Path
+    custom_ids: tuple[str, ...]
+    doc_ids: tuple[str, ...]
+    size_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResultLine:
+    end_offset: int
+    item: BatchResultItem
+
+
 class BatchClient(Protocol):
     def create_job(
         self,
         *,
-        jsonl_items: list[dict[str, Any]],
+        input_path: Path,
         metadata: dict[str, str],
     ) -> BatchJobSnapshot:
-        """Submit a batch job."""
+        """Submit a batch job for an already written JSONL input file."""
 
     def retrieve_job(self, job_id: str) -> BatchJobSnapshot:
         """Return the latest provider-side batch state."""
 
-    def download_results(self, *, output_file_id: str | None) -> list[BatchResultItem]:
-        """Download and parse successful response lines."""
+    def iter_result_lines(
+        self,
+        *,
+        file_id: str,
+        start_offset: int = 0,
+    ) -> Iterator[BatchResultLine]:
+        """Stream parsed output or error file lines that start at ``start_offset``."""
+
+
+class _BatchInputChunkWriter:
+    def __init__(self, input_path: Path) -> None:
+        self.input_path = input_path
+        self.custom_ids: list[str] = []
+        self.doc_ids: list[str] = []
+        self.size_bytes = 0
+        self._handle: BinaryIO = input_path.open("wb")
+
+    def write(self, *, line: bytes, custom_id: str, doc_id: str) -> None:
+        self._handle.write(line)
+        self.custom_ids.append(custom_id)
+        self.doc_ids.append(doc_id)
+        self.size_bytes += len(line)
+
+    def finish(self) -> BatchInputChunk:
+        self._handle.close()
+        return BatchInputChunk(
+            input_path=self.input_path,
+            custom_ids=tuple(self.custom_ids),
+            doc_ids=tuple(self.doc_ids),
+            size_bytes=self.size_bytes,
+        )
 
-    def download_errors(self, *, error_file_id: str | None) -> list[BatchResultItem]:
-        """Download and parse failed response lines."""
+    def close(self) -> None:
+        self._handle.close()
+
+
+def iter_batch_input_chunks(
+    queued_items: Iterable[dict[str, Any]],
+    *,
+    directory: Path,
+    max_requests: int,
+    max_input_file_bytes: int,
+) -> Iterator[BatchInputChunk]:
+    """Stream queued request bodies into size-bounded JSONL files under ``directory``.
+
+    Each request body is serialised exactly once and written straight to the
+    current chunk file, whose measured byte size drives the chunk boundary.
+    A chunk is yielded as soon as its file is complete, so callers that stop
+    early never serialise the remaining items.
+    """
+    writer: _BatchInputChunkWriter | None = None
+    chunk_count = 0
+    try:
+        for item in queued_items:
+            line = (
+                json.dumps(
+                    item["request_body"],
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+                + "\n"
+            ).encode("utf-8")
+            if writer is not None and (
+                len(writer.custom_ids) >= max_requests
+                or writer.size_bytes + len(line) > max_input_file_bytes
+            ):
+                chunk = writer.finish()
+                writer = None
+                yield chunk
+            if writer is None:
+                chunk_count += 1
+                writer = _BatchInputChunkWriter(
+                    directory / f"batch_input_{chunk_count:04d}.jsonl"
+                )
+            writer.write(
+                line=line,
+                custom_id=str(item["custom_id"]),
+                doc_id=str(item["doc_id"]),
+            )
+        if writer is not None:
+            chunk = writer.finish()
+            writer = None
+            yield chunk
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def iter_batch_result_lines(
+    chunks: Iterable[bytes],
+    *,
+    start_offset: int = 0,
+) -> Iterator[BatchResultLine]:
+    """Parse provider JSONL output incrementally from a byte-chunk stream.
+
+    ``end_offset`` is the byte offset just past each line, so an interrupted
+    apply can persist it and resume with ``start_offset`` without re-parsing
+    lines that were already applied.
+    """
+    offset = 0
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            line_start = offset
+            offset += len(line) + 1
+            if line_start >= start_offset and line.strip():
+                yield BatchResultLine(
+                    end_offset=offset,
+                    item=parse_batch_output_line(line.decode("utf-8")),
+                )
+    if offset >= start_offset and pending.strip():
+        yield BatchResultLine(
+            end_offset=offset + len(pending),
+            item=parse_batch_output_line(pending.decode("utf-8")),
+        )
 
 
 def build_batch_custom_id(*, doc_id: str, stage: str, request_hash: str) -> str:
@@ -189,20 +315,12 @@ class OpenAIResponsesBatchClient:
     def create_job(
         self,
         *,
-        jsonl_items: list[dict[str, Any]],
+        input_path: Path,
         metadata: dict[str, str],
     ) -> BatchJobSnapshot:
-        if not jsonl_items:
-            raise ValueError("jsonl_items must not be empty.")
-        payload = "\n".join(
-            json.dumps(item, ensure_ascii=False, separators=(",", ":"))
-            for item in jsonl_items
-        )
-        with NamedTemporaryFile("w+b", suffix=".jsonl") as handle:
-            handle.write(payload.encode("utf-8"))
-            handle.flush()
-            handle.seek(0)
-            input_file = self._client.files.create(file=Path(handle.name), purpose="batch")
+        if input_path.stat().st_size == 0:
+            raise ValueError("Batch input file must not be empty.")
+        input_file = self._client.files.create(file=input_path, purpose="batch")
         batch = self._client.batches.create(
             input_file_id=str(getattr(input_file, "id", "")),
             endpoint=_BATCH_ENDPOINT,
@@ -215,25 +333,17 @@ class OpenAIResponsesBatchClient:
         batch = self._client.batches.retrieve(job_id)
         return _coerce_batch_job_snapshot(batch)
 
-    def download_results(self, *, output_file_id: str | None) -> list[BatchResultItem]:
-        if not output_file_id:
-            return []
-        content = _read_file_content(self._client, output_file_id)
-        return [
-            parse_batch_output_line(line)
-            for line in content.splitlines()
-            if line.strip()
-        ]
-
-    def download_errors(self, *, error_file_id: str | None) -> list[BatchResultItem]:
-        if not error_file_id:
-            return []
-        content = _read_file_content(self._client, error_file_id)
-        return [
-            parse_batch_output_line(line)
-            for line in content.splitlines()
-            if line.strip()
-        ]
+    def iter_result_lines(
+        self,
+        *,
+        file_id: str,
+        start_offset: int = 0,
+    ) -> Iterator[BatchResultLine]:
+        with self._client.files.with_streaming_response.content(file_id) as response:
+            yield from iter_batch_result_lines(
+                response.iter_bytes(),
+                start_offset=start_offset,
+            )
 
 
 def _build_responses_request_body(request: StructuredLlmRequest) -> dict[str, Any]:
@@ -346,22 +456,3 @@ def _coerce_optional_str(raw_value: Any) -> str | None:
         return None
     value = str(raw_value)
     return value if value else None
-
-
-def _read_file_content(client: OpenAI, file_id: str) -> str:
-    content = client.files.content(file_id)
-    text_value = getattr(content, "text", None)
-    if isinstance(text_value, str):
-        return text_value
-    read_method = getattr(content, "read", None)
-    if callable(read_method):
-        raw_value = read_method()
-        if isinstance(raw_value, bytes):
-            return raw_value.decode("utf-8")
-        if isinstance(raw_value, str):
-            return raw_value
-    if isinstance(content, bytes):
-        return content.decode("utf-8")
-    if isinstance(content, io.BytesIO):
-        return content.getvalue().decode("utf-8")
-    raise TypeError(f"Unsupported OpenAI file content payload for {file_id}.")
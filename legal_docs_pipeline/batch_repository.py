@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import copy
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from statistics import median
 from typing import Any, Protocol
 
 from pymongo import MongoClient
@@ -31,7 +33,12 @@ class _CollectionProtocol(Protocol):
         self,
         query: dict[str, Any] | None = None,
         projection: dict[str, int] | None = None,
-    ) -> list[dict[str, Any]]: ...
+        *,
+        sort: list[tuple[str, int]] | None = None,
+        limit: int = 0,
+    ) -> Iterable[dict[str, Any]]: ...
+
+    def count_documents(self, query: dict[str, Any]) -> int: ...
 
     def find_one(
         self,
@@ -47,6 +54,8 @@ class _CollectionProtocol(Protocol):
         upsert: bool = False,
     ) -> Any: ...
 
+    def update_many(self, query: dict[str, Any], update: dict[str, Any]) -> Any: ...
+
 
 @dataclass(frozen=True, slots=True)
 class BatchQueueWriteResult:
@@ -143,6 +152,19 @@ class MongoBatchStateRepository:
         item = self._items.find_one({"_id": self._storage_item_id(custom_id)})
         return copy.deepcopy(item) if item is not None else None
 
+    def get_items(self, custom_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch many items in one query, keyed by ``custom_id``."""
+        if not custom_ids:
+            return {}
+        items = self._items.find(
+            {
+                "_id": {
+                    "$in": [self._storage_item_id(custom_id) for custom_id in custom_ids]
+                }
+            }
+        )
+        return {str(item["custom_id"]): copy.deepcopy(item) for item in items}
+
     def queue_item(
         self,
         *,
@@ -239,19 +261,50 @@ class MongoBatchStateRepository:
         return BatchQueueWriteResult(created=existing is None, status="queued")
 
     def list_queued_items(self, *, limit: int | None = None) -> list[dict[str, Any]]:
+        if limit is not None and limit <= 0:
+            return []
+        # Served by the (target, provider_status, queued_at) index; a Mongo
+        # limit of 0 means "no limit".
         items = self._items.find(
-            {
-                "target_database": self._target_database,
-                "target_collection": self._target_collection,
-                "provider_status": "queued",
-                "apply_status": "pending",
-            }
+            self._queued_items_query(),
+            sort=[("queued_at", 1)],
+            limit=limit or 0,
         )
-        items = sorted(items, key=lambda item: str(item.get("queued_at", "")))
-        if limit is not None:
-            items = items[:limit]
         return [copy.deepcopy(item) for item in items]
 
+    def iter_queued_submission_items(self) -> Iterator[dict[str, Any]]:
+        """Stream queued items oldest first with only the fields submit writes.
+
+        Items come straight off the Mongo cursor, so submit holds one request
+        body at a time instead of the whole queue.
+        """
+        yield from self._items.find(
+            self._queued_items_query(),
+            {"_id": 0, "custom_id": 1, "doc_id": 1, "request_body": 1},
+            sort=[("queued_at", 1)],
+        )
+
+    def count_queued_items(self) -> int:
+        return self._items.count_documents(self._queued_items_query())
+
+    def get_observed_turnaround_seconds(self, *, sample_size: int) -> float | None:
+        """Median submit-to-complete time over the most recent completed jobs."""
+        jobs = self._jobs.find(
+            self._jobs_query(provider_statuses=frozenset({"completed"})),
+            {"submitted_at": 1, "completed_at": 1},
+            sort=[("submitted_at", -1)],
+            limit=sample_size,
+        )
+        durations = sorted(
+            (job["completed_at"] - job["submitted_at"]).total_seconds()
+            for job in jobs
+            if isinstance(job.get("submitted_at"), datetime)
+            and isinstance(job.get("completed_at"), datetime)
+        )
+        if not durations:
+            return None
+        return float(median(durations))
+
     def list_items_for_job(self, batch_job_id: str) -> list[dict[str, Any]]:
         items = self._items.find(
             {
@@ -294,37 +347,37 @@ class MongoBatchStateRepository:
             },
             upsert=True,
         )
-        for custom_id in custom_ids:
-            self._items.update_one(
-                {"_id": self._storage_item_id(custom_id)},
-                {
-                    "$set": {
-                        "provider_status": "submitted",
-                        "status": "submitted",
-                        "submitted_at": now,
-                        "batch_job_id": batch_job_id,
-                    }
-                },
-                upsert=False,
-            )
+        if not custom_ids:
+            return
+        self._items.update_many(
+            {
+                "_id": {
+                    "$in": [
+                        self._storage_item_id(custom_id) for custom_id in custom_ids
+                    ]
+                }
+            },
+            {
+                "$set": {
+                    "provider_status": "submitted",
+                    "status": "submitted",
+                    "submitted_at": now,
+                    "batch_job_id": batch_job_id,
+                }
+            },
+        )
 
     def get_inflight_jobs(self) -> list[dict[str, Any]]:
         jobs = self._jobs.find(
-            {
-                "target_database": self._target_database,
-                "target_collection": self._target_collection,
-            }
+            self._jobs_query(provider_statuses=_INFLIGHT_PROVIDER_STATUSES),
+            sort=[("submitted_at", 1)],
         )
-        inflight = [
-            copy.deepcopy(job)
-            for job in jobs
-            if str(job.get("provider_status", job.get("status", "")))
-            in _INFLIGHT_PROVIDER_STATUSES
-        ]
-        return inflight
+        return [copy.deepcopy(job) for job in jobs]
 
     def count_inflight_jobs(self) -> int:
-        return len(self.get_inflight_jobs())
+        return self._jobs.count_documents(
+            self._jobs_query(provider_statuses=_INFLIGHT_PROVIDER_STATUSES)
+        )
 
     def update_job_status(
         self,
@@ -352,22 +405,10 @@ class MongoBatchStateRepository:
         )
 
     def get_terminal_jobs_ready_for_apply(self) -> list[dict[str, Any]]:
-        jobs = self._jobs.find(
-            {
-                "target_database": self._target_database,
-                "target_collection": self._target_collection,
-            }
-        )
-        ready: list[dict[str, Any]] = []
-        for job in jobs:
-            provider_status = str(job.get("provider_status", job.get("status", "")))
-            apply_status = str(job.get("apply_status", "pending"))
-            if provider_status not in _TERMINAL_PROVIDER_STATUSES:
-                continue
-            if apply_status in {"fully_applied", "apply_failed"}:
-                continue
-            ready.append(copy.deepcopy(job))
-        return sorted(ready, key=lambda item: str(item.get("submitted_at", "")))
+        query = self._jobs_query(provider_statuses=_TERMINAL_PROVIDER_STATUSES)
+        query["apply_status"] = {"$nin": ["fully_applied", "apply_failed"]}
+        jobs = self._jobs.find(query, sort=[("submitted_at", 1)])
+        return [copy.deepcopy(job) for job in jobs]
 
     def mark_item_provider_state(
         self,
@@ -426,6 +467,34 @@ class MongoBatchStateRepository:
             upsert=False,
         )
 
+    def update_job_apply_checkpoint(
+        self,
+        *,
+        batch_job_id: str,
+        file_kind: str,
+        end_offset: int,
+    ) -> None:
+        self._jobs.update_one(
+            {"_id": self._storage_job_id(batch_job_id)},
+            {"$set": {f"apply_checkpoint.{file_kind}_offset": end_offset}},
+            upsert=False,
+        )
+
+    def list_item_apply_states_for_job(self, batch_job_id: str) -> list[tuple[str, str]]:
+        """Return ``(custom_id, apply_status)`` pairs without loading request bodies."""
+        items = self._items.find(
+            {
+                "target_database": self._target_database,
+                "target_collection": self._target_collection,
+                "batch_job_id": batch_job_id,
+            },
+            {"custom_id": 1, "apply_status": 1},
+        )
+        return sorted(
+            (str(item["custom_id"]), str(item.get("apply_status", "pending")))
+            for item in items
+        )
+
     def get_job(self, batch_job_id: str) -> dict[str, Any] | None:
         job = self._jobs.find_one({"_id": self._storage_job_id(batch_job_id)})
         return copy.deepcopy(job) if job is not None else None
@@ -478,8 +547,7 @@ class MongoBatchStateRepository:
         stage: str,
         exclude_custom_id: str,
     ) -> None:
-        now = _utc_now()
-        queued_items = self._items.find(
+        self._items.update_many(
             {
                 "target_database": self._target_database,
                 "target_collection": self._target_collection,
@@ -487,31 +555,39 @@ class MongoBatchStateRepository:
                 "stage": stage,
                 "provider_status": "queued",
                 "apply_status": "pending",
-            }
+                "custom_id": {"$ne": exclude_custom_id},
+            },
+            {
+                "$set": {
+                    "apply_status": "superseded",
+                    "status": "superseded",
+                    "applied_at": _utc_now(),
+                    "error_payload": {
+                        "code": "batch_item_superseded",
+                        "message": (
+                            "Queued batch item was superseded by a newer "
+                            "request for the same document and stage."
+                        ),
+                        "superseded_by": exclude_custom_id,
+                    },
+                }
+            },
         )
-        for item in queued_items:
-            custom_id = str(item.get("custom_id", ""))
-            if custom_id == exclude_custom_id:
-                continue
-            self._items.update_one(
-                {"_id": self._storage_item_id(custom_id)},
-                {
-                    "$set": {
-                        "apply_status": "superseded",
-                        "status": "superseded",
-                        "applied_at": now,
-                        "error_payload": {
-                            "code": "batch_item_superseded",
-                            "message": (
-                                "Queued batch item was superseded by a newer "
-                                "request for the same document and stage."
-                            ),
-                            "superseded_by": exclude_custom_id,
-                        },
-                    }
-                },
-                upsert=False,
-            )
+
+    def _queued_items_query(self) -> dict[str, Any]:
+        return {
+            "target_database": self._target_database,
+            "target_collection": self._target_collection,
+            "provider_status": "queued",
+            "apply_status": "pending",
+        }
+
+    def _jobs_query(self, *, provider_statuses: frozenset[str]) -> dict[str, Any]:
+        return {
+            "target_database": self._target_database,
+            "target_collection": self._target_collection,
+            "provider_status": {"$in": sorted(provider_statuses)},
+        }
 
     def _storage_item_id(self, custom_id: str) -> str:
         return (
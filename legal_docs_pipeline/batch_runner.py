@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
-import json
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from time import sleep
+from tempfile import TemporaryDirectory
+import threading
+from time import monotonic, sleep
 from typing import Any
 from uuid import uuid4
 
@@ -13,9 +20,11 @@ from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from .batch import (
     BatchClient,
+    BatchJobSnapshot,
     BatchResultItem,
     OpenAIResponsesBatchClient,
     deserialize_analysis_request_record,
+    iter_batch_input_chunks,
 )
 from .batch_repository import MongoBatchStateRepository
 from .logging import JsonlPipelineLogger
@@ -24,7 +33,6 @@ from .pipeline import (
     AnnotationPipeline,
     PipelineRunOptions,
     _build_failed_llm_updates,
-    _default_log_dir,
     _log,
 )
 from .repository import MongoDocumentRepository
@@ -32,6 +40,23 @@ from .constants import LlmDispatchMode, PipelineMode
 from .llm import LlmCallError, StructuredLlmRequest, StructuredLlmResponse
 
 
+_SETTLED_ITEM_APPLY_STATUSES = frozenset(
+    {
+        "applied_success",
+        "applied_failed",
+        "fallback_completed",
+        "fallback_failed",
+        "stale",
+    }
+)
+# Apply checkpoints are written once per this many drained result lines or
+# seconds, whichever comes first, and always at the end of each result file.
+_APPLY_CHECKPOINT_EVERY_LINES = 200
+_APPLY_CHECKPOINT_EVERY_SECONDS = 5.0
+# Result lines whose batch items are looked up in one Mongo query.
+_APPLY_LOOKUP_BATCH_LINES = 100
+
+
 @dataclass(frozen=True, slots=True)
 class BatchRunOptions:
     mode: PipelineMode
@@ -79,6 +104,41 @@ class _ApplyItemResult:
     from_batch_success: bool = False
 
 
+class _KeyedLocks:
+    """Hands out one lock per key so concurrent writers to a key serialize."""
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: dict[str, threading.Lock] = {}
+        self._holders: dict[str, int] = {}
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+            self._holders[key] = self._holders.get(key, 0) + 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._guard:
+                self._holders[key] -= 1
+                if not self._holders[key]:
+                    del self._holders[key]
+                    del self._locks[key]
+
+
+def _completed_future(task: Callable[[], None]) -> Future[None]:
+    future: Future[None] = Future()
+    try:
+        task()
+    except Exception as error:  # noqa: BLE001
+        future.set_exception(error)
+    else:
+        future.set_result(None)
+    return future
+
+
 class BatchAnalysisRunner:
     def __init__(
         self,
@@ -100,6 +160,8 @@ class BatchAnalysisRunner:
         self._batch_client = batch_client or OpenAIResponsesBatchClient(
             timeout_seconds=config.model.request_timeout_seconds
         )
+        self._document_locks = _KeyedLocks()
+        self._summary_lock = threading.Lock()
 
     def prepare(self, *, options: BatchRunOptions) -> BatchCommandSummary:
         run_id, logger, discovered, summary = self._initialize_batch_run(
@@ -158,6 +220,7 @@ class BatchAnalysisRunner:
         finally:
             batch_repository.close()
             document_repository.close()
+            logger.close()
         return summary
 
     def submit(self, *, log_level: str = "INFO") -> BatchCommandSummary:
@@ -178,10 +241,9 @@ class BatchAnalysisRunner:
             if available_slots == 0:
                 summary.warnings.append("Batch inflight jobs limit already reached.")
                 return summary
-            queued_items = batch_repository.list_queued_items()
-            if not queued_items:
+            queued_count = batch_repository.count_queued_items()
+            if queued_count == 0:
                 return summary
-            queued_count = len(queued_items)
             below_submit_threshold = (
                 queued_count < self.config.pipeline.batch_min_requests_to_submit
             )
@@ -210,43 +272,51 @@ class BatchAnalysisRunner:
                         ),
                     },
                 )
-            chunks = _chunk_queued_items(
-                queued_items=queued_items,
-                max_requests=self.config.pipeline.batch_max_requests,
-                max_input_file_bytes=self.config.pipeline.batch_max_input_file_bytes,
-            )
             document_repository = self._document_repository_factory(self.config)
             try:
-                for chunk in chunks[:available_slots]:
-                    jsonl_items = [dict(item["request_body"]) for item in chunk]
-                    batch_snapshot = self._batch_client.create_job(
-                        jsonl_items=jsonl_items,
-                        metadata={
-                            "run_id": run_id,
-                            "prompt_pack_version": self.config.prompts.prompt_pack_version,
-                        },
-                    )
-                    custom_ids = [str(item["custom_id"]) for item in chunk]
-                    batch_repository.mark_submitted(
-                        batch_job_id=batch_snapshot.job_id,
-                        custom_ids=custom_ids,
-                        raw_payload=batch_snapshot.raw_payload,
-                    )
-                    for item in chunk:
-                        document_repository.update_analysis_dispatch(
-                            doc_id=str(item["doc_id"]),
-                            dispatch_updates={
-                                "mode": "batch_analysis",
-                                "status": "submitted",
-                                "custom_id": str(item["custom_id"]),
-                                "batch_job_id": batch_snapshot.job_id,
+                with (
+                    TemporaryDirectory(prefix="normadepo-batch-input-") as input_dir,
+                    closing(
+                        iter_batch_input_chunks(
+                            batch_repository.iter_queued_submission_items(),
+                            directory=Path(input_dir),
+                            max_requests=self.config.pipeline.batch_max_requests,
+                            max_input_file_bytes=(
+                                self.config.pipeline.batch_max_input_file_bytes
+                            ),
+                        )
+                    ) as chunks,
+                ):
+                    for chunk in islice(chunks, available_slots):
+                        batch_snapshot = self._batch_client.create_job(
+                            input_path=chunk.input_path,
+                            metadata={
+                                "run_id": run_id,
+                                "prompt_pack_version": self.config.prompts.prompt_pack_version,
                             },
                         )
-                    summary.submitted_jobs_count += 1
+                        chunk.input_path.unlink()
+                        batch_repository.mark_submitted(
+                            batch_job_id=batch_snapshot.job_id,
+                            custom_ids=list(chunk.custom_ids),
+                            raw_payload=batch_snapshot.raw_payload,
+                        )
+                        for doc_id, custom_id in zip(chunk.doc_ids, chunk.custom_ids):
+                            document_repository.update_analysis_dispatch(
+                                doc_id=doc_id,
+                                dispatch_updates={
+                                    "mode": "batch_analysis",
+                                    "status": "submitted",
+                                    "custom_id": custom_id,
+                                    "batch_job_id": batch_snapshot.job_id,
+                                },
+                            )
+                        summary.submitted_jobs_count += 1
             finally:
                 document_repository.close()
         finally:
             batch_repository.close()
+            logger.close()
         return summary
 
     def poll(
@@ -267,9 +337,7 @@ class BatchAnalysisRunner:
                 jobs = batch_repository.get_inflight_jobs()
                 if not jobs:
                     break
-                for job in jobs:
-                    batch_job_id = str(job["batch_job_id"])
-                    snapshot = self._batch_client.retrieve_job(batch_job_id)
+                for snapshot in self._retrieve_jobs(jobs):
                     batch_repository.update_job_status(
                         batch_job_id=snapshot.job_id,
                         status=snapshot.status,
@@ -295,8 +363,28 @@ class BatchAnalysisRunner:
                 sleep(self.config.pipeline.batch_poll_interval_seconds)
         finally:
             batch_repository.close()
+            logger.close()
         return summary
 
+    def _retrieve_jobs(self, jobs: list[dict[str, Any]]) -> list[BatchJobSnapshot]:
+        """Retrieve provider snapshots, fanning out over ``batch_poll_workers``.
+
+        Only the provider round-trips run concurrently; snapshots come back in
+        job order so Mongo updates and log lines stay deterministic.
+        """
+        batch_job_ids = [str(job["batch_job_id"]) for job in jobs]
+        workers = min(self.config.pipeline.batch_poll_workers, len(batch_job_ids))
+        if workers <= 1:
+            return [
+                self._batch_client.retrieve_job(batch_job_id)
+                for batch_job_id in batch_job_ids
+            ]
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="normadepo-batch-poll",
+        ) as executor:
+            return list(executor.map(self._batch_client.retrieve_job, batch_job_ids))
+
     def apply(self, *, log_level: str = "INFO") -> BatchCommandSummary:
         run_id, logger, discovered, summary = self._initialize_batch_run(
             action="apply",
@@ -306,45 +394,74 @@ class BatchAnalysisRunner:
         summary.discovered_count = len(discovered)
         document_repository = self._document_repository_factory(self.config)
         batch_repository = self._batch_repository_factory(self.config)
-        try:
-            jobs = batch_repository.get_terminal_jobs_ready_for_apply()
-            for job in jobs:
-                batch_job_id = str(job["batch_job_id"])
-                try:
-                    summary = self._apply_one_job(
-                        summary=summary,
-                        job=job,
-                        run_id=run_id,
-                        logger=logger,
-                        document_repository=document_repository,
+        apply_workers = self.config.pipeline.batch_apply_workers
+        item_executor = (
+            ThreadPoolExecutor(
+                max_workers=apply_workers,
+                thread_name_prefix="normadepo-batch-apply",
+            )
+            if apply_workers > 1
+            else None
+        )
+
+        def apply_job(job: dict[str, Any]) -> None:
+            batch_job_id = str(job["batch_job_id"])
+            try:
+                self._apply_one_job(
+                    summary=summary,
+                    job=job,
+                    run_id=run_id,
+                    logger=logger,
+                    document_repository=document_repository,
+                    batch_repository=batch_repository,
+                    item_executor=item_executor,
+                )
+                batch_repository.update_job_apply_status(
+                    batch_job_id=batch_job_id,
+                    apply_status=self._derive_job_apply_status(
                         batch_repository=batch_repository,
-                    )
-                    batch_repository.update_job_apply_status(
                         batch_job_id=batch_job_id,
-                        apply_status=self._derive_job_apply_status(
-                            batch_repository=batch_repository,
-                            batch_job_id=batch_job_id,
-                        ),
-                    )
-                except Exception as error:
-                    batch_repository.update_job_apply_status(
-                        batch_job_id=batch_job_id,
-                        apply_status="apply_failed",
-                    )
-                    warning = f"Failed to apply batch job {batch_job_id}: {error}"
+                    ),
+                )
+            except Exception as error:
+                batch_repository.update_job_apply_status(
+                    batch_job_id=batch_job_id,
+                    apply_status="apply_failed",
+                )
+                warning = f"Failed to apply batch job {batch_job_id}: {error}"
+                with self._summary_lock:
                     summary.warnings.append(warning)
-                    _log(
-                        logger,
-                        run_id=run_id,
-                        stage="batch",
-                        event="batch_apply_failed",
-                        level="error",
-                        message=warning,
-                        details={"batch_job_id": batch_job_id},
-                    )
+                _log(
+                    logger,
+                    run_id=run_id,
+                    stage="batch",
+                    event="batch_apply_failed",
+                    level="error",
+                    message=warning,
+                    details={"batch_job_id": batch_job_id},
+                )
+
+        try:
+            jobs = batch_repository.get_terminal_jobs_ready_for_apply()
+            job_workers = min(self.config.pipeline.batch_apply_job_workers, len(jobs))
+            # Direct fallback may prepare one document for several items.
+            with self.pipeline._reusing_document_preparation():
+                if job_workers > 1:
+                    with ThreadPoolExecutor(
+                        max_workers=job_workers,
+                        thread_name_prefix="normadepo-batch-apply-job",
+                    ) as job_executor:
+                        for _ in job_executor.map(apply_job, jobs):
+                            pass
+                else:
+                    for job in jobs:
+                        apply_job(job)
         finally:
+            if item_executor is not None:
+                item_executor.shutdown(wait=True)
             batch_repository.close()
             document_repository.close()
+            logger.close()
         return summary
 
     def _apply_one_job(
@@ -356,66 +473,164 @@ class BatchAnalysisRunner:
         logger: JsonlPipelineLogger,
         document_repository: MongoDocumentRepository,
         batch_repository: MongoBatchStateRepository,
+        item_executor: ThreadPoolExecutor | None = None,
     ) -> BatchCommandSummary:
         batch_job_id = str(job["batch_job_id"])
-        items = batch_repository.list_items_for_job(batch_job_id)
         provider_status = str(job.get("provider_status", job.get("status", "")))
-        success_items: dict[str, BatchResultItem] = {}
-        error_items: dict[str, BatchResultItem] = {}
-        if job.get("output_file_id"):
-            success_items = {
-                item.custom_id: item
-                for item in self._batch_client.download_results(
-                    output_file_id=job.get("output_file_id")
-                )
-            }
-        if job.get("error_file_id"):
-            error_items = {
-                item.custom_id: item
-                for item in self._batch_client.download_errors(
-                    error_file_id=job.get("error_file_id")
-                )
-            }
-        for item in items:
-            apply_status = str(item.get("apply_status", "pending"))
-            if apply_status in {
-                "applied_success",
-                "applied_failed",
-                "fallback_completed",
-                "fallback_failed",
-                "stale",
-            }:
-                continue
-            custom_id = str(item["custom_id"])
-            if custom_id in success_items:
-                result = success_items[custom_id]
-                apply_result = self._apply_success_item(
-                    item=item,
-                    result=result,
-                    batch_job_id=batch_job_id,
-                    run_id=run_id,
-                    logger=logger,
-                    document_repository=document_repository,
-                    batch_repository=batch_repository,
-                )
+        checkpoint = dict(job.get("apply_checkpoint") or {})
+
+        def apply_item(
+            item: dict[str, Any],
+            *,
+            success_result: BatchResultItem | None = None,
+            failure_result: BatchResultItem | None = None,
+        ) -> None:
+            with self._document_locks.hold(str(item["doc_id"])):
+                if success_result is not None:
+                    apply_result = self._apply_success_item(
+                        item=item,
+                        result=success_result,
+                        batch_job_id=batch_job_id,
+                        run_id=run_id,
+                        logger=logger,
+                        document_repository=document_repository,
+                        batch_repository=batch_repository,
+                    )
+                else:
+                    apply_result = self._apply_failed_item(
+                        item=item,
+                        batch_job_id=batch_job_id,
+                        job_provider_status=provider_status,
+                        provider_failure=failure_result,
+                        run_id=run_id,
+                        logger=logger,
+                        document_repository=document_repository,
+                        batch_repository=batch_repository,
+                    )
+            with self._summary_lock:
                 self._update_apply_summary(summary=summary, result=apply_result)
                 self._record_outcome(summary, apply_result.outcome)
                 summary.applied_items_count += 1
-                continue
-            failure_item = error_items.get(custom_id)
-            apply_result = self._apply_failed_item(
-                item=item,
-                batch_job_id=batch_job_id,
-                job_provider_status=provider_status,
-                provider_failure=failure_item,
-                run_id=run_id,
-                logger=logger,
-                document_repository=document_repository,
-                batch_repository=batch_repository,
+
+        # Items are applied on ``item_executor`` when one is configured, inline
+        # otherwise. Results are drained in submission order, so a line's end
+        # offset becomes checkpointable only once it and every earlier line have
+        # been applied; the window bounds how far the stream runs ahead. The
+        # highest such offset per file is written in coalesced updates.
+        in_flight: deque[tuple[Future[None], str | None, int]] = deque()
+        window = 2 * self.config.pipeline.batch_apply_workers if item_executor else 0
+        applied_offsets: dict[str, int] = {}
+        lines_since_checkpoint = 0
+        last_checkpoint_at = monotonic()
+
+        def write_checkpoints() -> None:
+            nonlocal lines_since_checkpoint, last_checkpoint_at
+            for file_kind, end_offset in applied_offsets.items():
+                batch_repository.update_job_apply_checkpoint(
+                    batch_job_id=batch_job_id,
+                    file_kind=file_kind,
+                    end_offset=end_offset,
+                )
+            applied_offsets.clear()
+            lines_since_checkpoint = 0
+            last_checkpoint_at = monotonic()
+
+        def drain(limit: int) -> None:
+            nonlocal lines_since_checkpoint
+            while len(in_flight) > limit:
+                future, file_kind, end_offset = in_flight.popleft()
+                future.result()
+                if file_kind is not None:
+                    applied_offsets[file_kind] = end_offset
+                    lines_since_checkpoint += 1
+            if applied_offsets and (
+                lines_since_checkpoint >= _APPLY_CHECKPOINT_EVERY_LINES
+                or monotonic() - last_checkpoint_at >= _APPLY_CHECKPOINT_EVERY_SECONDS
+            ):
+                write_checkpoints()
+
+        def schedule(
+            task: Callable[[], None],
+            *,
+            file_kind: str | None = None,
+            end_offset: int = 0,
+        ) -> None:
+            future = (
+                item_executor.submit(task)
+                if item_executor is not None
+                else _completed_future(task)
             )
-            self._update_apply_summary(summary=summary, result=apply_result)
-            self._record_outcome(summary, apply_result.outcome)
-            summary.applied_items_count += 1
+            in_flight.append((future, file_kind, end_offset))
+            drain(window)
+
+        def noop() -> None:
+            return None
+
+        try:
+            # Success lines are applied first, then error lines, straight from
+            # the provider stream. Checkpointed offsets let an interrupted apply
+            # resume after the last applied line; per-item apply states keep
+            # replays idempotent.
+            for file_kind, file_id in (
+                ("output", job.get("output_file_id")),
+                ("error", job.get("error_file_id")),
+            ):
+                if not file_id:
+                    continue
+                result_lines = self._batch_client.iter_result_lines(
+                    file_id=str(file_id),
+                    start_offset=int(checkpoint.get(f"{file_kind}_offset", 0)),
+                )
+                while lookup_batch := list(
+                    islice(result_lines, _APPLY_LOOKUP_BATCH_LINES)
+                ):
+                    items = batch_repository.get_items(
+                        [result_line.item.custom_id for result_line in lookup_batch]
+                    )
+                    for result_line in lookup_batch:
+                        item = items.get(result_line.item.custom_id)
+                        task = noop
+                        if (
+                            item is not None
+                            and item.get("batch_job_id") == batch_job_id
+                            and str(item.get("apply_status", "pending"))
+                            not in _SETTLED_ITEM_APPLY_STATUSES
+                        ):
+                            if file_kind == "output":
+                                task = partial(
+                                    apply_item, item, success_result=result_line.item
+                                )
+                            else:
+                                task = partial(
+                                    apply_item, item, failure_result=result_line.item
+                                )
+                        schedule(
+                            task,
+                            file_kind=file_kind,
+                            end_offset=result_line.end_offset,
+                        )
+                drain(0)
+                write_checkpoints()
+
+            for custom_id, apply_status in (
+                batch_repository.list_item_apply_states_for_job(batch_job_id)
+            ):
+                if apply_status in _SETTLED_ITEM_APPLY_STATUSES:
+                    continue
+                item = batch_repository.get_item(custom_id)
+                if item is not None:
+                    schedule(partial(apply_item, item))
+            drain(0)
+        finally:
+            # Lines drained before a failure are applied; keep their progress.
+            if applied_offsets:
+                write_checkpoints()
+            # Never leave workers writing for a job that is being marked failed.
+            for future, _, _ in in_flight:
+                future.cancel()
+            for future, _, _ in in_flight:
+                if not future.cancelled():
+                    future.exception()
         return summary
 
     def _apply_success_item(
@@ -802,9 +1017,8 @@ class BatchAnalysisRunner:
         if self.config.config_path is None:
             raise ValueError("config_path must be set on PipelineConfig.")
         run_id = f"normadepo-batch-{uuid4().hex[:12]}"
-        logger = JsonlPipelineLogger(
+        logger = self.pipeline._build_logger(
             run_id=run_id,
-            log_dir=_default_log_dir(self.config.config_path),
             log_level=options.log_level,
         )
         discovered: list[Any] = []
@@ -908,29 +1122,3 @@ class BatchAnalysisRunner:
         ):
             return False
         return True
-
-
-def _chunk_queued_items(
-    *,
-    queued_items: list[dict[str, Any]],
-    max_requests: int,
-    max_input_file_bytes: int,
-) -> list[list[dict[str, Any]]]:
-    chunks: list[list[dict[str, Any]]] = []
-    current_chunk: list[dict[str, Any]] = []
-    current_bytes = 0
-    for item in queued_items:
-        line = json.dumps(item["request_body"], ensure_ascii=False, separators=(",", ":"))
-        line_bytes = len(line.encode("utf-8")) + 1
-        if current_chunk and (
-            len(current_chunk) >= max_requests
-            or current_bytes + line_bytes > max_input_file_bytes
-        ):
-            chunks.append(current_chunk)
-            current_chunk = []
-            current_bytes = 0
-        current_chunk.append(item)
-        current_bytes += line_bytes
-    if current_chunk:
-        chunks.append(current_chunk)
-    return chunks
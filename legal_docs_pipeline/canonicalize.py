@@ -12,7 +12,13 @@ from .constants import (
     TEXT_PREVIEW_CHARS,
 )
 from .parser import ParsedMarkdownDocument
-from .reader import ReadDocumentResult, TextStats
+from .reader import (
+    ReadDocumentResult,
+    TextStats,
+    build_text_stats,
+    fold_text_lines,
+    has_extra_line_boundaries,
+)
 
 _HTML_HEAVY_TAG_RE = re.compile(
     r"</?(?:html|body|div|span|table|tbody|tr|td|th|p|a|colgroup|col|style)[^>]*>",
@@ -92,9 +98,10 @@ def build_canonical_text(
         read_result=read_result,
     ):
         canonical_text = _canonicalize_html_heavy(raw_content)
+        canonical_stats = build_text_stats(canonical_text)
         strategy = "html_heavy_visible_text"
     else:
-        canonical_text = _canonicalize_plain_markdown(raw_content)
+        canonical_text, canonical_stats = _canonicalize_plain_markdown(raw_content)
 
     if not canonical_text:
         raise CanonicalizeDocumentError(
@@ -110,7 +117,7 @@ def build_canonical_text(
         ).hexdigest(),
         text_preview=canonical_text[:TEXT_PREVIEW_CHARS],
         text_stats_raw=read_result.text_stats,
-        text_stats_canonical=_build_text_stats(canonical_text),
+        text_stats_canonical=canonical_stats,
         strategy=strategy,
         sections=sections,
     )
@@ -135,12 +142,15 @@ def _is_html_heavy(
     return tag_count >= 20 and (tag_count * 20) >= len(text)
 
 
-def _canonicalize_plain_markdown(text: str) -> str:
+def _canonicalize_plain_markdown(text: str) -> tuple[str, TextStats]:
     normalized = html.unescape(text).replace("\xa0", " ")
-    normalized = normalized.replace("\r\n", "\n").replace("\r", "\n")
-    normalized = "\n".join(line.rstrip() for line in normalized.splitlines())
-    normalized = _MULTI_NEWLINE_RE.sub("\n\n", normalized)
-    return normalized.strip()
+    if "\r" in normalized:
+        normalized = normalized.replace("\r\n", "\n").replace("\r", "\n")
+    if has_extra_line_boundaries(normalized):
+        normalized = "\n".join(line.rstrip() for line in normalized.splitlines())
+        normalized = _MULTI_NEWLINE_RE.sub("\n\n", normalized).strip()
+        return normalized, build_text_stats(normalized)
+    return fold_text_lines(normalized, collapse_whitespace_only_lines=True)
 
 
 def _canonicalize_html_heavy(text: str) -> str:
@@ -255,11 +265,3 @@ def _chunk_text(text: str) -> tuple[str, ...]:
     if current:
         chunks.append(current)
     return tuple(chunk for chunk in chunks if chunk)
-
-
-def _build_text_stats(text: str) -> TextStats:
-    return TextStats(
-        chars=len(text),
-        lines=len(text.splitlines()),
-        words=len(re.findall(r"\b\w+\b", text, flags=re.UNICODE)),
-    )
@@ -63,6 +63,11 @@ def build_argument_parser() -> argparse.ArgumentParser:
         type=int,
         help="Override workers. Foundation slice supports only value 1.",
     )
+    parser.add_argument(
+        "--strict-rehash",
+        action="store_true",
+        help="Recompute SHA-256 for every file, ignoring the persistent scan index.",
+    )
     parser.add_argument(
         "--force-classifier-fallback",
         action="store_true",
@@ -91,6 +96,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             mongo_db=args.mongo_db,
             mongo_collection=args.mongo_collection,
             workers=args.workers,
+            strict_rehash=True if args.strict_rehash else None,
         )
         summary = AnnotationPipeline(config=config).run(
             options=PipelineRunOptions(
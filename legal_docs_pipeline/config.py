@@ -10,6 +10,9 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 from .constants import (
     ANALYSIS_BATCH_ITEMS_COLLECTION,
     ANALYSIS_BATCH_JOBS_COLLECTION,
+    DEFAULT_ADAPTIVE_BATCH_TURNAROUND_SECONDS,
+    DEFAULT_ADAPTIVE_MAX_BATCH_LATENCY_SECONDS,
+    DEFAULT_ADAPTIVE_RERUN_MAX_BATCH_LATENCY_SECONDS,
     DEFAULT_TRANSLATION_RU_MAX_OUTPUT_TOKENS,
     DEFAULT_TRANSLATION_RU_MAX_OUTPUT_TOKENS_MAX,
     DEFAULT_TRANSLATION_RU_REASONING_EFFORT,
@@ -17,6 +20,9 @@ from .constants import (
     DEDUPE_VERSION,
     DEFAULT_MAX_FILE_SIZE_BYTES,
     DEFAULT_INPUT_GLOB,
+    DEFAULT_LOG_FLUSH_BYTES,
+    DEFAULT_LOG_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_SCAN_HASH_WORKERS,
     DEFAULT_PROMPT_PACK_ID,
     DEFAULT_PROMPT_PACK_VERSION,
     LlmDispatchMode,
@@ -34,6 +40,9 @@ class InputConfig(BaseModel):
     glob: str = Field(default=DEFAULT_INPUT_GLOB, min_length=1)
     ignore_hidden: bool = True
     max_file_size_bytes: int = Field(default=DEFAULT_MAX_FILE_SIZE_BYTES, ge=1)
+    scan_index_path: Path | None = None
+    strict_rehash: bool = False
+    hash_workers: int = Field(default=DEFAULT_SCAN_HASH_WORKERS, ge=1)
 
 
 class MongoConfig(BaseModel):
@@ -129,6 +138,9 @@ class PipelineSettings(BaseModel):
     batch_inflight_jobs_limit: int = Field(default=2, ge=1)
     batch_min_requests_to_submit: int = Field(default=5, ge=1)
     batch_apply_direct_fallback: bool = True
+    batch_poll_workers: int = Field(default=4, ge=1)
+    batch_apply_job_workers: int = Field(default=1, ge=1)
+    batch_apply_workers: int = Field(default=1, ge=1)
     batch_jobs_collection: str = Field(
         default=ANALYSIS_BATCH_JOBS_COLLECTION,
         min_length=1,
@@ -142,6 +154,25 @@ class PipelineSettings(BaseModel):
         ge=0.0,
         le=1.0,
     )
+    adaptive_dispatch_default_turnaround_seconds: int = Field(
+        default=DEFAULT_ADAPTIVE_BATCH_TURNAROUND_SECONDS,
+        ge=1,
+    )
+    adaptive_dispatch_max_batch_latency_seconds: int = Field(
+        default=DEFAULT_ADAPTIVE_MAX_BATCH_LATENCY_SECONDS,
+        ge=0,
+    )
+    adaptive_dispatch_rerun_max_batch_latency_seconds: int = Field(
+        default=DEFAULT_ADAPTIVE_RERUN_MAX_BATCH_LATENCY_SECONDS,
+        ge=0,
+    )
+    adaptive_dispatch_min_batch_savings_usd: float = Field(default=0.0, ge=0.0)
+    log_flush_bytes: int = Field(default=DEFAULT_LOG_FLUSH_BYTES, ge=1)
+    log_flush_interval_seconds: float = Field(
+        default=DEFAULT_LOG_FLUSH_INTERVAL_SECONDS,
+        ge=0.0,
+    )
+    log_rotate_max_bytes: int | None = Field(default=None, ge=1)
 
     @field_validator("workers")
     @classmethod
@@ -173,10 +204,18 @@ class PipelineConfig(BaseModel):
             base_dir=base_dir,
             field_name="prompts.prompt_dir",
         )
+        resolved_scan_index_path = (
+            _resolve_path(self.input.scan_index_path, base_dir=base_dir)
+            if self.input.scan_index_path is not None
+            else None
+        )
         return self.model_copy(
             update={
                 "input": self.input.model_copy(
-                    update={"root_path": resolved_input_root}
+                    update={
+                        "root_path": resolved_input_root,
+                        "scan_index_path": resolved_scan_index_path,
+                    }
                 ),
                 "prompts": self.prompts.model_copy(
                     update={"prompt_dir": resolved_prompt_dir}
@@ -209,6 +248,7 @@ def apply_cli_overrides(
     mongo_db: str | None = None,
     mongo_collection: str | None = None,
     workers: int | None = None,
+    strict_rehash: bool | None = None,
 ) -> PipelineConfig:
     input_model = config.input
     mongo_model = config.mongo
@@ -224,6 +264,8 @@ def apply_cli_overrides(
                 )
             }
         )
+    if strict_rehash is not None:
+        input_model = input_model.model_copy(update={"strict_rehash": strict_rehash})
 
     if mongo_uri is not None:
         mongo_model = mongo_model.model_copy(update={"uri": mongo_uri})
@@ -245,15 +287,19 @@ def apply_cli_overrides(
     return validated.model_copy(update={"config_path": config.config_path})
 
 
+def _resolve_path(raw_path: Path, *, base_dir: Path) -> Path:
+    candidate = raw_path.expanduser()
+    resolved = candidate if candidate.is_absolute() else (base_dir / candidate)
+    return resolved.resolve()
+
+
 def _resolve_existing_directory(
     raw_path: Path,
     *,
     base_dir: Path,
     field_name: str,
 ) -> Path:
-    candidate = raw_path.expanduser()
-    resolved = candidate if candidate.is_absolute() else (base_dir / candidate)
-    resolved = resolved.resolve()
+    resolved = _resolve_path(raw_path, base_dir=base_dir)
     if not resolved.exists():
         raise FileNotFoundError(f"{field_name} does not exist: {resolved}")
     if not resolved.is_dir():
@@ -15,6 +15,7 @@ class PipelineMode(str, Enum):
 class LlmDispatchMode(str, Enum):
     DIRECT = "direct"
     BATCH_ANALYSIS = "batch_analysis"
+    ADAPTIVE = "adaptive"
 
 
 class RerunScope(str, Enum):
@@ -108,8 +109,14 @@ DEFAULT_TRANSLATION_RU_REASONING_EFFORT = "auto"
 DEFAULT_TRANSLATION_RU_MAX_OUTPUT_TOKENS = GPT_5_4_MAX_OUTPUT_TOKENS
 DEFAULT_TRANSLATION_RU_MAX_OUTPUT_TOKENS_MAX = GPT_5_4_MAX_OUTPUT_TOKENS
 DEFAULT_BATCH_DISCOUNT_FACTOR = 0.5
+DEFAULT_ADAPTIVE_BATCH_TURNAROUND_SECONDS = 4 * 60 * 60
+DEFAULT_ADAPTIVE_MAX_BATCH_LATENCY_SECONDS = 24 * 60 * 60
+DEFAULT_ADAPTIVE_RERUN_MAX_BATCH_LATENCY_SECONDS = 15 * 60
+ADAPTIVE_TURNAROUND_SAMPLE_SIZE = 20
 DEFAULT_CONFIG_PATH = Path("config/pipeline.yaml")
 DEFAULT_INPUT_GLOB = "**/*.md"
+DEFAULT_SCAN_HASH_WORKERS = 4
+SCAN_HASH_CHUNK_BYTES = 4 * 1024 * 1024
 DEFAULT_PROMPT_PACK_ID = "kaucja-prompt-pack"
 DEFAULT_PROMPT_PACK_VERSION = "2026-03-20"
 BASE_PROMPT_FILENAME = "base_system.txt"
@@ -123,6 +130,9 @@ OUTPUT_SCHEMA_INSTRUCTION = (
 TEXT_PREVIEW_CHARS = 500
 PACKED_INPUT_THRESHOLD_CHARS = 20_000
 PACKED_SECTION_MAX_CHARS = 2_500
+PREPARATION_CACHE_MAX_ENTRIES = 64
+DEFAULT_LOG_FLUSH_BYTES = 256 * 1024
+DEFAULT_LOG_FLUSH_INTERVAL_SECONDS = 2.0
 ANALYSIS_BATCH_JOBS_COLLECTION = "analysis_batch_jobs_v2"
 ANALYSIS_BATCH_ITEMS_COLLECTION = "analysis_batch_items_v2"
 
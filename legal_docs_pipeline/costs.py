@@ -2,26 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import math
+from dataclasses import dataclass
 from typing import Any
 
+from .constants import LlmDispatchMode
 from .llm import StructuredLlmRequest, StructuredLlmResponse
 
 
 def estimate_request_input_tokens(request: StructuredLlmRequest) -> int:
-    payload = {
-        "system_prompt": request.system_prompt,
-        "input_payload": request.input_payload,
-        "output_schema": request.output_schema,
-    }
-    serialized = json.dumps(
-        payload,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    )
-    return _estimate_tokens_for_text(serialized)
+    return request.estimated_input_tokens
 
 
 def estimate_request_output_tokens(request: StructuredLlmRequest) -> int:
@@ -54,10 +44,7 @@ def estimate_stage_cost(
     }
     if dispatch_mode == "batch_analysis":
         payload["batch_discount_factor"] = batch_discount_factor
-    if (
-        input_cost_per_1k_tokens_usd is None
-        or output_cost_per_1k_tokens_usd is None
-    ):
+    if input_cost_per_1k_tokens_usd is None or output_cost_per_1k_tokens_usd is None:
         payload["estimated_cost_usd"] = None
         return payload
     estimated_cost = round(
@@ -72,7 +59,105 @@ def estimate_stage_cost(
     return payload
 
 
-def _estimate_tokens_for_text(text: str) -> int:
-    if not text:
-        return 0
-    return max(1, math.ceil(len(text) / 4))
+@dataclass(frozen=True, slots=True)
+class DispatchDecision:
+    mode: LlmDispatchMode
+    reason: str
+    direct_cost_usd: float | None
+    batch_cost_usd: float | None
+    expected_batch_latency_seconds: float
+
+    def to_log_details(self) -> dict[str, Any]:
+        return {
+            "dispatch_mode": self.mode.value,
+            "reason": self.reason,
+            "direct_cost_usd": self.direct_cost_usd,
+            "batch_cost_usd": self.batch_cost_usd,
+            "expected_batch_latency_seconds": self.expected_batch_latency_seconds,
+        }
+
+
+class AdaptiveDispatchScheduler:
+    """Per-document choice between direct and batch analysis for one run.
+
+    A request goes to batch when the discount saves at least
+    ``min_batch_savings_usd`` and the expected batch latency fits
+    ``max_batch_latency_seconds``. Expected latency is the observed job
+    turnaround times the number of submission waves needed to drain the queue
+    ahead of the request. Every batch decision deepens that queue, so a large
+    run spills over to direct once the backlog would exceed the budget.
+    """
+
+    def __init__(
+        self,
+        *,
+        input_cost_per_1k_tokens_usd: float | None,
+        output_cost_per_1k_tokens_usd: float | None,
+        batch_discount_factor: float,
+        batch_max_requests: int,
+        batch_inflight_jobs_limit: int,
+        turnaround_seconds: float,
+        queue_depth: int,
+        max_batch_latency_seconds: float,
+        min_batch_savings_usd: float = 0.0,
+    ) -> None:
+        self._input_cost_per_1k_tokens_usd = input_cost_per_1k_tokens_usd
+        self._output_cost_per_1k_tokens_usd = output_cost_per_1k_tokens_usd
+        self._batch_discount_factor = batch_discount_factor
+        self._batch_max_requests = batch_max_requests
+        self._batch_inflight_jobs_limit = batch_inflight_jobs_limit
+        self._turnaround_seconds = turnaround_seconds
+        self._queue_depth = queue_depth
+        self._max_batch_latency_seconds = max_batch_latency_seconds
+        self._min_batch_savings_usd = min_batch_savings_usd
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue_depth
+
+    def expected_batch_latency_seconds(self) -> float:
+        jobs = math.ceil((self._queue_depth + 1) / self._batch_max_requests)
+        waves = math.ceil(jobs / self._batch_inflight_jobs_limit)
+        return waves * self._turnaround_seconds
+
+    def decide(self, request: StructuredLlmRequest) -> DispatchDecision:
+        direct_cost = self._estimate_cost(request, LlmDispatchMode.DIRECT)
+        batch_cost = self._estimate_cost(request, LlmDispatchMode.BATCH_ANALYSIS)
+        latency = self.expected_batch_latency_seconds()
+
+        def decision(mode: LlmDispatchMode, reason: str) -> DispatchDecision:
+            return DispatchDecision(
+                mode=mode,
+                reason=reason,
+                direct_cost_usd=direct_cost,
+                batch_cost_usd=batch_cost,
+                expected_batch_latency_seconds=latency,
+            )
+
+        if latency > self._max_batch_latency_seconds:
+            return decision(LlmDispatchMode.DIRECT, "batch_latency_over_budget")
+        if self._batch_discount_factor >= 1.0:
+            return decision(LlmDispatchMode.DIRECT, "no_batch_discount")
+        # Without pricing the discount still holds per token, so only the
+        # savings threshold is skipped.
+        if (
+            direct_cost is not None
+            and batch_cost is not None
+            and direct_cost - batch_cost < self._min_batch_savings_usd
+        ):
+            return decision(LlmDispatchMode.DIRECT, "batch_savings_below_threshold")
+        self._queue_depth += 1
+        return decision(LlmDispatchMode.BATCH_ANALYSIS, "batch_discount_within_budget")
+
+    def _estimate_cost(
+        self,
+        request: StructuredLlmRequest,
+        dispatch_mode: LlmDispatchMode,
+    ) -> float | None:
+        return estimate_stage_cost(
+            request=request,
+            input_cost_per_1k_tokens_usd=self._input_cost_per_1k_tokens_usd,
+            output_cost_per_1k_tokens_usd=self._output_cost_per_1k_tokens_usd,
+            dispatch_mode=dispatch_mode.value,
+            batch_discount_factor=self._batch_discount_factor,
+        )["estimated_cost_usd"]
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Protocol
 
+from .text_view import TextView
+
 _PL_SOURCE_SYSTEMS = {
     "eli_pl",
     "isap_pl",
@@ -35,6 +37,7 @@ _EN_MARKERS = (
     "generated at",
     "markdown export",
 )
+_SIGNAL_HEAD_CHARS = 4000
 _DISCOVERY_PAGE_EN_MARKERS = (
     "this entry is a search/discovery page",
     "result links",
@@ -58,6 +61,7 @@ class LanguageDetector(Protocol):
         doc_metadata: dict[str, object],
         relative_path: str,
         title: str | None,
+        text_view: TextView | None = None,
     ) -> LanguageDetectionResult:
         """Return detected ISO 639-1 language code."""
 
@@ -70,7 +74,10 @@ class HeuristicLanguageDetector:
         doc_metadata: dict[str, object],
         relative_path: str,
         title: str | None,
+        text_view: TextView | None = None,
     ) -> LanguageDetectionResult:
+        if text_view is None:
+            text_view = TextView(normalized_text, title=title)
         scores = {"pl": 0, "en": 0}
         signals: list[str] = []
         source_system = str(
@@ -79,11 +86,10 @@ class HeuristicLanguageDetector:
             or ""
         ).strip()
         relative_path_upper = relative_path.upper()
-        lowered_text = normalized_text.lower()
         if (
             relative_path_upper.endswith("README.MD")
-            and "markdown export" in lowered_text
-            and "generated at" in lowered_text
+            and "markdown export" in text_view.lowered
+            and "generated at" in text_view.lowered
         ):
             return LanguageDetectionResult(
                 language_code="en",
@@ -106,9 +112,20 @@ class HeuristicLanguageDetector:
             scores["en"] += 1
             signals.append(f"folder={top_level_dir}->en")
 
-        signal_text = f"{title or ''}\n{normalized_text[:4000]}".lower()
-        pl_hits = sum(1 for marker in _PL_MARKERS if marker in signal_text)
-        en_hits = sum(1 for marker in _EN_MARKERS if marker in signal_text)
+        # No marker spans a line break, so the title and the head window are
+        # searched separately instead of lowering a title + head concatenation.
+        lowered_title = (title or "").lower()
+        lowered_head = text_view.lowered_head(_SIGNAL_HEAD_CHARS)
+        pl_hits = sum(
+            1
+            for marker in _PL_MARKERS
+            if marker in lowered_title or marker in lowered_head
+        )
+        en_hits = sum(
+            1
+            for marker in _EN_MARKERS
+            if marker in lowered_title or marker in lowered_head
+        )
         if pl_hits:
             scores["pl"] += pl_hits
             signals.append(f"text_markers_pl={pl_hits}")
@@ -116,7 +133,7 @@ class HeuristicLanguageDetector:
             scores["en"] += en_hits
             signals.append(f"text_markers_en={en_hits}")
 
-        if all(marker in lowered_text for marker in _DISCOVERY_PAGE_EN_MARKERS):
+        if all(marker in text_view.lowered for marker in _DISCOVERY_PAGE_EN_MARKERS):
             return LanguageDetectionResult(
                 language_code="en",
                 confidence=0.85,
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import signal
 import json
+import math
 import threading
+from collections.abc import Callable
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from time import monotonic
 from typing import Any, Iterator, Protocol, TypeVar
 
@@ -15,6 +19,8 @@ from openai import APIStatusError, APITimeoutError, OpenAI, RateLimitError
 from pydantic import BaseModel
 
 TextFormatT = TypeVar("TextFormatT", bound=BaseModel)
+ResultT = TypeVar("ResultT")
+TokenEstimator = Callable[[str], int]
 
 
 class LlmCallError(RuntimeError):
@@ -52,6 +58,45 @@ class StructuredLlmRequest:
     prompt_profile: str
     prompt_hash: str
     request_hash: str
+    token_estimator: TokenEstimator | None = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    _input_token_estimate: int | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def estimated_input_tokens(self) -> int:
+        """Token estimate for prompt, payload and schema, serialised only once.
+
+        Uses ``token_estimator`` (e.g. a tokenizer-backed counter) when set and
+        the four-characters-per-token heuristic otherwise.
+        """
+        if self._input_token_estimate is None:
+            serialized = json.dumps(
+                {
+                    "system_prompt": self.system_prompt,
+                    "input_payload": self.input_payload,
+                    "output_schema": self.output_schema,
+                },
+                ensure_ascii=False,
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+            estimator = self.token_estimator or estimate_text_tokens
+            object.__setattr__(self, "_input_token_estimate", estimator(serialized))
+        return self._input_token_estimate
+
+
+def estimate_text_tokens(text: str) -> int:
+    if not text:
+        return 0
+    return max(1, math.ceil(len(text) / 4))
 
 
 @dataclass(frozen=True, slots=True)
@@ -110,8 +155,10 @@ class OpenAIResponsesAnnotationLlmClient:
         if reasoning is not None:
             request_kwargs["reasoning"] = reasoning
         try:
-            with _request_timeout_guard(self._timeout_seconds):
-                response = self._service().parse(**request_kwargs)
+            response = _call_with_deadline(
+                partial(self._service().parse, **request_kwargs),
+                timeout_seconds=self._timeout_seconds,
+            )
         except RateLimitError as error:
             raise LlmCallError(code="llm_rate_limit", message=str(error)) from error
         except APITimeoutError as error:
@@ -274,6 +321,40 @@ def _has_refusal(response: Any) -> bool:
     return False
 
 
+def _call_with_deadline(
+    call: Callable[[], ResultT], *, timeout_seconds: int
+) -> ResultT:
+    """Run ``call``, raising ``TimeoutError`` once ``timeout_seconds`` elapse.
+
+    SIGALRM only interrupts the main thread, so calls made elsewhere (e.g. the
+    batch apply workers) run on a daemon thread and are abandoned on timeout;
+    the OpenAI client's own request timeout then bounds the orphaned call.
+    """
+    if (
+        timeout_seconds <= 0
+        or threading.current_thread() is threading.main_thread()
+        and hasattr(signal, "SIGALRM")
+    ):
+        with _request_timeout_guard(timeout_seconds):
+            return call()
+
+    outcome: Future[ResultT] = Future()
+
+    def _run() -> None:
+        try:
+            outcome.set_result(call())
+        except Exception as error:  # noqa: BLE001
+            outcome.set_exception(error)
+
+    threading.Thread(target=_run, name="kaucja-llm-request", daemon=True).start()
+    try:
+        return outcome.result(timeout=timeout_seconds)
+    except FutureTimeoutError as error:
+        raise TimeoutError(
+            f"OpenAI Responses request exceeded {timeout_seconds} seconds."
+        ) from error
+
+
 @contextmanager
 def _request_timeout_guard(timeout_seconds: int) -> Iterator[None]:
     if (
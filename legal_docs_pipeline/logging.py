@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import shutil
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Protocol
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Protocol, TextIO
+
+from .constants import DEFAULT_LOG_FLUSH_BYTES, DEFAULT_LOG_FLUSH_INTERVAL_SECONDS
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 _LOG_LEVELS = {
     "DEBUG": 10,
@@ -14,6 +24,7 @@ _LOG_LEVELS = {
     "WARNING": 30,
     "ERROR": 40,
 }
+_IMMEDIATE_FLUSH_LEVEL = _LOG_LEVELS["WARNING"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -34,21 +45,56 @@ class PipelineLogger(Protocol):
     def log(self, event: PipelineLogEvent) -> None:
         """Write structured pipeline event."""
 
+    def close(self) -> None:
+        """Flush buffered events and release the log file."""
+
 
 class JsonlPipelineLogger:
+    """Thread-safe JSONL logger that keeps one buffered handle open per run.
+
+    Buffered lines reach disk once ``flush_bytes`` accumulate, when
+    ``flush_interval_seconds`` have passed since the last flush, on any
+    warning or error event, and on ``close``. With ``rotate_max_bytes`` set,
+    a full log file is renamed to ``<run_id>.<n>.jsonl.gz`` (gzip-compressed)
+    and logging continues in a fresh ``log_path``.
+    """
+
     def __init__(
         self,
         *,
         run_id: str,
         log_dir: Path | str = Path("logs"),
         log_level: str = "INFO",
+        flush_bytes: int = DEFAULT_LOG_FLUSH_BYTES,
+        flush_interval_seconds: float = DEFAULT_LOG_FLUSH_INTERVAL_SECONDS,
+        rotate_max_bytes: int | None = None,
     ) -> None:
+        if flush_bytes < 1:
+            raise ValueError("flush_bytes must be a positive integer.")
+        if rotate_max_bytes is not None and rotate_max_bytes < 1:
+            raise ValueError("rotate_max_bytes must be a positive integer.")
         self.log_path = Path(log_dir).resolve() / f"{run_id}.jsonl"
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
         self._log_level = _normalize_log_level(log_level)
+        self._flush_bytes = flush_bytes
+        self._flush_interval_seconds = flush_interval_seconds
+        self._rotate_max_bytes = rotate_max_bytes
+        self._lock = threading.Lock()
+        self._handle: TextIO | None = None
+        self._buffered_bytes = 0
+        self._file_bytes = 0
+        self._last_flush_at = monotonic()
+        self._rotation_index = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def log(self, event: PipelineLogEvent) -> None:
-        if _LOG_LEVELS[_normalize_log_level(event.level)] < _LOG_LEVELS[self._log_level]:
+        level = _LOG_LEVELS[_normalize_log_level(event.level)]
+        if level < _LOG_LEVELS[self._log_level]:
             return
         payload = {
             "timestamp": _utc_now().isoformat(),
@@ -61,9 +107,69 @@ class JsonlPipelineLogger:
             "error": event.error,
             "details": event.details,
         }
-        with self.log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True))
-            handle.write("\n")
+        line = json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n"
+        line_bytes = len(line.encode("utf-8"))
+        with self._lock:
+            handle = self._open_handle()
+            handle.write(line)
+            self._buffered_bytes += line_bytes
+            self._file_bytes += line_bytes
+            if (
+                level >= _IMMEDIATE_FLUSH_LEVEL
+                or self._buffered_bytes >= self._flush_bytes
+                or monotonic() - self._last_flush_at >= self._flush_interval_seconds
+            ):
+                self._flush_locked()
+            if (
+                self._rotate_max_bytes is not None
+                and self._file_bytes >= self._rotate_max_bytes
+            ):
+                self._rotate_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is None:
+                return
+            self._handle.close()
+            self._handle = None
+            self._buffered_bytes = 0
+            self._last_flush_at = monotonic()
+
+    def _open_handle(self) -> TextIO:
+        if self._handle is None:
+            self._handle = self.log_path.open(
+                "a",
+                encoding="utf-8",
+                buffering=self._flush_bytes,
+            )
+            self._file_bytes = self._handle.tell()
+        return self._handle
+
+    def _flush_locked(self) -> None:
+        if self._handle is not None:
+            self._handle.flush()
+        self._buffered_bytes = 0
+        self._last_flush_at = monotonic()
+
+    def _rotate_locked(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._buffered_bytes = 0
+        self._file_bytes = 0
+        self._rotation_index += 1
+        rotated_path = self.log_path.with_name(
+            f"{self.log_path.stem}.{self._rotation_index}.jsonl.gz"
+        )
+        temp_path = rotated_path.with_name(f"{rotated_path.name}.tmp")
+        with self.log_path.open("rb") as source, gzip.open(temp_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.replace(temp_path, rotated_path)
+        self.log_path.unlink()
 
 
 def _utc_now() -> datetime:
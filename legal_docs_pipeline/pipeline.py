@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 import os
 from pathlib import Path
+import threading
 from time import sleep
-from typing import Any
+from typing import Any, TypeVar
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
@@ -25,15 +28,17 @@ from .batch import (
 from .batch_repository import MongoBatchStateRepository
 from .config import PipelineConfig
 from .constants import (
+    ADAPTIVE_TURNAROUND_SAMPLE_SIZE,
     DEFAULT_TRANSLATION_RU_MAX_OUTPUT_TOKENS_MAX,
     DocumentFamily,
     LlmDispatchMode,
     PACKED_INPUT_THRESHOLD_CHARS,
+    PREPARATION_CACHE_MAX_ENTRIES,
     PipelineMode,
     PromptProfile,
     RerunScope,
 )
-from .costs import estimate_stage_cost
+from .costs import AdaptiveDispatchScheduler, estimate_stage_cost
 from .language import HeuristicLanguageDetector, LanguageDetectionResult
 from .llm import (
     AnnotationLlmClient,
@@ -65,6 +70,7 @@ from .schemas import (
     validate_analysis_business_rules,
     validate_translation_business_rules,
 )
+from .text_view import TextView
 
 _RESUME_TRANSLATION_STAGE = "annotate_ru"
 _FALLBACK_CLASSIFIER_MIN_CONFIDENCE = 0.6
@@ -74,6 +80,8 @@ _FALLBACK_CLASSIFIER_SYSTEM_PROMPT = (
 )
 _TRANSPORT_RETRYABLE_LLM_ERROR_CODES = frozenset({"llm_timeout", "llm_rate_limit"})
 
+_CachedValue = TypeVar("_CachedValue")
+
 
 @dataclass(frozen=True, slots=True)
 class PipelineRunOptions:
@@ -97,6 +105,47 @@ class PreparedAnnotatableDocument:
     analysis_fingerprint: str
 
 
+class _DocumentPreparationCache:
+    """Memo of read/parse/canonicalize/language/route results for one run.
+
+    Only installed on paths that may prepare the same document more than
+    once (batch apply fallback); a direct run prepares each document once and
+    keeps nothing. Entries are keyed by ``(doc_id, file sha256)`` so an edited
+    file is never served stale results, and the cache is bounded to keep
+    memory flat on large corpora. Failed stages raise before anything is
+    stored. The cache is shared by concurrent batch apply workers, so
+    bookkeeping is done under a lock while ``compute`` runs outside it; a
+    racing duplicate compute keeps the first stored value.
+    """
+
+    def __init__(self, *, max_entries: int = PREPARATION_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        document: DiscoveredDocument,
+        stage: str,
+        compute: Callable[[], _CachedValue],
+    ) -> _CachedValue:
+        key = (document.relative_path.as_posix(), document.sha256_hex)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = {}
+                self._entries[key] = entry
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+            if stage in entry:
+                return entry[stage]
+        value = compute()
+        with self._lock:
+            return entry.setdefault(stage, value)
+
+
 class PipelineRunSummary(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -163,7 +212,11 @@ class AnnotationPipeline:
         llm_client: AnnotationLlmClient | None = None,
     ) -> None:
         self.config = config
-        self.scanner = scanner or DocumentScanner()
+        self.scanner = scanner or DocumentScanner(
+            scan_index_path=config.input.scan_index_path,
+            strict_rehash=config.input.strict_rehash,
+            hash_workers=config.input.hash_workers,
+        )
         self.reader = reader or MarkdownReader(
             max_file_size_bytes=config.input.max_file_size_bytes
         )
@@ -180,6 +233,7 @@ class AnnotationPipeline:
             batch_repository_factory or MongoBatchStateRepository.from_config
         )
         self._llm_client = llm_client
+        self._preparation_cache: _DocumentPreparationCache | None = None
 
     def run(
         self,
@@ -196,141 +250,174 @@ class AnnotationPipeline:
 
         self.prompt_resolver.validate_prompt_pack()
         run_id = f"normadepo-{uuid4().hex[:12]}"
-        logger = JsonlPipelineLogger(
-            run_id=run_id,
-            log_dir=_default_log_dir(self.config.config_path),
-            log_level=options.log_level,
-        )
-        discovered = self.scanner.scan(
-            self.config.input.root_path,
-            glob_pattern=self.config.input.glob,
-            ignore_hidden=self.config.input.ignore_hidden,
-            only_doc_id=options.only_doc_id,
-            from_relative_path=options.from_relative_path,
-            limit=options.limit,
-        )
-        if options.only_doc_id and not discovered:
-            raise FileNotFoundError(
-                f"Document not found under input root: {options.only_doc_id}"
-            )
-
-        summary = PipelineRunSummary(
-            config_path=self.config.config_path,
-            mode=options.mode,
-            dry_run=options.dry_run,
-            limit=options.limit,
-            only_doc_id=options.only_doc_id,
-            run_id=run_id,
-            input_root=self.config.input.root_path,
-            mongo_uri=self.config.mongo.uri,
-            mongo_database=self.config.mongo.database,
-            mongo_collection=self.config.mongo.collection,
-            prompt_dir=self.config.prompts.prompt_dir,
-            prompt_pack_id=self.config.prompts.prompt_pack_id,
-            prompt_pack_version=self.config.prompts.prompt_pack_version,
-            pipeline_version=self.config.pipeline.pipeline_version,
-            log_path=logger.log_path,
-            discovered_count=len(discovered),
-            execution_status="dry_run_completed" if options.dry_run else "completed",
-            message="Two-stage annotation pipeline finished.",
-        )
-        _log(
-            logger,
-            run_id=run_id,
-            stage="run",
-            event="run_started",
-            level="info",
-            message="Pipeline run started.",
-            details={
-                "mode": options.mode.value,
-                "dry_run": options.dry_run,
-                "force_classifier_fallback": options.force_classifier_fallback,
+        logger = self._build_logger(run_id=run_id, log_level=options.log_level)
+        try:
+            scan_kwargs = {
+                "glob_pattern": self.config.input.glob,
+                "ignore_hidden": self.config.input.ignore_hidden,
+                "only_doc_id": options.only_doc_id,
                 "from_relative_path": options.from_relative_path,
-                "rerun_scope": rerun_scope.value if rerun_scope else None,
-                "discovered_count": len(discovered),
-            },
-        )
-
-        _require_openai_api_key(
-            config=self.config,
-            llm_client=self._llm_client,
-            dry_run=options.dry_run,
-        )
+                "limit": options.limit,
+            }
+            discovered_source: Iterable[DiscoveredDocument]
+            if options.only_doc_id:
+                discovered_source = self.scanner.scan(
+                    self.config.input.root_path,
+                    **scan_kwargs,
+                )
+                if not discovered_source:
+                    raise FileNotFoundError(
+                        f"Document not found under input root: {options.only_doc_id}"
+                    )
+            else:
+                # Documents stream into processing as they are hashed; the
+                # discovered count is finalised once the stream is exhausted.
+                discovered_source = self.scanner.iter_scan(
+                    self.config.input.root_path,
+                    **scan_kwargs,
+                )
 
-        if options.dry_run and options.mode is not PipelineMode.RERUN:
-            self._run_dry(
-                discovered=discovered,
-                summary=summary,
-                logger=logger,
+            summary = PipelineRunSummary(
+                config_path=self.config.config_path,
+                mode=options.mode,
+                dry_run=options.dry_run,
+                limit=options.limit,
+                only_doc_id=options.only_doc_id,
+                run_id=run_id,
+                input_root=self.config.input.root_path,
+                mongo_uri=self.config.mongo.uri,
+                mongo_database=self.config.mongo.database,
+                mongo_collection=self.config.mongo.collection,
+                prompt_dir=self.config.prompts.prompt_dir,
+                prompt_pack_id=self.config.prompts.prompt_pack_id,
+                prompt_pack_version=self.config.prompts.prompt_pack_version,
+                pipeline_version=self.config.pipeline.pipeline_version,
+                log_path=logger.log_path,
+                execution_status="dry_run_completed" if options.dry_run else "completed",
+                message="Two-stage annotation pipeline finished.",
             )
-            _log_summary(logger, summary)
-            return summary
+            _log(
+                logger,
+                run_id=run_id,
+                stage="run",
+                event="run_started",
+                level="info",
+                message="Pipeline run started.",
+                details={
+                    "mode": options.mode.value,
+                    "dry_run": options.dry_run,
+                    "force_classifier_fallback": options.force_classifier_fallback,
+                    "from_relative_path": options.from_relative_path,
+                    "rerun_scope": rerun_scope.value if rerun_scope else None,
+                },
+            )
+            discovered = _count_discovered(discovered_source, summary)
 
-        effective_dispatch_mode = self._resolve_dispatch_mode(
-            options=options,
-            rerun_scope=rerun_scope,
-        )
-        repository: MongoDocumentRepository | None = None
-        batch_repository: MongoBatchStateRepository | None = None
-        try:
-            repository = self._repository_factory(self.config)
-            if not options.dry_run:
-                repository.ensure_indexes()
-                if effective_dispatch_mode == LlmDispatchMode.BATCH_ANALYSIS:
-                    batch_repository = self._batch_repository_factory(self.config)
-                    batch_repository.ensure_indexes()
-        except Exception as error:
-            if options.dry_run and options.mode is PipelineMode.RERUN:
-                warning = (
-                    "Dry-run rerun selection skipped because repository lookup is "
-                    f"unavailable: {error}"
-                )
-                summary.warnings.append(warning)
-                _log(
-                    logger,
-                    run_id=run_id,
-                    stage="rerun",
-                    event="repository_unavailable",
-                    level="warning",
-                    message=warning,
-                )
-                _log_summary(logger, summary)
-                return summary
-            raise
+            _require_openai_api_key(
+                config=self.config,
+                llm_client=self._llm_client,
+                dry_run=options.dry_run,
+            )
 
-        try:
-            if options.dry_run:
-                self._run_dry_with_repository(
-                    repository=repository,
+            if options.dry_run and options.mode is not PipelineMode.RERUN:
+                self._run_dry(
                     discovered=discovered,
-                    options=options,
-                    rerun_scope=rerun_scope,
-                    summary=summary,
-                    logger=logger,
-                )
-            else:
-                self._run_with_repository(
-                    repository=repository,
-                    batch_repository=batch_repository,
-                    discovered=discovered,
-                    options=options,
-                    rerun_scope=rerun_scope,
-                    dispatch_mode=effective_dispatch_mode,
                     summary=summary,
                     logger=logger,
                 )
+                _log_summary(logger, summary)
+                return summary
+
+            effective_dispatch_mode = self._resolve_dispatch_mode(
+                options=options,
+                rerun_scope=rerun_scope,
+            )
+            repository: MongoDocumentRepository | None = None
+            batch_repository: MongoBatchStateRepository | None = None
+            dispatch_scheduler: AdaptiveDispatchScheduler | None = None
+            try:
+                repository = self._repository_factory(self.config)
+                if not options.dry_run:
+                    repository.ensure_indexes()
+                    if effective_dispatch_mode in {
+                        LlmDispatchMode.BATCH_ANALYSIS,
+                        LlmDispatchMode.ADAPTIVE,
+                    }:
+                        batch_repository = self._batch_repository_factory(self.config)
+                        batch_repository.ensure_indexes()
+                    if effective_dispatch_mode == LlmDispatchMode.ADAPTIVE:
+                        dispatch_scheduler = self._build_dispatch_scheduler(
+                            batch_repository=batch_repository,
+                            options=options,
+                        )
+            except Exception as error:
+                if options.dry_run and options.mode is PipelineMode.RERUN:
+                    warning = (
+                        "Dry-run rerun selection skipped because repository lookup is "
+                        f"unavailable: {error}"
+                    )
+                    summary.warnings.append(warning)
+                    _log(
+                        logger,
+                        run_id=run_id,
+                        stage="rerun",
+                        event="repository_unavailable",
+                        level="warning",
+                        message=warning,
+                    )
+                    # Exhaust the stream so discovered_count is still reported.
+                    for _document in discovered:
+                        pass
+                    _log_summary(logger, summary)
+                    return summary
+                raise
+
+            try:
+                if options.dry_run:
+                    self._run_dry_with_repository(
+                        repository=repository,
+                        discovered=discovered,
+                        options=options,
+                        rerun_scope=rerun_scope,
+                        summary=summary,
+                        logger=logger,
+                    )
+                else:
+                    self._run_with_repository(
+                        repository=repository,
+                        batch_repository=batch_repository,
+                        discovered=discovered,
+                        options=options,
+                        rerun_scope=rerun_scope,
+                        dispatch_mode=effective_dispatch_mode,
+                        dispatch_scheduler=dispatch_scheduler,
+                        summary=summary,
+                        logger=logger,
+                    )
+            finally:
+                if batch_repository is not None:
+                    batch_repository.close()
+                repository.close()
+
+            _log_summary(logger, summary)
+            return summary
         finally:
-            if batch_repository is not None:
-                batch_repository.close()
-            repository.close()
+            logger.close()
 
-        _log_summary(logger, summary)
-        return summary
+    def _build_logger(self, *, run_id: str, log_level: str) -> JsonlPipelineLogger:
+        return JsonlPipelineLogger(
+            run_id=run_id,
+            log_dir=_default_log_dir(self.config.config_path),
+            log_level=log_level,
+            flush_bytes=self.config.pipeline.log_flush_bytes,
+            flush_interval_seconds=self.config.pipeline.log_flush_interval_seconds,
+            rotate_max_bytes=self.config.pipeline.log_rotate_max_bytes,
+        )
 
     def _run_dry(
         self,
         *,
-        discovered: list[DiscoveredDocument],
+        discovered: Iterable[DiscoveredDocument],
         summary: PipelineRunSummary,
         logger: JsonlPipelineLogger,
     ) -> None:
@@ -373,7 +460,7 @@ class AnnotationPipeline:
         self,
         *,
         repository: MongoDocumentRepository,
-        discovered: list[DiscoveredDocument],
+        discovered: Iterable[DiscoveredDocument],
         options: PipelineRunOptions,
         rerun_scope: RerunScope | None,
         summary: PipelineRunSummary,
@@ -410,12 +497,13 @@ class AnnotationPipeline:
         *,
         repository: MongoDocumentRepository,
         batch_repository: MongoBatchStateRepository | None,
-        discovered: list[DiscoveredDocument],
+        discovered: Iterable[DiscoveredDocument],
         options: PipelineRunOptions,
         rerun_scope: RerunScope | None,
         dispatch_mode: LlmDispatchMode,
         summary: PipelineRunSummary,
         logger: JsonlPipelineLogger,
+        dispatch_scheduler: AdaptiveDispatchScheduler | None = None,
     ) -> None:
         for document in discovered:
             doc_id = document.relative_path.as_posix()
@@ -477,6 +565,7 @@ class AnnotationPipeline:
                 force_classifier_fallback=options.force_classifier_fallback,
                 logger=logger,
                 dispatch_mode=dispatch_mode,
+                dispatch_scheduler=dispatch_scheduler,
             )
             _record_outcome(summary, outcome)
 
@@ -492,9 +581,10 @@ class AnnotationPipeline:
         force_classifier_fallback: bool,
         logger: JsonlPipelineLogger,
         dispatch_mode: LlmDispatchMode,
+        dispatch_scheduler: AdaptiveDispatchScheduler | None = None,
     ) -> str:
         try:
-            read_result = self.reader.read(document)
+            read_result = self._read_document(document)
             repository.apply_read_result(doc_id=doc_id, read_result=read_result)
         except (ReadDocumentError, RepositoryWriteError) as error:
             error_code = getattr(error, "code", "repository_write_error")
@@ -517,10 +607,7 @@ class AnnotationPipeline:
             return "failed"
 
         try:
-            parse_result = self.parser.parse(
-                file_name=document.file_name,
-                normalized_text=read_result.normalized_text,
-            )
+            parse_result = self._parse_document(document, read_result)
             repository.apply_parse_result(
                 doc_id=doc_id,
                 parse_result=parse_result,
@@ -546,10 +633,10 @@ class AnnotationPipeline:
             return "failed"
 
         try:
-            canonical_result = build_canonical_text(
-                file_name=document.file_name,
-                parse_result=parse_result,
-                read_result=read_result,
+            canonical_result = self._canonicalize_document(
+                document,
+                read_result,
+                parse_result,
             )
         except CanonicalizeDocumentError as error:
             repository.mark_failed(
@@ -569,12 +656,17 @@ class AnnotationPipeline:
             )
             return "failed"
 
-        language_result = self.language_detector.detect(
-            normalized_text=canonical_result.canonical_text,
-            doc_metadata=parse_result.doc_metadata,
-            relative_path=doc_id,
+        text_view = TextView(
+            canonical_result.canonical_text,
             title=parse_result.title or read_result.title,
         )
+        language_result = self._detect_document_language(
+            document,
+            read_result,
+            parse_result,
+            canonical_result,
+            text_view,
+        )
         try:
             repository.apply_canonical_result(
                 doc_id=doc_id,
@@ -598,14 +690,12 @@ class AnnotationPipeline:
                 error_message=error.message,
             )
             return "failed"
-        classification = self.router.route(
-            RoutingInput(
-                relative_path=doc_id,
-                file_name=document.file_name,
-                title=parse_result.title or read_result.title,
-                metadata=parse_result.doc_metadata,
-                normalized_text=canonical_result.canonical_text,
-            )
+        classification = self._route_document(
+            document,
+            read_result,
+            parse_result,
+            canonical_result,
+            text_view,
         )
         if language_result.language_code == "und":
             if not classification.annotatable:
@@ -790,6 +880,21 @@ class AnnotationPipeline:
             resolved_prompt=resolved_prompt,
             force_packed_input=True,
         )
+        if dispatch_mode == LlmDispatchMode.ADAPTIVE:
+            if dispatch_scheduler is None:
+                raise ValueError("dispatch_scheduler is required for adaptive mode.")
+            decision = dispatch_scheduler.decide(analysis_request)
+            _log(
+                logger,
+                run_id=run_id,
+                doc_id=doc_id,
+                stage="annotate_original",
+                event="dispatch_decided",
+                level="info",
+                message=f"Adaptive dispatch chose {decision.mode.value}.",
+                details=decision.to_log_details(),
+            )
+            dispatch_mode = decision.mode
         if dispatch_mode == LlmDispatchMode.BATCH_ANALYSIS:
             if batch_repository is None:
                 raise ValueError("batch_repository is required for batch_analysis mode.")
@@ -1184,6 +1289,106 @@ class AnnotationPipeline:
         )
         return "completed"
 
+    @contextmanager
+    def _reusing_document_preparation(self) -> Iterator[None]:
+        """Memoise document preparation until the block exits."""
+        self._preparation_cache = _DocumentPreparationCache()
+        try:
+            yield
+        finally:
+            self._preparation_cache = None
+
+    def _prepare_stage(
+        self,
+        document: DiscoveredDocument,
+        stage: str,
+        compute: Callable[[], _CachedValue],
+    ) -> _CachedValue:
+        cache = self._preparation_cache
+        if cache is None:
+            return compute()
+        return cache.get_or_compute(document, stage, compute)
+
+    def _read_document(self, document: DiscoveredDocument) -> ReadDocumentResult:
+        return self._prepare_stage(
+            document,
+            "read",
+            lambda: self.reader.read(document),
+        )
+
+    def _parse_document(
+        self,
+        document: DiscoveredDocument,
+        read_result: ReadDocumentResult,
+    ) -> ParsedMarkdownDocument:
+        return self._prepare_stage(
+            document,
+            "parse",
+            lambda: self.parser.parse(
+                file_name=document.file_name,
+                normalized_text=read_result.normalized_text,
+            ),
+        )
+
+    def _canonicalize_document(
+        self,
+        document: DiscoveredDocument,
+        read_result: ReadDocumentResult,
+        parse_result: ParsedMarkdownDocument,
+    ) -> CanonicalTextResult:
+        return self._prepare_stage(
+            document,
+            "canonicalize",
+            lambda: build_canonical_text(
+                file_name=document.file_name,
+                parse_result=parse_result,
+                read_result=read_result,
+            ),
+        )
+
+    def _detect_document_language(
+        self,
+        document: DiscoveredDocument,
+        read_result: ReadDocumentResult,
+        parse_result: ParsedMarkdownDocument,
+        canonical_result: CanonicalTextResult,
+        text_view: TextView,
+    ) -> LanguageDetectionResult:
+        return self._prepare_stage(
+            document,
+            "language",
+            lambda: self.language_detector.detect(
+                normalized_text=canonical_result.canonical_text,
+                doc_metadata=parse_result.doc_metadata,
+                relative_path=document.relative_path.as_posix(),
+                title=parse_result.title or read_result.title,
+                text_view=text_view,
+            ),
+        )
+
+    def _route_document(
+        self,
+        document: DiscoveredDocument,
+        read_result: ReadDocumentResult,
+        parse_result: ParsedMarkdownDocument,
+        canonical_result: CanonicalTextResult,
+        text_view: TextView,
+    ) -> ClassificationResult:
+        return self._prepare_stage(
+            document,
+            "route",
+            lambda: self.router.route(
+                RoutingInput(
+                    relative_path=document.relative_path.as_posix(),
+                    file_name=document.file_name,
+                    title=parse_result.title or read_result.title,
+                    metadata=parse_result.doc_metadata,
+                    normalized_text=canonical_result.canonical_text,
+                    text_view=text_view,
+                )
+            ),
+        )
+
     def _prepare_annotatable_document(
         self,
         *,
@@ -1191,30 +1396,30 @@ class AnnotationPipeline:
         run_id: str,
         allow_classifier_fallback: bool,
     ) -> PreparedAnnotatableDocument | None:
-        read_result = self.reader.read(document)
-        parse_result = self.parser.parse(
-            file_name=document.file_name,
-            normalized_text=read_result.normalized_text,
-        )
-        canonical_result = build_canonical_text(
-            file_name=document.file_name,
-            parse_result=parse_result,
-            read_result=read_result,
+        read_result = self._read_document(document)
+        parse_result = self._parse_document(document, read_result)
+        canonical_result = self._canonicalize_document(
+            document,
+            read_result,
+            parse_result,
         )
-        language_result = self.language_detector.detect(
-            normalized_text=canonical_result.canonical_text,
-            doc_metadata=parse_result.doc_metadata,
-            relative_path=document.relative_path.as_posix(),
+        text_view = TextView(
+            canonical_result.canonical_text,
             title=parse_result.title or read_result.title,
         )
-        classification = self.router.route(
-            RoutingInput(
-                relative_path=document.relative_path.as_posix(),
-                file_name=document.file_name,
-                title=parse_result.title or read_result.title,
-                metadata=parse_result.doc_metadata,
-                normalized_text=canonical_result.canonical_text,
-            )
+        language_result = self._detect_document_language(
+            document,
+            read_result,
+            parse_result,
+            canonical_result,
+            text_view,
+        )
+        classification = self._route_document(
+            document,
+            read_result,
+            parse_result,
+            canonical_result,
+            text_view,
         )
         if language_result.language_code == "und":
             if not classification.annotatable:
@@ -1843,6 +2048,40 @@ class AnnotationPipeline:
             return configured_mode
         return LlmDispatchMode(str(configured_mode))
 
+    def _build_dispatch_scheduler(
+        self,
+        *,
+        batch_repository: MongoBatchStateRepository | None,
+        options: PipelineRunOptions,
+    ) -> AdaptiveDispatchScheduler:
+        if batch_repository is None:
+            raise ValueError("batch_repository is required for adaptive mode.")
+        settings = self.config.pipeline
+        observed_turnaround = batch_repository.get_observed_turnaround_seconds(
+            sample_size=ADAPTIVE_TURNAROUND_SAMPLE_SIZE
+        )
+        # Reruns are operator-driven fixes, so they get the short latency budget.
+        max_batch_latency_seconds = (
+            settings.adaptive_dispatch_rerun_max_batch_latency_seconds
+            if options.mode is PipelineMode.RERUN
+            else settings.adaptive_dispatch_max_batch_latency_seconds
+        )
+        return AdaptiveDispatchScheduler(
+            input_cost_per_1k_tokens_usd=self.config.model.input_cost_per_1k_tokens_usd,
+            output_cost_per_1k_tokens_usd=self.config.model.output_cost_per_1k_tokens_usd,
+            batch_discount_factor=settings.batch_discount_factor,
+            batch_max_requests=settings.batch_max_requests,
+            batch_inflight_jobs_limit=settings.batch_inflight_jobs_limit,
+            turnaround_seconds=(
+                observed_turnaround
+                if observed_turnaround is not None
+                else settings.adaptive_dispatch_default_turnaround_seconds
+            ),
+            queue_depth=batch_repository.count_queued_items(),
+            max_batch_latency_seconds=max_batch_latency_seconds,
+            min_batch_savings_usd=settings.adaptive_dispatch_min_batch_savings_usd,
+        )
+
     def _select_document_action(
         self,
         *,
@@ -2402,6 +2641,15 @@ def _log_failure(
     )
 
 
+def _count_discovered(
+    documents: Iterable[DiscoveredDocument],
+    summary: PipelineRunSummary,
+) -> Iterator[DiscoveredDocument]:
+    for document in documents:
+        summary.discovered_count += 1
+        yield document
+
+
 def _log_summary(logger: JsonlPipelineLogger, summary: PipelineRunSummary) -> None:
     _log(
         logger,
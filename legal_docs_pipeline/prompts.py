@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -29,9 +30,23 @@ class ResolvedPrompt:
     prompt_text: str
 
 
+_PromptFileSignature = tuple[tuple[str, int, int], ...]
+
+
 class FilePromptResolver:
+    """Resolve prompt-pack files into rendered, hashed system prompts.
+
+    Resolved prompts are cached per (prompt, language, schema instruction)
+    together with the ``mtime_ns``/size of their source files, so repeat
+    lookups only stat the files and re-render when one of them changes.
+    """
+
     def __init__(self, prompt_dir: Path | str) -> None:
         self.prompt_dir = Path(prompt_dir).expanduser().resolve()
+        self._resolved_cache: dict[
+            tuple[str, str | None, str],
+            tuple[_PromptFileSignature, ResolvedPrompt],
+        ] = {}
 
     def validate_prompt_pack(self) -> None:
         self._read_prompt_file(BASE_PROMPT_FILENAME)
@@ -54,27 +69,36 @@ class FilePromptResolver:
                 f"Prompt profile {prompt_profile.value!r} is not annotatable."
             )
 
-        base_path = self.prompt_dir / BASE_PROMPT_FILENAME
-        addon_path = self.prompt_dir / PROMPT_PROFILE_TO_FILENAME[prompt_profile]
-        prompt_text = self._render_prompt(
-            "\n\n".join(
-                [
-                    self._read_prompt_file(BASE_PROMPT_FILENAME),
-                    self._read_prompt_file(addon_path.name),
-                    output_schema_instruction,
-                ]
-            ),
-            variables={
-                "SOURCE_LANGUAGE_CODE": source_language_code,
-                "OUTPUT_LANGUAGE": source_language_code,
-            },
-        )
-        prompt_paths = (base_path, addon_path)
-        return ResolvedPrompt(
-            prompt_name=prompt_profile.value,
-            prompt_paths=prompt_paths,
-            prompt_hash=hash_prompt_text(prompt_text),
-            prompt_text=prompt_text,
+        addon_file_name = PROMPT_PROFILE_TO_FILENAME[prompt_profile]
+
+        def build() -> ResolvedPrompt:
+            prompt_text = self._render_prompt(
+                "\n\n".join(
+                    [
+                        self._read_prompt_file(BASE_PROMPT_FILENAME),
+                        self._read_prompt_file(addon_file_name),
+                        output_schema_instruction,
+                    ]
+                ),
+                variables={
+                    "SOURCE_LANGUAGE_CODE": source_language_code,
+                    "OUTPUT_LANGUAGE": source_language_code,
+                },
+            )
+            return ResolvedPrompt(
+                prompt_name=prompt_profile.value,
+                prompt_paths=(
+                    self.prompt_dir / BASE_PROMPT_FILENAME,
+                    self.prompt_dir / addon_file_name,
+                ),
+                prompt_hash=hash_prompt_text(prompt_text),
+                prompt_text=prompt_text,
+            )
+
+        return self._resolve_cached(
+            cache_key=(prompt_profile.value, source_language_code, output_schema_instruction),
+            file_names=(BASE_PROMPT_FILENAME, addon_file_name),
+            build=build,
         )
 
     def resolve_analysis_repair_prompt(
@@ -83,24 +107,30 @@ class FilePromptResolver:
         source_language_code: str,
         output_schema_instruction: str = OUTPUT_SCHEMA_INSTRUCTION,
     ) -> ResolvedPrompt:
-        prompt_path = self.prompt_dir / REPAIR_ANALYSIS_PROMPT_FILENAME
-        prompt_text = self._render_prompt(
-            "\n\n".join(
-                [
-                    self._read_prompt_file(REPAIR_ANALYSIS_PROMPT_FILENAME),
-                    output_schema_instruction,
-                ]
-            ),
-            variables={
-                "SOURCE_LANGUAGE_CODE": source_language_code,
-                "OUTPUT_LANGUAGE": source_language_code,
-            },
-        )
-        return ResolvedPrompt(
-            prompt_name="repair_analysis",
-            prompt_paths=(prompt_path,),
-            prompt_hash=hash_prompt_text(prompt_text),
-            prompt_text=prompt_text,
+        def build() -> ResolvedPrompt:
+            prompt_text = self._render_prompt(
+                "\n\n".join(
+                    [
+                        self._read_prompt_file(REPAIR_ANALYSIS_PROMPT_FILENAME),
+                        output_schema_instruction,
+                    ]
+                ),
+                variables={
+                    "SOURCE_LANGUAGE_CODE": source_language_code,
+                    "OUTPUT_LANGUAGE": source_language_code,
+                },
+            )
+            return ResolvedPrompt(
+                prompt_name="repair_analysis",
+                prompt_paths=(self.prompt_dir / REPAIR_ANALYSIS_PROMPT_FILENAME,),
+                prompt_hash=hash_prompt_text(prompt_text),
+                prompt_text=prompt_text,
+            )
+
+        return self._resolve_cached(
+            cache_key=("repair_analysis", source_language_code, output_schema_instruction),
+            file_names=(REPAIR_ANALYSIS_PROMPT_FILENAME,),
+            build=build,
         )
 
     def resolve_translation_prompt(
@@ -108,21 +138,27 @@ class FilePromptResolver:
         *,
         output_schema_instruction: str = OUTPUT_SCHEMA_INSTRUCTION,
     ) -> ResolvedPrompt:
-        prompt_path = self.prompt_dir / TRANSLATION_PROMPT_FILENAME
-        prompt_text = self._render_prompt(
-            "\n\n".join(
-                [
-                    self._read_prompt_file(TRANSLATION_PROMPT_FILENAME),
-                    output_schema_instruction,
-                ]
-            ),
-            variables={},
-        )
-        return ResolvedPrompt(
-            prompt_name="translate_to_ru",
-            prompt_paths=(prompt_path,),
-            prompt_hash=hash_prompt_text(prompt_text),
-            prompt_text=prompt_text,
+        def build() -> ResolvedPrompt:
+            prompt_text = self._render_prompt(
+                "\n\n".join(
+                    [
+                        self._read_prompt_file(TRANSLATION_PROMPT_FILENAME),
+                        output_schema_instruction,
+                    ]
+                ),
+                variables={},
+            )
+            return ResolvedPrompt(
+                prompt_name="translate_to_ru",
+                prompt_paths=(self.prompt_dir / TRANSLATION_PROMPT_FILENAME,),
+                prompt_hash=hash_prompt_text(prompt_text),
+                prompt_text=prompt_text,
+            )
+
+        return self._resolve_cached(
+            cache_key=("translate_to_ru", None, output_schema_instruction),
+            file_names=(TRANSLATION_PROMPT_FILENAME,),
+            build=build,
         )
 
     def resolve_translation_repair_prompt(
@@ -130,23 +166,52 @@ class FilePromptResolver:
         *,
         output_schema_instruction: str = OUTPUT_SCHEMA_INSTRUCTION,
     ) -> ResolvedPrompt:
-        prompt_path = self.prompt_dir / REPAIR_TRANSLATION_PROMPT_FILENAME
-        prompt_text = self._render_prompt(
-            "\n\n".join(
-                [
-                    self._read_prompt_file(REPAIR_TRANSLATION_PROMPT_FILENAME),
-                    output_schema_instruction,
-                ]
-            ),
-            variables={},
-        )
-        return ResolvedPrompt(
-            prompt_name="repair_translate_to_ru",
-            prompt_paths=(prompt_path,),
-            prompt_hash=hash_prompt_text(prompt_text),
-            prompt_text=prompt_text,
+        def build() -> ResolvedPrompt:
+            prompt_text = self._render_prompt(
+                "\n\n".join(
+                    [
+                        self._read_prompt_file(REPAIR_TRANSLATION_PROMPT_FILENAME),
+                        output_schema_instruction,
+                    ]
+                ),
+                variables={},
+            )
+            return ResolvedPrompt(
+                prompt_name="repair_translate_to_ru",
+                prompt_paths=(self.prompt_dir / REPAIR_TRANSLATION_PROMPT_FILENAME,),
+                prompt_hash=hash_prompt_text(prompt_text),
+                prompt_text=prompt_text,
+            )
+
+        return self._resolve_cached(
+            cache_key=("repair_translate_to_ru", None, output_schema_instruction),
+            file_names=(REPAIR_TRANSLATION_PROMPT_FILENAME,),
+            build=build,
         )
 
+    def _resolve_cached(
+        self,
+        *,
+        cache_key: tuple[str, str | None, str],
+        file_names: tuple[str, ...],
+        build: Callable[[], ResolvedPrompt],
+    ) -> ResolvedPrompt:
+        signature = tuple(self._stat_prompt_file(file_name) for file_name in file_names)
+        cached = self._resolved_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        resolved = build()
+        self._resolved_cache[cache_key] = (signature, resolved)
+        return resolved
+
+    def _stat_prompt_file(self, file_name: str) -> tuple[str, int, int]:
+        prompt_path = self.prompt_dir / file_name
+        try:
+            stat_result = prompt_path.stat()
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from error
+        return file_name, stat_result.st_mtime_ns, stat_result.st_size
+
     def _read_prompt_file(self, file_name: str) -> str:
         prompt_path = self.prompt_dir / file_name
         if not prompt_path.exists():
@@ -10,11 +10,18 @@ import re
 from .constants import DEFAULT_MAX_FILE_SIZE_BYTES
 from .scanner import DiscoveredDocument
 
-_HTML_TAG_PATTERNS = (
-    re.compile(r"<br\s*/?>", re.IGNORECASE),
-    re.compile(r"</?div[^>]*>", re.IGNORECASE),
-    re.compile(r"</?span[^>]*>", re.IGNORECASE),
+_HTML_TAG_REPLACEMENTS = (
+    (re.compile(r"<br\s*/?>", re.IGNORECASE), "\n"),
+    (re.compile(r"</?div[^>]*>", re.IGNORECASE), ""),
+    (re.compile(r"</?span[^>]*>", re.IGNORECASE), ""),
 )
+_STYLE_LINE_RE = re.compile(r"^\s*style=\"[^\"]*\"\s*/?>\s*$", re.MULTILINE)
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+# Equivalent to counting r"\b\w+\b" matches: greedy \w+ runs always start and
+# end on word boundaries.
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+# Line boundaries recognised by str.splitlines() besides "\n" and "\r".
+_EXTRA_LINE_BOUNDARY_RE = re.compile("[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
 _NON_TITLE_PATTERNS = (
     re.compile(r"^#+\s*#+\s*page\s+\d+$", re.IGNORECASE),
     re.compile(r"^page\s+\d+$", re.IGNORECASE),
@@ -77,7 +84,7 @@ class MarkdownReader:
             ) from error
 
         raw_markdown = _normalize_newlines(decoded.lstrip("\ufeff"))
-        normalized_text = soft_normalize_text(raw_markdown)
+        normalized_text, text_stats = soft_normalize_text_with_stats(raw_markdown)
         normalized_text_sha256 = hashlib.sha256(
             normalized_text.encode("utf-8")
         ).hexdigest()
@@ -86,19 +93,64 @@ class MarkdownReader:
             normalized_text=normalized_text,
             normalized_text_sha256=normalized_text_sha256,
             title=extract_title_from_text(normalized_text),
-            text_stats=_build_text_stats(normalized_text),
+            text_stats=text_stats,
         )
 
 
 def soft_normalize_text(text: str) -> str:
+    return soft_normalize_text_with_stats(text)[0]
+
+
+def soft_normalize_text_with_stats(text: str) -> tuple[str, TextStats]:
     normalized = html.unescape(text).replace("\xa0", " ")
     normalized = _normalize_newlines(normalized)
-    for pattern in _HTML_TAG_PATTERNS:
-        normalized = pattern.sub("" if pattern.pattern != r"<br\s*/?>" else "\n", normalized)
-    normalized = re.sub(r"^\s*style=\"[^\"]*\"\s*/?>\s*$", "", normalized, flags=re.MULTILINE)
-    normalized = re.sub(r"\n{3,}", "\n\n", normalized)
-    normalized = "\n".join(line.rstrip() for line in normalized.splitlines())
-    return normalized.strip()
+    if "<" in normalized:
+        for pattern, replacement in _HTML_TAG_REPLACEMENTS:
+            normalized = pattern.sub(replacement, normalized)
+    if 'style="' in normalized:
+        normalized = _STYLE_LINE_RE.sub("", normalized)
+    if has_extra_line_boundaries(normalized):
+        normalized = _MULTI_NEWLINE_RE.sub("\n\n", normalized)
+        normalized = "\n".join(line.rstrip() for line in normalized.splitlines())
+        normalized = normalized.strip()
+        return normalized, build_text_stats(normalized)
+    return fold_text_lines(normalized, collapse_whitespace_only_lines=False)
+
+
+def fold_text_lines(
+    text: str,
+    *,
+    collapse_whitespace_only_lines: bool,
+) -> tuple[str, TextStats]:
+    """Right-strip lines, collapse blank-line runs and strip in a single sweep.
+
+    The caller must ensure ``text`` uses ``"\n"`` as its only line boundary.
+    Runs of two or more blank lines become one blank line; a line counts as
+    blank when it is empty before right-stripping, or after it when
+    ``collapse_whitespace_only_lines`` is set. This matches collapsing
+    ``\n{3,}`` before or after the per-line ``rstrip`` respectively.
+    """
+    kept_lines: list[str] = []
+    previous_blank = False
+    for line in text.split("\n"):
+        is_blank = not line
+        line = line.rstrip()
+        if collapse_whitespace_only_lines:
+            is_blank = not line
+        if is_blank and previous_blank:
+            continue
+        previous_blank = is_blank
+        kept_lines.append(line)
+    folded = "\n".join(kept_lines).strip()
+    return folded, TextStats(
+        chars=len(folded),
+        lines=folded.count("\n") + 1 if folded else 0,
+        words=_count_words(folded),
+    )
+
+
+def has_extra_line_boundaries(text: str) -> bool:
+    return _EXTRA_LINE_BOUNDARY_RE.search(text) is not None
 
 
 def extract_title_from_text(text: str) -> str | None:
@@ -126,13 +178,26 @@ def _slice_after_content_heading(text: str) -> str:
     return text
 
 
-def _build_text_stats(text: str) -> TextStats:
+def build_text_stats(text: str) -> TextStats:
+    if has_extra_line_boundaries(text) or "\r" in text:
+        line_count = len(text.splitlines())
+    elif not text:
+        line_count = 0
+    else:
+        line_count = text.count("\n") + (0 if text.endswith("\n") else 1)
     return TextStats(
         chars=len(text),
-        lines=len(text.splitlines()),
-        words=len(re.findall(r"\b\w+\b", text, flags=re.UNICODE)),
+        lines=line_count,
+        words=_count_words(text),
     )
 
 
+def _count_words(text: str) -> int:
+    # subn avoids materialising a list with every matched word.
+    return _WORD_RE.subn("", text)[1]
+
+
 def _normalize_newlines(text: str) -> str:
+    if "\r" not in text:
+        return text
     return text.replace("\r\n", "\n").replace("\r", "\n")
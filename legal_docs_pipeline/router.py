@@ -7,6 +7,7 @@ from typing import Any, Protocol
 
 from .constants import DocumentFamily, PromptProfile
 from .schemas import ClassificationResult
+from .text_view import TextView
 
 _NORMATIVE_SOURCE_SYSTEMS = {"eli_pl", "isap_pl", "lex_pl", "eurlex_eu"}
 _JUDICIAL_SOURCE_SYSTEMS = {"sn_pl", "saos_pl", "courts_pl", "curia_eu"}
@@ -95,6 +96,53 @@ _COMMENTARY_TEXT_MARKERS = (
     "analysis",
     "guide",
 )
+_LEADING_BODY_WINDOW_CHARS = 8192
+_CONSUMER_ADMIN_TYPE_TEXT_MARKERS = (
+    "decyzja",
+    "guidance",
+)
+
+
+class MarkerScan:
+    """Per-text marker hits shared by every routing rule.
+
+    Each distinct marker is searched at most once, on first use, with
+    ``str.find``; rules then reuse the remembered first position instead of
+    rescanning the text (or title + text concatenations) themselves.
+    """
+
+    def __init__(self, *, text: str) -> None:
+        self._text = text
+        self._first_positions: dict[str, int] = {}
+
+    def position(self, marker: str) -> int:
+        position = self._first_positions.get(marker)
+        if position is None:
+            position = self._text.find(marker)
+            self._first_positions[marker] = position
+        return position
+
+    def contains(self, marker: str, *, start: int = 0) -> bool:
+        position = self.position(marker)
+        if position == -1:
+            return False
+        if position >= start:
+            return True
+        return self._text.find(marker, start) != -1
+
+    def contains_any(self, markers: tuple[str, ...], *, start: int = 0) -> bool:
+        return any(self.contains(marker, start=start) for marker in markers)
+
+    def collect(
+        self,
+        target: list[str],
+        markers: tuple[str, ...],
+        *,
+        start: int = 0,
+    ) -> None:
+        for marker in markers:
+            if marker not in target and self.contains(marker, start=start):
+                target.append(marker)
 
 
 @dataclass(frozen=True, slots=True)
@@ -104,6 +152,7 @@ class RoutingInput:
     title: str | None
     metadata: dict[str, Any]
     normalized_text: str
+    text_view: TextView | None = None
 
 
 class DocumentRouter(Protocol):
@@ -116,10 +165,12 @@ class RuleBasedDocumentRouter:
         self._router_version = router_version
 
     def route(self, payload: RoutingInput) -> ClassificationResult:
-        title = (payload.title or "").strip()
+        text_view = payload.text_view or TextView(
+            payload.normalized_text,
+            title=payload.title,
+        )
         lowered_path = payload.relative_path.lower()
-        lowered_title = title.lower()
-        lowered_text = payload.normalized_text.lower()
+        lowered_title = text_view.lowered_title
         source_system = str(
             payload.metadata.get("original_source_system")
             or payload.metadata.get("resolved_source_system")
@@ -143,11 +194,14 @@ class RuleBasedDocumentRouter:
                 skip_reason="service_readme",
             )
 
+        lowered_text = text_view.lowered
+        text_markers = MarkerScan(text=lowered_text)
         if _match_discovery(
             signals,
             lowered_path,
             lowered_title,
             lowered_text,
+            text_markers,
             source_system,
         ):
             return _build_result(
@@ -160,9 +214,10 @@ class RuleBasedDocumentRouter:
                 document_type_code="discovery_page",
             )
 
-        if source_system in _CONSUMER_ADMIN_SOURCE_SYSTEMS or _contains_any(
-            lowered_title + "\n" + lowered_text,
-            _CONSUMER_ADMIN_MARKERS,
+        if (
+            source_system in _CONSUMER_ADMIN_SOURCE_SYSTEMS
+            or _contains_any(lowered_title, _CONSUMER_ADMIN_MARKERS)
+            or text_markers.contains_any(_CONSUMER_ADMIN_MARKERS)
         ):
             signals["matched_rules"].append("consumer_admin")
             return _build_result(
@@ -174,7 +229,7 @@ class RuleBasedDocumentRouter:
                 signals=signals,
                 document_type_code=_infer_consumer_admin_type_code(
                     lowered_title=lowered_title,
-                    lowered_text=lowered_text,
+                    text_markers=text_markers,
                 ),
             )
 
@@ -187,11 +242,7 @@ class RuleBasedDocumentRouter:
                 lowered_title,
                 _NORMATIVE_TITLE_MARKERS,
             )
-            _collect_matches(
-                signals["text_markers"],
-                lowered_text,
-                _NORMATIVE_TEXT_MARKERS,
-            )
+            text_markers.collect(signals["text_markers"], _NORMATIVE_TEXT_MARKERS)
             signals["matched_rules"].append("normative_act")
             return _build_result(
                 family=DocumentFamily.NORMATIVE_ACT,
@@ -202,25 +253,27 @@ class RuleBasedDocumentRouter:
                 signals=signals,
                 document_type_code=_infer_normative_type_code(
                     lowered_title=lowered_title,
-                    lowered_text=lowered_text,
+                    text_markers=text_markers,
                     source_system=source_system,
                 ),
             )
 
-        if source_system in _JUDICIAL_SOURCE_SYSTEMS or _contains_any(
-            lowered_title + "\n" + lowered_text,
-            _JUDICIAL_TITLE_MARKERS + _JUDICIAL_TEXT_MARKERS,
+        if (
+            source_system in _JUDICIAL_SOURCE_SYSTEMS
+            or _contains_any(
+                lowered_title,
+                _JUDICIAL_TITLE_MARKERS + _JUDICIAL_TEXT_MARKERS,
+            )
+            or text_markers.contains_any(
+                _JUDICIAL_TITLE_MARKERS + _JUDICIAL_TEXT_MARKERS
+            )
         ):
             _collect_matches(
                 signals["title_markers"],
                 lowered_title,
                 _JUDICIAL_TITLE_MARKERS,
             )
-            _collect_matches(
-                signals["text_markers"],
-                lowered_text,
-                _JUDICIAL_TEXT_MARKERS,
-            )
+            text_markers.collect(signals["text_markers"], _JUDICIAL_TEXT_MARKERS)
             signals["matched_rules"].append("judicial_decision")
             return _build_result(
                 family=DocumentFamily.JUDICIAL_DECISION,
@@ -240,7 +293,7 @@ class RuleBasedDocumentRouter:
             metadata=payload.metadata,
             lowered_path=lowered_path,
             lowered_title=lowered_title,
-            lowered_text=lowered_text,
+            text_markers=text_markers,
             signals=signals,
         ):
             signals["matched_rules"].append("commentary_article")
@@ -322,18 +375,26 @@ def _match_discovery(
     lowered_path: str,
     lowered_title: str,
     lowered_text: str,
+    text_markers: MarkerScan,
     source_system: str,
 ) -> bool:
     discovery_path = "discovery" in lowered_path or "reference" in lowered_path
     if discovery_path:
         signals["folder_signals"].append("discovery_path")
-    content_text = _extract_content_text(lowered_text)
+    content_start = _content_start_index(lowered_text)
     _collect_matches(signals["title_markers"], lowered_title, _DISCOVERY_TITLE_MARKERS)
-    _collect_matches(signals["text_markers"], content_text, _DISCOVERY_TEXT_MARKERS)
+    text_markers.collect(
+        signals["text_markers"],
+        _DISCOVERY_TEXT_MARKERS,
+        start=content_start,
+    )
     explicit_discovery = discovery_path or bool(
         signals["title_markers"] or signals["text_markers"]
     )
-    url_count = content_text.count("http://") + content_text.count("https://")
+    url_count = lowered_text.count("http://", content_start) + lowered_text.count(
+        "https://",
+        content_start,
+    )
     if url_count >= 3:
         signals["text_markers"].append(f"content_url_count:{url_count}")
     if source_system in _LEGAL_SOURCE_SYSTEMS and not explicit_discovery:
@@ -341,18 +402,34 @@ def _match_discovery(
     return explicit_discovery or url_count >= 3
 
 
-def _extract_content_text(lowered_text: str) -> str:
+def _content_start_index(lowered_text: str) -> int:
     marker = "## content"
     content_index = lowered_text.find(marker)
     if content_index == -1:
-        return lowered_text
-    return lowered_text[content_index + len(marker) :].strip()
+        return 0
+    return content_index + len(marker)
 
 
 def _extract_leading_body_text(lowered_text: str, *, max_lines: int = 40) -> str:
-    content_text = _extract_content_text(lowered_text)
-    lines = [line.strip() for line in content_text.splitlines() if line.strip()]
-    return "\n".join(lines[:max_lines])
+    # Split a growing window after the content heading rather than the whole
+    # body: the 40 leading lines of a large EUR-Lex act are a tiny prefix.
+    content_start = _content_start_index(lowered_text)
+    window_chars = _LEADING_BODY_WINDOW_CHARS
+    while True:
+        window_end = content_start + window_chars
+        window_lines = lowered_text[content_start:window_end].splitlines()
+        lines: list[str] = []
+        for line_index, line in enumerate(window_lines):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            lines.append(stripped)
+            # The last line of a truncated window may continue past its end.
+            if len(lines) == max_lines and line_index + 1 < len(window_lines):
+                return "\n".join(lines)
+        if window_end >= len(lowered_text):
+            return "\n".join(lines[:max_lines])
+        window_chars *= 2
 
 
 def _is_commentary(
@@ -360,7 +437,7 @@ def _is_commentary(
     metadata: dict[str, Any],
     lowered_path: str,
     lowered_title: str,
-    lowered_text: str,
+    text_markers: MarkerScan,
     signals: dict[str, Any],
 ) -> bool:
     article_focus = str(metadata.get("article_focus") or "").strip()
@@ -374,11 +451,7 @@ def _is_commentary(
         lowered_title,
         _COMMENTARY_TITLE_MARKERS,
     )
-    _collect_matches(
-        signals["text_markers"],
-        lowered_text,
-        _COMMENTARY_TEXT_MARKERS,
-    )
+    text_markers.collect(signals["text_markers"], _COMMENTARY_TEXT_MARKERS)
     return bool(article_focus) or bool(
         signals["title_markers"] or signals["text_markers"]
     )
@@ -387,7 +460,7 @@ def _is_commentary(
 def _infer_normative_type_code(
     *,
     lowered_title: str,
-    lowered_text: str,
+    text_markers: MarkerScan,
     source_system: str,
 ) -> str | None:
     if "directive" in lowered_title or source_system == "eurlex_eu":
@@ -400,7 +473,7 @@ def _infer_normative_type_code(
         return "pl_regulation"
     if "kodeks" in lowered_title:
         return "pl_code"
-    if "ustawa" in lowered_title or "dz. u." in lowered_text:
+    if "ustawa" in lowered_title or text_markers.contains("dz. u."):
         return "pl_statute"
     if "excerpt" in lowered_title or "fragment" in lowered_title:
         return "normative_excerpt"
@@ -434,11 +507,11 @@ def _infer_judicial_type_code(
 def _infer_consumer_admin_type_code(
     *,
     lowered_title: str,
-    lowered_text: str,
+    text_markers: MarkerScan,
 ) -> str | None:
-    if "decyzja" in lowered_title or "decyzja" in lowered_text:
+    if "decyzja" in lowered_title or text_markers.contains("decyzja"):
         return "uokik_decision"
-    if "stanowisko" in lowered_title or "guidance" in lowered_text:
+    if "stanowisko" in lowered_title or text_markers.contains("guidance"):
         return "uokik_guidance"
     return "uokik_material"
 
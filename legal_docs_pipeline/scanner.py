@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path, PurePosixPath
-from typing import Protocol
+from typing import Any, Protocol
+
+from .constants import DEFAULT_SCAN_HASH_WORKERS, SCAN_HASH_CHUNK_BYTES
+
+SCAN_INDEX_VERSION = 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,6 +31,75 @@ class DiscoveredDocument:
     top_level_dir: str
 
 
+@dataclass(frozen=True, slots=True)
+class ScanIndexEntry:
+    size_bytes: int
+    mtime_ns: int
+    inode: int
+    sha256_hex: str
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        return (
+            self.size_bytes == stat_result.st_size
+            and self.mtime_ns == stat_result.st_mtime_ns
+            and self.inode == stat_result.st_ino
+        )
+
+
+class JsonScanIndex:
+    """Persistent sidecar mapping relative paths to their last hashed stat signature."""
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = index_path.expanduser().resolve()
+
+    def load(self, input_root: Path) -> dict[str, ScanIndexEntry]:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        if payload.get("version") != SCAN_INDEX_VERSION:
+            return {}
+        if payload.get("input_root") != input_root.as_posix():
+            return {}
+        raw_entries = payload.get("entries")
+        if not isinstance(raw_entries, dict):
+            return {}
+
+        entries: dict[str, ScanIndexEntry] = {}
+        for relative_path, raw_entry in raw_entries.items():
+            entry = _parse_scan_index_entry(raw_entry)
+            if entry is not None:
+                entries[relative_path] = entry
+        return entries
+
+    def save(self, input_root: Path, entries: dict[str, ScanIndexEntry]) -> None:
+        payload = {
+            "version": SCAN_INDEX_VERSION,
+            "input_root": input_root.as_posix(),
+            "entries": {
+                relative_path: {
+                    "size_bytes": entry.size_bytes,
+                    "mtime_ns": entry.mtime_ns,
+                    "inode": entry.inode,
+                    "sha256_hex": entry.sha256_hex,
+                }
+                for relative_path, entry in sorted(entries.items())
+            },
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer so concurrent saves never interleave one temp file.
+        temp_path = self.index_path.with_name(
+            f"{self.index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temp_path.write_text(
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, self.index_path)
+
+
 class Scanner(Protocol):
     def scan(
         self,
@@ -33,8 +113,35 @@ class Scanner(Protocol):
     ) -> list[DiscoveredDocument]:
         """Return documents in deterministic order."""
 
+    def iter_scan(
+        self,
+        input_root: Path,
+        *,
+        glob_pattern: str = "**/*.md",
+        ignore_hidden: bool = True,
+        only_doc_id: str | None = None,
+        from_relative_path: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[DiscoveredDocument]:
+        """Yield documents in deterministic order as soon as each one is hashed."""
+
 
 class DocumentScanner:
+    def __init__(
+        self,
+        *,
+        scan_index_path: Path | None = None,
+        strict_rehash: bool = False,
+        hash_workers: int = DEFAULT_SCAN_HASH_WORKERS,
+    ) -> None:
+        if hash_workers < 1:
+            raise ValueError("hash_workers must be a positive integer.")
+        self.scan_index = (
+            JsonScanIndex(scan_index_path) if scan_index_path is not None else None
+        )
+        self.strict_rehash = strict_rehash
+        self.hash_workers = hash_workers
+
     def scan(
         self,
         input_root: Path,
@@ -45,6 +152,27 @@ class DocumentScanner:
         from_relative_path: str | None = None,
         limit: int | None = None,
     ) -> list[DiscoveredDocument]:
+        return list(
+            self.iter_scan(
+                input_root,
+                glob_pattern=glob_pattern,
+                ignore_hidden=ignore_hidden,
+                only_doc_id=only_doc_id,
+                from_relative_path=from_relative_path,
+                limit=limit,
+            )
+        )
+
+    def iter_scan(
+        self,
+        input_root: Path,
+        *,
+        glob_pattern: str = "**/*.md",
+        ignore_hidden: bool = True,
+        only_doc_id: str | None = None,
+        from_relative_path: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[DiscoveredDocument]:
         input_root = input_root.expanduser().resolve()
         requested_doc_id = (
             PurePosixPath(only_doc_id).as_posix() if only_doc_id else None
@@ -55,13 +183,14 @@ class DocumentScanner:
             else None
         )
 
-        relative_paths = [
+        all_relative_paths = [
             PurePosixPath(path.relative_to(input_root).as_posix())
             for path in input_root.glob(glob_pattern)
             if path.is_file()
             and (not ignore_hidden or _is_allowed_relative_path(path.relative_to(input_root)))
         ]
-        relative_paths.sort(key=lambda path: path.as_posix())
+        all_relative_paths.sort(key=lambda path: path.as_posix())
+        relative_paths = all_relative_paths
 
         if requested_doc_id is not None:
             relative_paths = [
@@ -76,21 +205,98 @@ class DocumentScanner:
         if limit is not None:
             relative_paths = relative_paths[:limit]
 
-        return [
-            _build_discovered_document(input_root=input_root, relative_path=relative_path)
-            for relative_path in relative_paths
-        ]
+        index_entries = (
+            self.scan_index.load(input_root) if self.scan_index is not None else {}
+        )
+        previous_entries = {} if self.strict_rehash else dict(index_entries)
+
+        def _build(
+            relative_path: PurePosixPath,
+        ) -> tuple[DiscoveredDocument, ScanIndexEntry]:
+            return _build_discovered_document(
+                input_root=input_root,
+                relative_path=relative_path,
+                index_entry=previous_entries.get(relative_path.as_posix()),
+            )
+
+        try:
+            for document, index_entry in self._iter_built_documents(
+                relative_paths,
+                build=_build,
+            ):
+                index_entries[document.relative_path.as_posix()] = index_entry
+                yield document
+        finally:
+            # Single-document lookups (batch apply) only read the index: they
+            # may run concurrently, and a rewrite would race other writers.
+            if self.scan_index is not None and requested_doc_id is None:
+                known_doc_ids = {path.as_posix() for path in all_relative_paths}
+                self.scan_index.save(
+                    input_root,
+                    {
+                        doc_id: entry
+                        for doc_id, entry in index_entries.items()
+                        if doc_id in known_doc_ids
+                    },
+                )
+
+    def _iter_built_documents(
+        self,
+        relative_paths: list[PurePosixPath],
+        *,
+        build: Callable[
+            [PurePosixPath],
+            tuple[DiscoveredDocument, ScanIndexEntry],
+        ],
+    ) -> Iterator[tuple[DiscoveredDocument, ScanIndexEntry]]:
+        worker_count = min(self.hash_workers, len(relative_paths))
+        if worker_count <= 1:
+            for relative_path in relative_paths:
+                yield build(relative_path)
+            return
+
+        # Stat and hash run in a thread pool (hashlib releases the GIL on large
+        # buffers). A bounded window of in-flight futures is drained in sorted
+        # order, so callers see the first document as soon as it is hashed.
+        pending_paths = iter(relative_paths)
+        window_size = worker_count * 2
+        with ThreadPoolExecutor(
+            max_workers=worker_count,
+            thread_name_prefix="normadepo-scan",
+        ) as executor:
+            pending: deque[Future[tuple[DiscoveredDocument, ScanIndexEntry]]] = deque(
+                executor.submit(build, relative_path)
+                for relative_path in islice(pending_paths, window_size)
+            )
+            try:
+                while pending:
+                    built = pending.popleft().result()
+                    next_path = next(pending_paths, None)
+                    if next_path is not None:
+                        pending.append(executor.submit(build, next_path))
+                    yield built
+            finally:
+                for future in pending:
+                    future.cancel()
 
 
 def _build_discovered_document(
     *,
     input_root: Path,
     relative_path: PurePosixPath,
-) -> DiscoveredDocument:
+    index_entry: ScanIndexEntry | None = None,
+) -> tuple[DiscoveredDocument, ScanIndexEntry]:
     absolute_path = (input_root / Path(relative_path)).resolve()
     stat_result = absolute_path.stat()
     top_level_dir = relative_path.parts[0] if len(relative_path.parts) > 1 else ""
-    return DiscoveredDocument(
+    if index_entry is None or not index_entry.matches(stat_result):
+        index_entry = ScanIndexEntry(
+            size_bytes=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            inode=stat_result.st_ino,
+            sha256_hex=_compute_sha256(absolute_path),
+        )
+    document = DiscoveredDocument(
         absolute_path=absolute_path,
         relative_path=relative_path,
         file_name=absolute_path.name,
@@ -99,16 +305,31 @@ def _build_discovered_document(
             stat_result.st_mtime,
             tz=timezone.utc,
         ),
-        sha256_hex=_compute_sha256(absolute_path),
+        sha256_hex=index_entry.sha256_hex,
         top_level_dir=top_level_dir,
     )
+    return document, index_entry
+
+
+def _parse_scan_index_entry(raw_entry: Any) -> ScanIndexEntry | None:
+    if not isinstance(raw_entry, dict):
+        return None
+    try:
+        return ScanIndexEntry(
+            size_bytes=int(raw_entry["size_bytes"]),
+            mtime_ns=int(raw_entry["mtime_ns"]),
+            inode=int(raw_entry["inode"]),
+            sha256_hex=str(raw_entry["sha256_hex"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 def _compute_sha256(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as handle:
         while True:
-            chunk = handle.read(1024 * 1024)
+            chunk = handle.read(SCAN_HASH_CHUNK_BYTES)
             if not chunk:
                 break
             digest.update(chunk)
@@ -0,0 +1,43 @@
+"""Lazily lowered views over a document's normalized text."""
+
+from __future__ import annotations
+
+
+class TextView:
+    """Shared read-only view used by language detection and routing.
+
+    Lowercase copies are built on first request and cached: head windows
+    only lower the requested prefix, while the full lowered text is produced
+    at most once per document and only when a rule needs the whole body.
+    """
+
+    __slots__ = ("_lowered", "_lowered_heads", "_lowered_title", "text", "title")
+
+    def __init__(self, text: str, *, title: str | None = None) -> None:
+        self.text = text
+        self.title = title
+        self._lowered: str | None = None
+        self._lowered_heads: dict[int, str] = {}
+        self._lowered_title: str | None = None
+
+    @property
+    def lowered_title(self) -> str:
+        if self._lowered_title is None:
+            self._lowered_title = (self.title or "").strip().lower()
+        return self._lowered_title
+
+    @property
+    def lowered(self) -> str:
+        if self._lowered is None:
+            self._lowered = self.text.lower()
+        return self._lowered
+
+    def lowered_head(self, max_chars: int) -> str:
+        """Return ``text[:max_chars].lower()`` without lowering the whole text."""
+        if max_chars >= len(self.text):
+            return self.lowered
+        head = self._lowered_heads.get(max_chars)
+        if head is None:
+            head = self.text[:max_chars].lower()
+            self._lowered_heads[max_chars] = head
+        return head
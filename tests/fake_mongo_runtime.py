@@ -8,11 +8,51 @@ from typing import Any
 
 def _matches(row: dict[str, Any], query: dict[str, Any]) -> bool:
     for key, value in query.items():
-        if row.get(key) != value:
+        if _is_operator_expression(value):
+            if not _matches_operators(row.get(key), value):
+                return False
+        elif row.get(key) != value:
             return False
     return True
 
 
+def _is_operator_expression(value: Any) -> bool:
+    return (
+        isinstance(value, dict)
+        and bool(value)
+        and all(str(key).startswith("$") for key in value)
+    )
+
+
+def _matches_operators(actual: Any, expression: dict[str, Any]) -> bool:
+    for operator, operand in expression.items():
+        if operator == "$in":
+            if actual not in operand:
+                return False
+        elif operator == "$nin":
+            if actual in operand:
+                return False
+        elif operator == "$ne":
+            if actual == operand:
+                return False
+        else:
+            raise NotImplementedError(f"Unsupported query operator: {operator}")
+    return True
+
+
+def _sort_rows(
+    rows: list[dict[str, Any]],
+    sort: list[tuple[str, int]],
+) -> list[dict[str, Any]]:
+    ordered = list(rows)
+    for key, direction in reversed(sort):
+        ordered.sort(
+            key=lambda row: (_get_path(row, key) is not None, _get_path(row, key)),
+            reverse=direction < 0,
+        )
+    return ordered
+
+
 def _project_row(
     row: dict[str, Any],
     projection: dict[str, int] | None,
@@ -67,6 +107,15 @@ def _unset_path(row: dict[str, Any], path: str) -> None:
     current.pop(parts[-1], None)
 
 
+def _apply_update(row: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
+    updated = copy.deepcopy(row)
+    for key, value in update.get("$set", {}).items():
+        _set_path(updated, key, copy.deepcopy(value))
+    for key in update.get("$unset", {}):
+        _unset_path(updated, key)
+    return updated
+
+
 class FakeMongoCollection:
     def __init__(self, rows: list[dict[str, Any]] | None = None) -> None:
         self.rows = rows or []
@@ -76,13 +125,20 @@ class FakeMongoCollection:
         self,
         query: dict[str, Any] | None = None,
         projection: dict[str, int] | None = None,
+        *,
+        sort: list[tuple[str, int]] | None = None,
+        limit: int = 0,
     ) -> list[dict[str, Any]]:
         effective_query = query or {}
-        return [
-            _project_row(row, projection)
-            for row in self.rows
-            if _matches(row, effective_query)
-        ]
+        rows = [row for row in self.rows if _matches(row, effective_query)]
+        if sort:
+            rows = _sort_rows(rows, sort)
+        if limit:
+            rows = rows[:limit]
+        return [_project_row(row, projection) for row in rows]
+
+    def count_documents(self, query: dict[str, Any]) -> int:
+        return sum(1 for row in self.rows if _matches(row, query))
 
     def find_one(
         self,
@@ -116,12 +172,7 @@ class FakeMongoCollection:
         for index, row in enumerate(self.rows):
             if not _matches(row, query):
                 continue
-            updated = copy.deepcopy(row)
-            for key, value in update.get("$set", {}).items():
-                _set_path(updated, key, copy.deepcopy(value))
-            for key in update.get("$unset", {}):
-                _unset_path(updated, key)
-            self.rows[index] = updated
+            self.rows[index] = _apply_update(row, update)
             return
         if not upsert:
             return
@@ -134,6 +185,12 @@ class FakeMongoCollection:
             _unset_path(inserted, key)
         self.rows.append(inserted)
 
+    def update_many(self, query: dict[str, Any], update: dict[str, Any]) -> None:
+        self.rows = [
+            _apply_update(row, update) if _matches(row, query) else row
+            for row in self.rows
+        ]
+
     def create_index(self, keys: list[tuple[str, int]], **kwargs: Any) -> None:
         if kwargs.get("unique"):
             seen: set[tuple[Any, ...]] = set()
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from collections.abc import Iterator
 from typing import Any
 
+import pytest
+
 from legal_docs_pipeline.batch import (
     BatchJobSnapshot,
     BatchResultItem,
+    BatchResultLine,
     build_batch_custom_id,
     build_batch_jsonl_item,
+    iter_batch_input_chunks,
+    iter_batch_result_lines,
     parse_batch_output_line,
 )
 from legal_docs_pipeline.batch_repository import MongoBatchStateRepository
 from legal_docs_pipeline.batch_runner import BatchAnalysisRunner, BatchRunOptions
-from legal_docs_pipeline.constants import PipelineMode
+from legal_docs_pipeline.constants import LlmDispatchMode, PipelineMode
+from legal_docs_pipeline.costs import AdaptiveDispatchScheduler
 from legal_docs_pipeline.llm import StructuredLlmResponse, StructuredLlmUsage
 from tests.fake_mongo_runtime import FakeMongoCollection
 from tests.legal_docs_pipeline.test_pipeline import (
@@ -52,10 +60,14 @@ class FakeBatchClient:
     def create_job(
         self,
         *,
-        jsonl_items: list[dict[str, Any]],
+        input_path: Path,
         metadata: dict[str, str],
     ) -> BatchJobSnapshot:
         job_id = f"batch_{len(self.created_jobs) + 1}"
+        jsonl_items = [
+            json.loads(line)
+            for line in input_path.read_text(encoding="utf-8").splitlines()
+        ]
         self.created_jobs.append(
             {
                 "job_id": job_id,
@@ -86,12 +98,14 @@ class FakeBatchClient:
             raw_payload={"id": job_id, "status": self.job_status},
         )
 
-    def download_results(self, *, output_file_id: str | None) -> list[BatchResultItem]:
+    def _result_source_items(self) -> list[dict[str, Any]]:
         if not self.created_jobs:
             return []
-        items = self.created_jobs[-1]["jsonl_items"]
+        return self.created_jobs[-1]["jsonl_items"]
+
+    def download_results(self, *, output_file_id: str | None) -> list[BatchResultItem]:
         results: list[BatchResultItem] = []
-        for item in items:
+        for item in self._result_source_items():
             custom_id = item["custom_id"]
             if custom_id in self.responseless_custom_ids:
                 results.append(
@@ -130,12 +144,23 @@ class FakeBatchClient:
             )
         return results
 
+    def iter_result_lines(
+        self,
+        *,
+        file_id: str,
+        start_offset: int = 0,
+    ) -> Iterator[BatchResultLine]:
+        if file_id == self.output_file_id:
+            results = self.download_results(output_file_id=file_id)
+        else:
+            results = self.download_errors(error_file_id=file_id)
+        for line_index, result in enumerate(results):
+            if line_index >= start_offset:
+                yield BatchResultLine(end_offset=line_index + 1, item=result)
+
     def download_errors(self, *, error_file_id: str | None) -> list[BatchResultItem]:
-        if not self.created_jobs:
-            return []
-        items = self.created_jobs[-1]["jsonl_items"]
         results: list[BatchResultItem] = []
-        for item in items:
+        for item in self._result_source_items():
             custom_id = item["custom_id"]
             if custom_id not in self.error_payloads:
                 continue
@@ -203,6 +228,73 @@ def test_parse_batch_output_line_extracts_structured_json() -> None:
     assert parsed.response.output_payload["semantic"]["document_type_code"] == "pl_judgment"
 
 
+def test_iter_batch_result_lines_streams_chunks_and_resumes_from_offset() -> None:
+    raw_output = b"".join(
+        json.dumps(
+            {"custom_id": f"doc-{index}", "error": {"code": "server_error"}}
+        ).encode("utf-8")
+        + b"\n"
+        for index in range(3)
+    ) + b"\n"
+    chunks = [raw_output[start : start + 7] for start in range(0, len(raw_output), 7)]
+
+    lines = list(iter_batch_result_lines(chunks))
+
+    assert [line.item.custom_id for line in lines] == ["doc-0", "doc-1", "doc-2"]
+    assert lines[-1].end_offset == len(raw_output) - 1
+    assert raw_output[lines[0].end_offset - 1 : lines[0].end_offset] == b"\n"
+
+    resumed = list(iter_batch_result_lines(chunks, start_offset=lines[0].end_offset))
+
+    assert [line.item.custom_id for line in resumed] == ["doc-1", "doc-2"]
+    assert resumed[0].item.error_payload == {"code": "server_error"}
+
+
+def test_iter_batch_input_chunks_streams_bounded_jsonl_files(tmp_path: Path) -> None:
+    queued_items = [
+        {
+            "custom_id": f"doc-{index}.md::annotate_original::hash",
+            "doc_id": f"doc-{index}.md",
+            "request_body": {"custom_id": f"doc-{index}", "body": {"input": "ż" * 40}},
+        }
+        for index in range(5)
+    ]
+    line_bytes = len(
+        (
+            json.dumps(
+                queued_items[0]["request_body"],
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            + "\n"
+        ).encode("utf-8")
+    )
+
+    chunks = list(
+        iter_batch_input_chunks(
+            queued_items,
+            directory=tmp_path,
+            max_requests=3,
+            max_input_file_bytes=line_bytes * 2,
+        )
+    )
+
+    assert [chunk.doc_ids for chunk in chunks] == [
+        ("doc-0.md", "doc-1.md"),
+        ("doc-2.md", "doc-3.md"),
+        ("doc-4.md",),
+    ]
+    for chunk in chunks:
+        assert chunk.size_bytes == chunk.input_path.stat().st_size
+        rows = [
+            json.loads(line)
+            for line in chunk.input_path.read_text(encoding="utf-8").splitlines()
+        ]
+        assert [row["custom_id"] for row in rows] == [
+            doc_id.removesuffix(".md") for doc_id in chunk.doc_ids
+        ]
+
+
 def test_batch_runner_prepare_submit_poll_apply_success(tmp_path: Path) -> None:
     input_root = tmp_path / "input"
     input_root.mkdir()
@@ -255,6 +347,370 @@ def test_batch_runner_prepare_submit_poll_apply_success(tmp_path: Path) -> None:
     assert stored["llm"]["analysis"]["dispatch"]["status"] == "applied"
 
 
+def test_batch_apply_resumes_from_checkpoint_after_interruption(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    _write_judicial_doc(input_root / "doc-a.md", canonical_doc_uid="saos_pl:1")
+    _write_judicial_doc(input_root / "doc-b.md", canonical_doc_uid="saos_pl:2")
+    base_config = _build_config(tmp_path=tmp_path, input_root=input_root)
+    config = base_config.model_copy(
+        update={
+            "pipeline": base_config.pipeline.model_copy(
+                update={"batch_min_requests_to_submit": 1}
+            )
+        }
+    )
+    document_repository = _build_document_repository()
+    batch_repository = _build_batch_repository()
+    batch_client = FakeBatchClient()
+    runner = BatchAnalysisRunner(
+        config=config,
+        pipeline=AnnotationPipeline(
+            config=config,
+            repository_factory=lambda _config: document_repository,
+            llm_client=ScriptedLlmClient(
+                script=[_translation_payload(), _translation_payload()]
+            ),
+        ),
+        document_repository_factory=lambda _config: document_repository,
+        batch_repository_factory=lambda _config: batch_repository,
+        batch_client=batch_client,
+    )
+    runner.prepare(options=BatchRunOptions(mode=PipelineMode.FULL))
+    batch_client.output_payloads = {
+        str(item["custom_id"]): _analysis_payload()
+        for item in batch_repository.list_queued_items()
+    }
+    runner.submit()
+    runner.poll()
+
+    original_apply_success_item = runner._apply_success_item
+    applied_custom_ids: list[str] = []
+
+    def interrupting_apply_success_item(**kwargs):
+        if applied_custom_ids:
+            raise KeyboardInterrupt
+        applied_custom_ids.append(str(kwargs["item"]["custom_id"]))
+        return original_apply_success_item(**kwargs)
+
+    monkeypatch.setattr(runner, "_apply_success_item", interrupting_apply_success_item)
+    with pytest.raises(KeyboardInterrupt):
+        runner.apply()
+
+    job = batch_repository.get_job("batch_1")
+    assert job is not None
+    assert job["apply_checkpoint"] == {"output_offset": 1}
+
+    monkeypatch.setattr(runner, "_apply_success_item", original_apply_success_item)
+    resumed_summary = runner.apply()
+
+    assert resumed_summary.applied_items_count == 1
+    assert resumed_summary.batch_success_count == 1
+    for doc_id in ("doc-a.md", "doc-b.md"):
+        stored = document_repository.get_document(doc_id)
+        assert stored is not None
+        assert stored["llm"]["analysis"]["dispatch"]["status"] == "applied"
+    job = batch_repository.get_job("batch_1")
+    assert job is not None
+    assert job["apply_checkpoint"] == {"output_offset": 2}
+    assert job["apply_status"] == "fully_applied"
+
+
+class ConcurrentFakeBatchClient(FakeBatchClient):
+    """Every job's result files list all submitted items; apply filters by job."""
+
+    def __init__(self, *, parallel_retrievals: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._retrieve_barrier = threading.Barrier(parallel_retrievals, timeout=5)
+        self.retrieve_thread_ids: set[int] = set()
+
+    def retrieve_job(self, job_id: str) -> BatchJobSnapshot:
+        self.retrieve_thread_ids.add(threading.get_ident())
+        # Breaks with BrokenBarrierError unless the jobs are polled concurrently.
+        self._retrieve_barrier.wait()
+        return super().retrieve_job(job_id)
+
+    def _result_source_items(self) -> list[dict[str, Any]]:
+        return [
+            item for job in self.created_jobs for item in job["jsonl_items"]
+        ]
+
+
+def test_batch_poll_and_apply_run_concurrently_across_jobs(tmp_path: Path) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    doc_ids = ("doc-a.md", "doc-b.md", "doc-c.md")
+    for index, doc_id in enumerate(doc_ids, start=1):
+        _write_judicial_doc(input_root / doc_id, canonical_doc_uid=f"saos_pl:{index}")
+    base_config = _build_config(tmp_path=tmp_path, input_root=input_root)
+    config = base_config.model_copy(
+        update={
+            "pipeline": base_config.pipeline.model_copy(
+                update={
+                    "batch_min_requests_to_submit": 1,
+                    "batch_max_requests": 1,
+                    "batch_inflight_jobs_limit": 3,
+                    "batch_poll_workers": 3,
+                    "batch_apply_job_workers": 3,
+                    "batch_apply_workers": 2,
+                }
+            )
+        }
+    )
+    document_repository = _build_document_repository()
+    batch_repository = _build_batch_repository()
+    batch_client = ConcurrentFakeBatchClient(parallel_retrievals=3)
+    runner = BatchAnalysisRunner(
+        config=config,
+        pipeline=AnnotationPipeline(
+            config=config,
+            repository_factory=lambda _config: document_repository,
+            llm_client=ScriptedLlmClient(
+                script=[_translation_payload() for _ in doc_ids]
+            ),
+        ),
+        document_repository_factory=lambda _config: document_repository,
+        batch_repository_factory=lambda _config: batch_repository,
+        batch_client=batch_client,
+    )
+    runner.prepare(options=BatchRunOptions(mode=PipelineMode.FULL))
+    batch_client.output_payloads = {
+        str(item["custom_id"]): _analysis_payload()
+        for item in batch_repository.list_queued_items()
+    }
+
+    submit_summary = runner.submit()
+    poll_summary = runner.poll()
+    apply_summary = runner.apply()
+
+    assert submit_summary.submitted_jobs_count == 3
+    assert poll_summary.polled_jobs_count == 3
+    assert len(batch_client.retrieve_thread_ids) == 3
+    assert apply_summary.applied_items_count == 3
+    assert apply_summary.batch_success_count == 3
+    assert apply_summary.warnings == []
+    for doc_id in doc_ids:
+        stored = document_repository.get_document(doc_id)
+        assert stored is not None
+        assert stored["llm"]["analysis"]["dispatch"]["status"] == "applied"
+    for job_index in range(1, 4):
+        job = batch_repository.get_job(f"batch_{job_index}")
+        assert job is not None
+        assert job["apply_checkpoint"] == {"output_offset": 3}
+        assert job["apply_status"] == "fully_applied"
+
+
+
+def test_batch_apply_coalesces_checkpoints_and_item_lookups(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    doc_ids = ("doc-a.md", "doc-b.md", "doc-c.md")
+    for index, doc_id in enumerate(doc_ids, start=1):
+        _write_judicial_doc(input_root / doc_id, canonical_doc_uid=f"saos_pl:{index}")
+    base_config = _build_config(tmp_path=tmp_path, input_root=input_root)
+    config = base_config.model_copy(
+        update={
+            "pipeline": base_config.pipeline.model_copy(
+                update={"batch_min_requests_to_submit": 1}
+            )
+        }
+    )
+    document_repository = _build_document_repository()
+    batch_repository = _build_batch_repository()
+    batch_client = FakeBatchClient()
+    runner = BatchAnalysisRunner(
+        config=config,
+        pipeline=AnnotationPipeline(
+            config=config,
+            repository_factory=lambda _config: document_repository,
+            llm_client=ScriptedLlmClient(
+                script=[_translation_payload() for _ in doc_ids]
+            ),
+        ),
+        document_repository_factory=lambda _config: document_repository,
+        batch_repository_factory=lambda _config: batch_repository,
+        batch_client=batch_client,
+    )
+    runner.prepare(options=BatchRunOptions(mode=PipelineMode.FULL))
+    batch_client.output_payloads = {
+        str(item["custom_id"]): _analysis_payload()
+        for item in batch_repository.list_queued_items()
+    }
+    runner.submit()
+    runner.poll()
+    checkpoint_writes: list[tuple[str, int]] = []
+    update_checkpoint = batch_repository.update_job_apply_checkpoint
+
+    def record_checkpoint(
+        *, batch_job_id: str, file_kind: str, end_offset: int
+    ) -> None:
+        checkpoint_writes.append((file_kind, end_offset))
+        update_checkpoint(
+            batch_job_id=batch_job_id, file_kind=file_kind, end_offset=end_offset
+        )
+
+    monkeypatch.setattr(
+        batch_repository, "update_job_apply_checkpoint", record_checkpoint
+    )
+    monkeypatch.setattr(
+        batch_repository,
+        "get_item",
+        lambda custom_id: pytest.fail(f"unexpected per-line lookup: {custom_id}"),
+    )
+
+    apply_summary = runner.apply()
+
+    assert apply_summary.applied_items_count == 3
+    assert checkpoint_writes == [("output", 3)]
+    job = batch_repository.get_job("batch_1")
+    assert job is not None
+    assert job["apply_checkpoint"] == {"output_offset": 3}
+
+
+class CallCountingMongoCollection(FakeMongoCollection):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def find(self, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        self._count("find")
+        return super().find(*args, **kwargs)
+
+    def count_documents(self, query: dict[str, Any]) -> int:
+        self._count("count_documents")
+        return super().count_documents(query)
+
+    def update_one(self, *args: Any, **kwargs: Any) -> None:
+        self._count("update_one")
+        super().update_one(*args, **kwargs)
+
+    def update_many(self, query: dict[str, Any], update: dict[str, Any]) -> None:
+        self._count("update_many")
+        super().update_many(query, update)
+
+
+def test_batch_repository_streams_projected_items_for_submission() -> None:
+    items = CallCountingMongoCollection()
+    repository = MongoBatchStateRepository(
+        jobs_collection=CallCountingMongoCollection(),
+        items_collection=items,
+        target_database="kaucja_legal_corpus",
+        target_collection="documents",
+        schema_version="2.0.0",
+        jobs_collection_name="analysis_batch_jobs_v2",
+        items_collection_name="analysis_batch_items_v2",
+    )
+    for index in range(3):
+        repository.queue_item(
+            custom_id=f"custom-{index}",
+            doc_id=f"doc-{index}.md",
+            stage="annotate_original",
+            request_hash=f"hash-{index}",
+            prompt_hash="prompt",
+            source_language_code="pl",
+            request_record={"large": "x" * 100},
+            request_body={"index": index},
+            analysis_fingerprint=f"fingerprint-{index}",
+            cost_estimate=None,
+        )
+    for index, row in enumerate(items.rows):
+        row["queued_at"] = datetime(2026, 1, 1, second=3 - index, tzinfo=timezone.utc)
+    items.calls.clear()
+
+    streamed = list(repository.iter_queued_submission_items())
+
+    assert streamed == [
+        {
+            "custom_id": f"custom-{index}",
+            "doc_id": f"doc-{index}.md",
+            "request_body": {"index": index},
+        }
+        for index in (2, 1, 0)
+    ]
+    assert items.calls == {"find": 1}
+
+
+def test_batch_repository_filters_sorts_and_counts_in_mongo() -> None:
+    jobs = CallCountingMongoCollection()
+    items = CallCountingMongoCollection()
+    repository = MongoBatchStateRepository(
+        jobs_collection=jobs,
+        items_collection=items,
+        target_database="kaucja_legal_corpus",
+        target_collection="documents",
+        schema_version="2.0.0",
+        jobs_collection_name="analysis_batch_jobs_v2",
+        items_collection_name="analysis_batch_items_v2",
+    )
+    custom_ids = [f"custom-{index}" for index in range(5)]
+    for index, custom_id in enumerate(custom_ids):
+        repository.queue_item(
+            custom_id=custom_id,
+            doc_id=f"doc-{index}.md",
+            stage="annotate_original",
+            request_hash=f"hash-{index}",
+            prompt_hash="prompt",
+            source_language_code="pl",
+            request_record={},
+            request_body={},
+            analysis_fingerprint=f"fingerprint-{index}",
+            cost_estimate=None,
+        )
+    for row in items.rows:
+        row["queued_at"] = datetime(
+            2026, 1, 1, second=int(str(row["custom_id"]).rsplit("-", 1)[1]),
+            tzinfo=timezone.utc,
+        )
+    items.rows.reverse()
+    items.calls.clear()
+
+    queued = repository.list_queued_items(limit=3)
+    repository.mark_submitted(
+        batch_job_id="batch_1",
+        custom_ids=[str(item["custom_id"]) for item in queued],
+        raw_payload={"id": "batch_1"},
+    )
+    repository.mark_submitted(
+        batch_job_id="batch_2",
+        custom_ids=[str(item["custom_id"]) for item in repository.list_queued_items()],
+        raw_payload={"id": "batch_2"},
+    )
+    repository.update_job_status(
+        batch_job_id="batch_2",
+        status="completed",
+        raw_payload={"id": "batch_2"},
+        output_file_id=None,
+        error_file_id=None,
+        completed_at=None,
+    )
+
+    assert [item["custom_id"] for item in queued] == custom_ids[:3]
+    assert repository.list_queued_items(limit=0) == []
+    assert items.calls == {"find": 2, "update_many": 2}
+    assert repository.count_inflight_jobs() == 1
+    assert [job["batch_job_id"] for job in repository.get_inflight_jobs()] == [
+        "batch_1"
+    ]
+    assert [
+        job["batch_job_id"] for job in repository.get_terminal_jobs_ready_for_apply()
+    ] == ["batch_2"]
+    assert jobs.calls["count_documents"] == 1
+    assert {
+        str(item["custom_id"]): item["batch_job_id"] for item in items.rows
+    } == {
+        **{custom_id: "batch_1" for custom_id in custom_ids[:3]},
+        **{custom_id: "batch_2" for custom_id in custom_ids[3:]},
+    }
+
+
 def test_submit_flushes_tail_batch_when_no_inflight_jobs(tmp_path: Path) -> None:
     input_root = tmp_path / "input"
     input_root.mkdir()
@@ -548,6 +1004,136 @@ def test_pipeline_run_honors_batch_dispatch_mode(tmp_path: Path) -> None:
     assert queued_items[0]["cost_estimate"]["batch_discount_factor"] == 0.5
 
 
+def test_adaptive_dispatch_scheduler_weighs_savings_and_batch_latency() -> None:
+    request = _build_configured_analysis_request()
+    scheduler = AdaptiveDispatchScheduler(
+        input_cost_per_1k_tokens_usd=0.01,
+        output_cost_per_1k_tokens_usd=0.03,
+        batch_discount_factor=0.5,
+        batch_max_requests=2,
+        batch_inflight_jobs_limit=1,
+        turnaround_seconds=600.0,
+        queue_depth=1,
+        max_batch_latency_seconds=1200.0,
+    )
+
+    decisions = [scheduler.decide(request) for _ in range(4)]
+
+    assert [decision.mode for decision in decisions] == [
+        LlmDispatchMode.BATCH_ANALYSIS,
+        LlmDispatchMode.BATCH_ANALYSIS,
+        LlmDispatchMode.BATCH_ANALYSIS,
+        LlmDispatchMode.DIRECT,
+    ]
+    assert [decision.expected_batch_latency_seconds for decision in decisions] == [
+        600.0,
+        1200.0,
+        1200.0,
+        1800.0,
+    ]
+    assert decisions[-1].reason == "batch_latency_over_budget"
+    assert decisions[0].batch_cost_usd == pytest.approx(
+        decisions[0].direct_cost_usd * 0.5, abs=1e-6
+    )
+    assert scheduler.queue_depth == 4
+
+    frugal = AdaptiveDispatchScheduler(
+        input_cost_per_1k_tokens_usd=0.01,
+        output_cost_per_1k_tokens_usd=0.03,
+        batch_discount_factor=0.5,
+        batch_max_requests=2,
+        batch_inflight_jobs_limit=1,
+        turnaround_seconds=600.0,
+        queue_depth=0,
+        max_batch_latency_seconds=1200.0,
+        min_batch_savings_usd=1_000.0,
+    )
+    assert frugal.decide(request).reason == "batch_savings_below_threshold"
+    assert frugal.queue_depth == 0
+
+
+def test_batch_repository_reports_median_observed_turnaround() -> None:
+    repository = _build_batch_repository()
+    assert repository.get_observed_turnaround_seconds(sample_size=5) is None
+    submitted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for index, minutes in enumerate((10, 30, 20), start=1):
+        batch_job_id = f"batch_{index}"
+        repository.mark_submitted(
+            batch_job_id=batch_job_id,
+            custom_ids=[],
+            raw_payload={"id": batch_job_id},
+        )
+        repository._jobs.update_one(
+            {"batch_job_id": batch_job_id},
+            {"$set": {"submitted_at": submitted_at}},
+        )
+        repository.update_job_status(
+            batch_job_id=batch_job_id,
+            status="completed" if index < 3 else "in_progress",
+            raw_payload={"id": batch_job_id},
+            output_file_id=None,
+            error_file_id=None,
+            completed_at=submitted_at + timedelta(minutes=minutes),
+        )
+
+    assert repository.get_observed_turnaround_seconds(sample_size=5) == 1200.0
+
+
+def test_pipeline_adaptive_dispatch_splits_run_across_batch_and_direct(
+    tmp_path: Path,
+) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    _write_judicial_doc(input_root / "doc-a.md", canonical_doc_uid="saos_pl:1")
+    _write_judicial_doc(input_root / "doc-b.md", canonical_doc_uid="saos_pl:2")
+    base_config = _build_config(tmp_path=tmp_path, input_root=input_root)
+    config = base_config.model_copy(
+        update={
+            "pipeline": base_config.pipeline.model_copy(
+                update={
+                    "llm_dispatch_mode": "adaptive",
+                    "batch_max_requests": 1,
+                    "batch_inflight_jobs_limit": 1,
+                    "adaptive_dispatch_default_turnaround_seconds": 3600,
+                    "adaptive_dispatch_max_batch_latency_seconds": 3600,
+                }
+            )
+        }
+    )
+    document_repository = _build_document_repository()
+    batch_repository = _build_batch_repository(config=config)
+    pipeline = AnnotationPipeline(
+        config=config,
+        repository_factory=lambda _config: document_repository,
+        batch_repository_factory=lambda _config: batch_repository,
+        llm_client=ScriptedLlmClient(
+            script=[_analysis_payload(), _translation_payload()]
+        ),
+    )
+
+    summary = pipeline.run(options=PipelineRunOptions(mode=PipelineMode.FULL))
+    batched = document_repository.get_document("doc-a.md")
+    direct = document_repository.get_document("doc-b.md")
+    log_events = [
+        json.loads(line)
+        for line in summary.log_path.read_text(encoding="utf-8").splitlines()
+    ]
+    decisions = [
+        entry["details"]["reason"]
+        for entry in log_events
+        if entry["event"] == "dispatch_decided"
+    ]
+
+    assert summary.queued_count == 1
+    assert summary.completed_count == 1
+    assert batched is not None
+    assert batched["processing"]["status"] == "awaiting_batch_analysis"
+    assert direct is not None
+    assert direct["annotation"]["status"] == "completed"
+    assert decisions == ["batch_discount_within_budget", "batch_latency_over_budget"]
+    assert len(batch_repository.list_queued_items()) == 1
+
+
 def test_batch_runner_prepare_reports_existing_item_on_repeat(tmp_path: Path) -> None:
     input_root = tmp_path / "input"
     input_root.mkdir()
@@ -17,6 +17,8 @@ def test_example_pipeline_config_loads_and_resolves_paths() -> None:
 
     assert config.input.root_path == (PROJECT_ROOT / "docs/legal/cas_law_v2_2_md").resolve()
     assert config.input.max_file_size_bytes == 64 * 1024 * 1024
+    assert config.input.scan_index_path == (PROJECT_ROOT / "logs/scan_index.json").resolve()
+    assert config.input.strict_rehash is False
     assert config.prompts.prompt_dir == (PROJECT_ROOT / "prompts/kaucja").resolve()
     assert config.mongo.collection == "documents_cas_law_v2_2_prod_v3"
     assert config.pipeline.workers == 1
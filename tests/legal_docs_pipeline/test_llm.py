@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import math
 import time
 from typing import Any
 
 import pytest
 
+from legal_docs_pipeline.costs import estimate_stage_cost
 from legal_docs_pipeline.llm import (
     LlmCallError,
     OpenAIResponsesAnnotationLlmClient,
     StructuredLlmRequest,
+    estimate_text_tokens,
 )
 from legal_docs_pipeline.schemas import AnalysisAnnotationOutput
 
@@ -271,6 +275,48 @@ def test_openai_responses_client_interrupts_hanging_request() -> None:
     assert error.value.code == "llm_timeout"
 
 
+def test_openai_responses_client_times_out_off_the_main_thread() -> None:
+    client = OpenAIResponsesAnnotationLlmClient(
+        responses_service=SlowResponsesService(),
+        timeout_seconds=1,
+    )
+    request = StructuredLlmRequest(
+        stage="annotate_original",
+        system_prompt="system prompt",
+        input_payload={"doc_id": "doc.md"},
+        output_schema={"type": "object"},
+        output_model=AnalysisAnnotationOutput,
+        metadata={
+            "run_id": "run-1",
+            "doc_id": "doc.md",
+            "prompt_pack_version": "2026-03-16",
+            "prompt_profile": "addon_normative",
+        },
+        provider="openai",
+        api="responses",
+        model_id="gpt-5.4",
+        reasoning_effort="xhigh",
+        text_verbosity="low",
+        truncation="disabled",
+        store=False,
+        max_output_tokens=32000,
+        prompt_pack_id="kaucja-prompt-pack",
+        prompt_pack_version="2026-03-16",
+        prompt_profile="addon_normative",
+        prompt_hash="prompt-hash",
+        request_hash="request-hash",
+    )
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(client.run, request)
+        with pytest.raises(LlmCallError) as error:
+            future.result()
+
+    assert error.value.code == "llm_timeout"
+    assert time.monotonic() - started < 2
+
+
 @pytest.mark.parametrize("reason", ["max_output_tokens", "content_filter"])
 def test_openai_responses_client_preserves_incomplete_details(reason: str) -> None:
     client = OpenAIResponsesAnnotationLlmClient(
@@ -313,3 +359,44 @@ def test_openai_responses_client_preserves_incomplete_details(reason: str) -> No
     assert error.value.details["status"] == "incomplete"
     assert error.value.details["incomplete_details"]["reason"] == reason
     assert error.value.details["usage"]["reasoning_tokens"] == 50
+
+
+def test_structured_request_memoises_input_token_estimate() -> None:
+    estimated_texts: list[str] = []
+
+    def counting_estimator(text: str) -> int:
+        estimated_texts.append(text)
+        return 7
+
+    request = StructuredLlmRequest(
+        stage="annotate_original",
+        system_prompt="system prompt",
+        input_payload={"doc_id": "doc.md", "text": "x" * 1000},
+        output_schema={"type": "object"},
+        output_model=AnalysisAnnotationOutput,
+        metadata={"doc_id": "doc.md"},
+        provider="openai",
+        api="responses",
+        model_id="gpt-5.4",
+        reasoning_effort="xhigh",
+        text_verbosity="low",
+        truncation="disabled",
+        store=False,
+        max_output_tokens=32000,
+        prompt_pack_id="kaucja-prompt-pack",
+        prompt_pack_version="2026-03-16",
+        prompt_profile="addon_normative",
+        prompt_hash="prompt-hash",
+        request_hash="request-hash",
+        token_estimator=counting_estimator,
+    )
+
+    for _ in range(3):
+        cost_estimate = estimate_stage_cost(request=request)
+        assert cost_estimate["estimated_input_tokens"] == 7
+
+    assert len(estimated_texts) == 1
+    assert '"text":"' + "x" * 1000 in estimated_texts[0]
+    assert estimate_text_tokens(estimated_texts[0]) == math.ceil(
+        len(estimated_texts[0]) / 4
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import gzip
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from legal_docs_pipeline.logging import JsonlPipelineLogger, PipelineLogEvent
 
@@ -38,3 +40,72 @@ def test_jsonl_logger_respects_minimum_log_level(tmp_path) -> None:
 
     assert len(rows) == 1
     assert rows[0]["event"] == "failed"
+
+
+def _info_event(index: int) -> PipelineLogEvent:
+    return PipelineLogEvent(
+        run_id="run-1",
+        stage="annotate_original",
+        event="llm_request_started",
+        level="info",
+        message=f"event {index}",
+        details={"index": index},
+    )
+
+
+def test_jsonl_logger_buffers_info_events_until_close(tmp_path) -> None:
+    logger = JsonlPipelineLogger(
+        run_id="run-1",
+        log_dir=tmp_path,
+        flush_interval_seconds=3600,
+    )
+
+    for index in range(3):
+        logger.log(_info_event(index))
+
+    assert logger.log_path.read_text(encoding="utf-8") == ""
+
+    logger.close()
+    logger.close()
+    rows = [
+        json.loads(line)
+        for line in logger.log_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [row["details"]["index"] for row in rows] == [0, 1, 2]
+
+
+def test_jsonl_logger_is_safe_for_concurrent_workers(tmp_path) -> None:
+    with (
+        JsonlPipelineLogger(run_id="run-1", log_dir=tmp_path) as logger,
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        list(executor.map(lambda index: logger.log(_info_event(index)), range(400)))
+
+    rows = [
+        json.loads(line)
+        for line in logger.log_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert sorted(row["details"]["index"] for row in rows) == list(range(400))
+
+
+def test_jsonl_logger_rotates_into_gzip_files(tmp_path) -> None:
+    with JsonlPipelineLogger(
+        run_id="run-1",
+        log_dir=tmp_path,
+        rotate_max_bytes=1024,
+    ) as logger:
+        for index in range(40):
+            logger.log(_info_event(index))
+
+    rotated_paths = sorted(
+        tmp_path.glob("run-1.*.jsonl.gz"),
+        key=lambda path: int(path.name.split(".")[1]),
+    )
+    assert rotated_paths
+    lines: list[str] = []
+    for rotated_path in rotated_paths:
+        with gzip.open(rotated_path, "rt", encoding="utf-8") as handle:
+            lines.extend(handle.read().splitlines())
+    if logger.log_path.exists():
+        lines.extend(logger.log_path.read_text(encoding="utf-8").splitlines())
+    assert [json.loads(line)["details"]["index"] for line in lines] == list(range(40))
@@ -188,6 +188,65 @@ def test_pipeline_dry_run_allows_und_non_target_discovery(tmp_path: Path) -> Non
     assert summary.failed_count == 0
 
 
+def test_prepare_annotatable_document_reuses_cached_preparation(
+    tmp_path: Path,
+) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    _write_judicial_doc(input_root / "wyrok.md", canonical_doc_uid="saos:1")
+
+    pipeline = AnnotationPipeline(
+        config=_build_config(tmp_path=tmp_path, input_root=input_root),
+        repository_factory=lambda _config: _build_repository(),
+        llm_client=ScriptedLlmClient(script=[]),
+    )
+    read_calls: list[str] = []
+    original_read = pipeline.reader.read
+
+    def _counting_read(document):
+        read_calls.append(document.relative_path.as_posix())
+        return original_read(document)
+
+    pipeline.reader.read = _counting_read  # type: ignore[method-assign]
+    document = pipeline.scanner.scan(input_root)[0]
+
+    with pipeline._reusing_document_preparation():
+        first = pipeline._prepare_annotatable_document(
+            document=document,
+            run_id="run-1",
+            allow_classifier_fallback=False,
+        )
+        second = pipeline._prepare_annotatable_document(
+            document=document,
+            run_id="run-1",
+            allow_classifier_fallback=False,
+        )
+
+        assert first is not None and second is not None
+        assert second.canonical_result is first.canonical_result
+        assert second.classification is first.classification
+        assert read_calls == ["wyrok.md"]
+
+        _write_judicial_doc(input_root / "wyrok.md", canonical_doc_uid="saos:2")
+        changed_document = pipeline.scanner.scan(input_root)[0]
+        pipeline._prepare_annotatable_document(
+            document=changed_document,
+            run_id="run-1",
+            allow_classifier_fallback=False,
+        )
+
+        assert read_calls == ["wyrok.md", "wyrok.md"]
+
+    # Outside batch apply nothing is retained between preparations.
+    assert pipeline._preparation_cache is None
+    pipeline._prepare_annotatable_document(
+        document=changed_document,
+        run_id="run-1",
+        allow_classifier_fallback=False,
+    )
+    assert read_calls == ["wyrok.md", "wyrok.md", "wyrok.md"]
+
+
 def test_pipeline_completes_discovery_search_snapshot(tmp_path: Path) -> None:
     input_root = tmp_path / "input"
     (input_root / "pl_saos").mkdir(parents=True)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -110,3 +112,51 @@ def test_request_hash_changes_when_input_changes() -> None:
     )
 
     assert base_hash != changed_hash
+
+
+def test_prompt_resolver_caches_until_prompt_file_changes(tmp_path, monkeypatch) -> None:
+    prompt_dir = tmp_path / "prompts"
+    shutil.copytree(PROJECT_ROOT / "prompts/kaucja", prompt_dir)
+    resolver = FilePromptResolver(prompt_dir)
+    read_names: list[str] = []
+    original_read = resolver._read_prompt_file
+
+    def recording_read(file_name: str) -> str:
+        read_names.append(file_name)
+        return original_read(file_name)
+
+    monkeypatch.setattr(resolver, "_read_prompt_file", recording_read)
+
+    first = resolver.resolve_analysis_prompt(
+        PromptProfile.ADDON_CASE_LAW,
+        source_language_code="pl",
+    )
+    second = resolver.resolve_analysis_prompt(
+        PromptProfile.ADDON_CASE_LAW,
+        source_language_code="pl",
+    )
+    english = resolver.resolve_analysis_prompt(
+        PromptProfile.ADDON_CASE_LAW,
+        source_language_code="en",
+    )
+
+    assert second is first
+    assert english.prompt_hash != first.prompt_hash
+    assert read_names == ["base_system.txt", "addon_case_law.txt"] * 2
+
+    addon_path = prompt_dir / "addon_case_law.txt"
+    addon_path.write_text(
+        addon_path.read_text(encoding="utf-8") + "\nExtra rule.",
+        encoding="utf-8",
+    )
+    stat_result = addon_path.stat()
+    os.utime(addon_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+
+    refreshed = resolver.resolve_analysis_prompt(
+        PromptProfile.ADDON_CASE_LAW,
+        source_language_code="pl",
+    )
+
+    assert refreshed.prompt_hash != first.prompt_hash
+    assert refreshed.prompt_text.endswith(first.prompt_text.rsplit("\n\n", 1)[1])
+    assert "Extra rule." in refreshed.prompt_text
@@ -9,6 +9,7 @@ from legal_docs_pipeline.language import HeuristicLanguageDetector
 from legal_docs_pipeline.parser import LegalMarkdownParser, MarkdownParseError
 from legal_docs_pipeline.reader import MarkdownReader, ReadDocumentError
 from legal_docs_pipeline.scanner import DiscoveredDocument
+from legal_docs_pipeline.text_view import TextView
 
 
 def test_reader_normalizes_bom_html_and_text_stats(tmp_path) -> None:
@@ -153,3 +154,36 @@ def test_language_detector_heuristics(
     )
 
     assert result.language_code == expected_language
+
+
+def test_text_view_lowers_head_windows_without_full_copy() -> None:
+    text_view = TextView("WYROK " + "X" * 10_000, title="  Sygn. Akt  ")
+
+    assert text_view.lowered_head(5) == "wyrok"
+    assert text_view.lowered_head(5) is text_view.lowered_head(5)
+    assert text_view.lowered_title == "sygn. akt"
+    assert text_view._lowered is None
+
+    assert text_view.lowered_head(50_000) == text_view.lowered
+    assert text_view.lowered == "wyrok " + "x" * 10_000
+
+
+def test_language_detector_reuses_shared_text_view() -> None:
+    normalized_text = "Sygn. akt I C 1/20\n" + "Kaucja najmu lokatora " * 500
+    text_view = TextView(normalized_text, title="WYROK")
+
+    result = HeuristicLanguageDetector().detect(
+        normalized_text=normalized_text,
+        doc_metadata={"original_source_system": "saos_pl"},
+        relative_path="pl_sn/doc.md",
+        title="WYROK",
+        text_view=text_view,
+    )
+
+    assert result.language_code == "pl"
+    assert result.signals == (
+        "metadata.source_system=saos_pl->pl",
+        "folder=pl_sn->pl",
+        "text_markers_pl=4",
+    )
+    assert text_view.lowered_head(4000) == normalized_text[:4000].lower()
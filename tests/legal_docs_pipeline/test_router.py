@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from legal_docs_pipeline.router import RoutingInput, RuleBasedDocumentRouter
+from legal_docs_pipeline.router import (
+    MarkerScan,
+    RoutingInput,
+    RuleBasedDocumentRouter,
+)
 
 
 def test_router_classifies_corpus_readme() -> None:
@@ -284,3 +288,43 @@ def test_router_returns_unknown_when_no_signals_match() -> None:
 
     assert result.document_family.value == "unknown"
     assert result.skip_reason == "rule_router_no_match"
+
+
+def test_marker_scan_shares_hits_across_rules() -> None:
+    scan = MarkerScan(text="## metadata\nuokik\n## content\nwyrok sygn. akt")
+
+    assert scan.position("uokik") < scan.position("wyrok") < scan.position("sygn.")
+    assert scan.position("missing") == -1
+    assert scan.contains("uokik") is True
+    assert scan.contains("uokik", start=20) is False
+    assert scan.contains_any(("missing", "sygn."), start=20) is True
+
+    collected: list[str] = ["wyrok"]
+    scan.collect(collected, ("wyrok", "sygn.", "missing"))
+    assert collected == ["wyrok", "sygn."]
+
+
+def test_router_reads_leading_body_lines_beyond_first_window() -> None:
+    router = RuleBasedDocumentRouter(router_version="1.0.0")
+    filler_lines = [f"Punkt {index}: " + "x" * 400 for index in range(39)]
+
+    result = router.route(
+        RoutingInput(
+            relative_path="pl_sn/long.md",
+            file_name="long.md",
+            title="Sygn. akt III CZP 1/20",
+            metadata={"original_source_system": "sn_pl"},
+            normalized_text="\n".join(
+                [
+                    "## Content",
+                    "",
+                    *filler_lines,
+                    "",
+                    "POSTANOWIENIE",
+                    "WYROK",
+                ]
+            ),
+        )
+    )
+
+    assert result.document_type_code == "pl_order"
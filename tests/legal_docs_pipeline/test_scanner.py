@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import hashlib
+import json
 from pathlib import PurePosixPath
 
+from legal_docs_pipeline import scanner as scanner_module
 from legal_docs_pipeline.scanner import DocumentScanner
 
 
@@ -43,3 +45,156 @@ def test_scanner_can_start_from_relative_path(tmp_path) -> None:
         PurePosixPath("b.md"),
         PurePosixPath("c.md"),
     ]
+
+
+def test_scanner_index_skips_rehash_for_unchanged_files(tmp_path, monkeypatch) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    (input_root / "a.md").write_text("a", encoding="utf-8")
+    (input_root / "b.md").write_text("b", encoding="utf-8")
+    index_path = tmp_path / "state" / "scan_index.json"
+
+    hashed_paths: list[str] = []
+    original_compute_sha256 = scanner_module._compute_sha256
+
+    def _counting_compute_sha256(path):
+        hashed_paths.append(path.name)
+        return original_compute_sha256(path)
+
+    monkeypatch.setattr(scanner_module, "_compute_sha256", _counting_compute_sha256)
+
+    first = DocumentScanner(scan_index_path=index_path).scan(input_root)
+    assert sorted(hashed_paths) == ["a.md", "b.md"]
+    assert index_path.exists()
+
+    hashed_paths.clear()
+    (input_root / "b.md").write_text("bb", encoding="utf-8")
+    second = DocumentScanner(scan_index_path=index_path).scan(input_root)
+
+    assert hashed_paths == ["b.md"]
+    assert second[0].sha256_hex == first[0].sha256_hex
+    assert second[1].sha256_hex == hashlib.sha256(b"bb").hexdigest()
+
+    hashed_paths.clear()
+    DocumentScanner(scan_index_path=index_path, strict_rehash=True).scan(input_root)
+    assert sorted(hashed_paths) == ["a.md", "b.md"]
+
+
+def test_scanner_index_prunes_deleted_files_and_ignores_corrupt_sidecar(
+    tmp_path,
+) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    (input_root / "a.md").write_text("a", encoding="utf-8")
+    (input_root / "b.md").write_text("b", encoding="utf-8")
+    index_path = tmp_path / "scan_index.json"
+    index_path.write_text("{not json", encoding="utf-8")
+
+    scanner = DocumentScanner(scan_index_path=index_path)
+    scanner.scan(input_root)
+    (input_root / "b.md").unlink()
+    scanner.scan(input_root, limit=1)
+
+    payload = json.loads(index_path.read_text(encoding="utf-8"))
+    assert payload["input_root"] == input_root.resolve().as_posix()
+    assert sorted(payload["entries"]) == ["a.md"]
+    assert payload["entries"]["a.md"]["sha256_hex"] == hashlib.sha256(b"a").hexdigest()
+
+
+def test_parallel_scanner_keeps_sorted_order_and_hashes_only_limited_slice(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    for index in range(12):
+        (tmp_path / f"doc_{index:02d}.md").write_text(f"body {index}", encoding="utf-8")
+
+    hashed_paths: list[str] = []
+    original_compute_sha256 = scanner_module._compute_sha256
+
+    def _counting_compute_sha256(path):
+        hashed_paths.append(path.name)
+        return original_compute_sha256(path)
+
+    monkeypatch.setattr(scanner_module, "_compute_sha256", _counting_compute_sha256)
+
+    discovered = DocumentScanner(hash_workers=4).scan(
+        tmp_path,
+        from_relative_path="doc_03.md",
+        limit=5,
+    )
+
+    assert [item.relative_path.as_posix() for item in discovered] == [
+        f"doc_{index:02d}.md" for index in range(3, 8)
+    ]
+    assert [item.sha256_hex for item in discovered] == [
+        hashlib.sha256(f"body {index}".encode()).hexdigest() for index in range(3, 8)
+    ]
+    assert sorted(hashed_paths) == [f"doc_{index:02d}.md" for index in range(3, 8)]
+
+
+def test_iter_scan_yields_lazily_and_persists_index_when_closed_early(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    for name in ("a.md", "b.md", "c.md"):
+        (input_root / name).write_text(name, encoding="utf-8")
+    index_path = tmp_path / "scan_index.json"
+
+    hashed_paths: list[str] = []
+    original_compute_sha256 = scanner_module._compute_sha256
+
+    def _counting_compute_sha256(path):
+        hashed_paths.append(path.name)
+        return original_compute_sha256(path)
+
+    monkeypatch.setattr(scanner_module, "_compute_sha256", _counting_compute_sha256)
+
+    scanner = DocumentScanner(scan_index_path=index_path, hash_workers=1)
+    stream = scanner.iter_scan(input_root)
+    first = next(stream)
+
+    assert first.relative_path == PurePosixPath("a.md")
+    assert hashed_paths == ["a.md"]
+    assert not index_path.exists()
+
+    stream.close()
+    payload = json.loads(index_path.read_text(encoding="utf-8"))
+    assert sorted(payload["entries"]) == ["a.md"]
+
+    hashed_paths.clear()
+    assert [item.relative_path for item in scanner.iter_scan(input_root)] == [
+        PurePosixPath("a.md"),
+        PurePosixPath("b.md"),
+        PurePosixPath("c.md"),
+    ]
+    assert hashed_paths == ["b.md", "c.md"]
+
+
+def test_scanner_only_doc_id_reads_index_without_rewriting_it(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    input_root = tmp_path / "input"
+    input_root.mkdir()
+    (input_root / "a.md").write_text("a", encoding="utf-8")
+    (input_root / "b.md").write_text("b", encoding="utf-8")
+    index_path = tmp_path / "scan_index.json"
+    DocumentScanner(scan_index_path=index_path).scan(input_root)
+    index_mtime_ns = index_path.stat().st_mtime_ns
+
+    hashed_paths: list[str] = []
+    monkeypatch.setattr(
+        scanner_module,
+        "_compute_sha256",
+        lambda path: hashed_paths.append(path.name) or "",
+    )
+    discovered = DocumentScanner(scan_index_path=index_path).scan(
+        input_root, only_doc_id="b.md"
+    )
+
+    assert [item.relative_path for item in discovered] == [PurePosixPath("b.md")]
+    assert discovered[0].sha256_hex == hashlib.sha256(b"b").hexdigest()
+    assert hashed_paths == []
+    assert index_path.stat().st_mtime_ns == index_mtime_ns
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import html
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from legal_docs_pipeline.canonicalize import _canonicalize_plain_markdown
+from legal_docs_pipeline.reader import (
+    TextStats,
+    build_text_stats,
+    soft_normalize_text_with_stats,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CORPUS_ROOT = PROJECT_ROOT / "docs/legal/cas_law_v2_2_md"
+
+GOLDEN_CASES = [
+    "",
+    "   \n\n  ",
+    "## Content\r\n\r\n<div>Art.&nbsp;6</div>\r\n\r\n\r\nUCHWAŁA\r\n",
+    "a\n\n\n\nb",
+    "a\n  \n\nb\n \n \n \nc",
+    "\n\n\n  lead\ntrail  \n\n\n",
+    "line<br>next<BR/>x<br />y",
+    "<div class='x'>a</div><span\nstyle='y'>b</span>",
+    "<div <br> tail > after",
+    'keep\n  style="color: red" />  \nnext',
+    'style="a"\n\n\nstyle="b">\n\nz',
+    "form\x0cfeed\n\n\nvertical\vtab",
+    "sep\u2028line\u2029para\x85next\x1cfs",
+    "&#13;carriage&#13;\n&amp;&lt;div&gt;escaped&lt;/div&gt;",
+    "tabs\t\t\n\t\n\n\twords and  spaces   ",
+    "Zażółć gęślą jaźń — § 12 ust. 3\n\n\n\nКириллица тоже",
+]
+
+
+def _legacy_soft_normalize_text(text: str) -> str:
+    patterns = (
+        re.compile(r"<br\s*/?>", re.IGNORECASE),
+        re.compile(r"</?div[^>]*>", re.IGNORECASE),
+        re.compile(r"</?span[^>]*>", re.IGNORECASE),
+    )
+    normalized = html.unescape(text).replace("\xa0", " ")
+    normalized = normalized.replace("\r\n", "\n").replace("\r", "\n")
+    for pattern in patterns:
+        normalized = pattern.sub(
+            "" if pattern.pattern != r"<br\s*/?>" else "\n", normalized
+        )
+    normalized = re.sub(
+        r"^\s*style=\"[^\"]*\"\s*/?>\s*$", "", normalized, flags=re.MULTILINE
+    )
+    normalized = re.sub(r"\n{3,}", "\n\n", normalized)
+    normalized = "\n".join(line.rstrip() for line in normalized.splitlines())
+    return normalized.strip()
+
+
+def _legacy_canonicalize_plain_markdown(text: str) -> str:
+    normalized = html.unescape(text).replace("\xa0", " ")
+    normalized = normalized.replace("\r\n", "\n").replace("\r", "\n")
+    normalized = "\n".join(line.rstrip() for line in normalized.splitlines())
+    normalized = re.sub(r"\n{3,}", "\n\n", normalized)
+    return normalized.strip()
+
+
+def _legacy_text_stats(text: str) -> TextStats:
+    return TextStats(
+        chars=len(text),
+        lines=len(text.splitlines()),
+        words=len(re.findall(r"\b\w+\b", text, flags=re.UNICODE)),
+    )
+
+
+def _fuzz_cases(count: int) -> list[str]:
+    alphabet = [
+        "a",
+        "Ż",
+        "1",
+        " ",
+        "\t",
+        "\n",
+        "\n\n\n",
+        "\r",
+        "\r\n",
+        "\xa0",
+        "&nbsp;",
+        "&amp;",
+        "<br>",
+        "<div>",
+        "</span>",
+        "<",
+        ">",
+        'style="s"',
+        "/>",
+        "\x0c",
+        "\u2028",
+        "word",
+        "-",
+        "#",
+    ]
+    generator = random.Random(20260318)
+    return [
+        "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+def _corpus_texts() -> list[str]:
+    if not CORPUS_ROOT.exists():
+        return []
+    return [
+        path.read_bytes().decode("utf-8").lstrip("\ufeff")
+        for path in sorted(CORPUS_ROOT.rglob("*.md"))
+    ]
+
+
+@pytest.mark.parametrize("text", GOLDEN_CASES + _fuzz_cases(400))
+def test_fused_normalizers_match_legacy_output(text: str) -> None:
+    normalized, stats = soft_normalize_text_with_stats(text)
+    assert normalized == _legacy_soft_normalize_text(text)
+    assert stats == _legacy_text_stats(normalized)
+
+    canonical, canonical_stats = _canonicalize_plain_markdown(text)
+    assert canonical == _legacy_canonicalize_plain_markdown(text)
+    assert canonical_stats == _legacy_text_stats(canonical)
+    assert build_text_stats(text) == _legacy_text_stats(text)
+
+
+def test_fused_normalizers_match_legacy_output_on_corpus() -> None:
+    texts = _corpus_texts()
+    if not texts:
+        pytest.skip("Legal corpus is not available.")
+    for text in texts:
+        raw_markdown = text.replace("\r\n", "\n").replace("\r", "\n")
+        normalized, stats = soft_normalize_text_with_stats(raw_markdown)
+        assert normalized == _legacy_soft_normalize_text(raw_markdown)
+        assert stats == _legacy_text_stats(normalized)
+        canonical, canonical_stats = _canonicalize_plain_markdown(normalized)
+        assert canonical == _legacy_canonicalize_plain_markdown(normalized)
+        assert canonical_stats == _legacy_text_stats(canonical)
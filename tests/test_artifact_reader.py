@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.storage import artifact_reader
+from app.storage.artifact_reader import (
+    artifact_cache_stats,
+    clear_artifact_cache,
+    safe_load_llm_parsed_json,
+    safe_load_ocr_page,
+    safe_load_run_manifest,
+    safe_read_json,
+    safe_read_text,
+)
+from app.storage.artifact_store import PackedArtifactStore
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    clear_artifact_cache()
+
+
+def test_artifact_reads_are_served_from_cache_until_file_changes(
+    tmp_path: Path,
+) -> None:
+    manifest_path = tmp_path / "run.json"
+    manifest_path.write_text(json.dumps({"run_id": "run-1"}), encoding="utf-8")
+
+    first, first_error = safe_load_run_manifest(tmp_path)
+    second, second_error = safe_load_run_manifest(tmp_path)
+
+    assert first_error is None and second_error is None
+    assert first == {"run_id": "run-1"}
+    assert second is first
+    stats = artifact_cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.size_bytes == manifest_path.stat().st_size
+
+    manifest_path.write_text(json.dumps({"run_id": "run-2"}), encoding="utf-8")
+    refreshed_stat = manifest_path.stat()
+    os.utime(
+        manifest_path,
+        ns=(refreshed_stat.st_atime_ns, refreshed_stat.st_mtime_ns + 1_000_000),
+    )
+
+    third, _ = safe_load_run_manifest(tmp_path)
+
+    assert third == {"run_id": "run-2"}
+    assert artifact_cache_stats().misses == 2
+    assert artifact_cache_stats().entries == 1
+
+
+def test_artifact_reader_keeps_errors_uncached(tmp_path: Path) -> None:
+    missing, missing_error = safe_read_text(tmp_path / "missing.txt")
+    directory, directory_error = safe_read_text(tmp_path)
+    (tmp_path / "llm").mkdir()
+    (tmp_path / "llm" / "response_parsed.json").write_text("[1]", encoding="utf-8")
+    broken_path = tmp_path / "broken.json"
+    broken_path.write_text("{", encoding="utf-8")
+
+    broken, broken_error = safe_read_json(broken_path)
+    parsed, parsed_error = safe_load_llm_parsed_json(tmp_path)
+
+    assert missing is None
+    assert missing_error == f"File not found: {tmp_path / 'missing.txt'}"
+    assert directory is None
+    assert directory_error == f"Path is not a file: {tmp_path}"
+    assert broken is None
+    assert (broken_error or "").startswith(f"Invalid JSON in {broken_path}")
+    assert parsed is None
+    assert parsed_error == "Invalid parsed LLM response format: expected JSON object."
+    assert artifact_cache_stats().entries == 1
+
+
+def test_artifact_cache_evicts_least_recently_used_within_bounds(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        artifact_reader,
+        "_ARTIFACT_CACHE",
+        artifact_reader._ArtifactReadCache(max_entries=2, max_bytes=25),
+    )
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.txt"
+        path.write_text(name * 10, encoding="utf-8")
+        paths.append(path)
+    oversized = tmp_path / "oversized.txt"
+    oversized.write_text("x" * 30, encoding="utf-8")
+
+    safe_read_text(paths[0])
+    safe_read_text(paths[1])
+    safe_read_text(paths[0])
+    safe_read_text(paths[2])
+    safe_read_text(oversized)
+
+    stats = artifact_cache_stats()
+    assert (stats.entries, stats.size_bytes) == (2, 20)
+    safe_read_text(paths[0])
+    safe_read_text(paths[1])
+    stats = artifact_cache_stats()
+    assert stats.hits == 2
+    assert stats.misses == 5
+
+
+def test_uncached_text_reads_bypass_the_cache(tmp_path: Path) -> None:
+    log_path = tmp_path / "run.log"
+    log_path.write_text("line-1\n", encoding="utf-8")
+
+    text, error = safe_read_text(log_path, cache=False)
+
+    assert (text, error) == ("line-1\n", None)
+    stats = artifact_cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (0, 0, 0)
+
+
+def test_ocr_pack_stays_open_until_it_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with PackedArtifactStore(tmp_path / "ocr.pack") as store:
+        store.write_text("pages/0001.md", "first")
+        store.write_text("pages/0002.md", "second")
+    opened: list[Path] = []
+    original_init = PackedArtifactStore.__init__
+
+    def _recording_init(self: PackedArtifactStore, path: Path | str) -> None:
+        opened.append(Path(path))
+        original_init(self, path)
+
+    monkeypatch.setattr(PackedArtifactStore, "__init__", _recording_init)
+
+    assert safe_load_ocr_page(tmp_path, 1) == ("first", None)
+    assert safe_load_ocr_page(tmp_path, 2) == ("second", None)
+    assert len(opened) == 1
+
+    with PackedArtifactStore(tmp_path / "ocr.pack") as store:
+        store.write_text("pages/0001.md", "first v2")
+
+    assert safe_load_ocr_page(tmp_path, 1) == ("first v2", None)
+    assert len(opened) == 3
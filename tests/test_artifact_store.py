@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.storage.artifact_store import (
+    ArtifactStore,
+    ArtifactStoreError,
+    LocalArtifactStore,
+    PackedArtifactStore,
+    S3ArtifactStore,
+)
+
+
+class _MissingObjectError(Exception):
+    def __init__(self, key: str) -> None:
+        super().__init__(key)
+        self.response = {"Error": {"Code": "NoSuchKey"}}
+
+
+class _InMemoryS3Client:
+    """Local stand-in for the subset of the boto3 S3 client the store uses."""
+
+    def __init__(self, *, page_size: int = 2) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.page_size = page_size
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes) -> dict[str, Any]:
+        self.objects[(Bucket, Key)] = bytes(Body)
+        return {}
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        if (Bucket, Key) not in self.objects:
+            raise _MissingObjectError(Key)
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        if (Bucket, Key) not in self.objects:
+            raise _MissingObjectError(Key)
+        return {"ContentLength": len(self.objects[(Bucket, Key)])}
+
+    def list_objects_v2(
+        self,
+        *,
+        Bucket: str,
+        Prefix: str,
+        ContinuationToken: str | None = None,
+    ) -> dict[str, Any]:
+        keys = sorted(
+            key
+            for bucket, key in self.objects
+            if bucket == Bucket and key.startswith(Prefix)
+        )
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + self.page_size]
+        truncated = start + self.page_size < len(keys)
+        response: dict[str, Any] = {
+            "Contents": [{"Key": key} for key in page],
+            "IsTruncated": truncated,
+        }
+        if truncated:
+            response["NextContinuationToken"] = str(start + self.page_size)
+        return response
+
+
+_STORE_FACTORIES: dict[str, Callable[[Path], ArtifactStore]] = {
+    "local": lambda root: LocalArtifactStore(root / "run"),
+    "packed": lambda root: PackedArtifactStore(root / "run" / "artifacts.pack"),
+    "s3": lambda root: S3ArtifactStore(
+        client=_InMemoryS3Client(), bucket="kaucja", prefix="sessions/s-1/runs/r-1"
+    ),
+}
+
+
+@pytest.mark.parametrize("backend", sorted(_STORE_FACTORIES))
+def test_artifact_store_round_trips_keys_for_every_backend(
+    tmp_path: Path, backend: str
+) -> None:
+    with _STORE_FACTORIES[backend](tmp_path) as store:
+        store.write_text("run.json", '{"run_id":"r-1"}')
+        store.write_text("documents/0000001/ocr/pages/0001.md", "page one")
+        store.write_text("documents/0000001/ocr/pages/0002.md", "page two")
+        store.write_bytes("documents/0000001/ocr/images/img-0.png", b"\x89PNG")
+        store.write_text("documents/0000001/ocr/pages/0001.md", "page one v2")
+
+        assert store.read_text("documents/0000001/ocr/pages/0001.md") == "page one v2"
+        assert store.read_bytes("documents/0000001/ocr/images/img-0.png") == b"\x89PNG"
+        assert store.exists("run.json")
+        assert not store.exists("missing.txt")
+        assert store.list_keys("documents/0000001/ocr/pages") == [
+            "documents/0000001/ocr/pages/0001.md",
+            "documents/0000001/ocr/pages/0002.md",
+        ]
+        assert len(store.list_keys()) == 4
+        with pytest.raises(FileNotFoundError):
+            store.read_bytes("missing.txt")
+        with pytest.raises(ValueError):
+            store.write_text("../escape.txt", "x")
+
+
+def test_packed_store_reopens_and_drops_torn_trailing_record(tmp_path: Path) -> None:
+    pack_path = tmp_path / "artifacts.pack"
+    with PackedArtifactStore(pack_path) as store:
+        store.write_text("pages/0001.md", "first")
+        store.write_text("pages/0002.md", "second")
+    intact_size = pack_path.stat().st_size
+    with pack_path.open("ab") as handle:
+        handle.write(b"\x05\x00\x00\x00torn")
+
+    reopened = PackedArtifactStore(pack_path)
+    assert reopened.list_keys() == ["pages/0001.md", "pages/0002.md"]
+    reopened.write_text("pages/0003.md", "third")
+    reopened.close()
+
+    assert pack_path.stat().st_size > intact_size
+    final = PackedArtifactStore(pack_path)
+    assert final.read_text("pages/0002.md") == "second"
+    assert final.read_text("pages/0003.md") == "third"
+
+
+def test_packed_store_rejects_corrupt_payload(tmp_path: Path) -> None:
+    pack_path = tmp_path / "artifacts.pack"
+    with PackedArtifactStore(pack_path) as store:
+        store.write_text("combined.md", "content")
+    payload = bytearray(pack_path.read_bytes())
+    payload[payload.index(b"content")] ^= 0xFF
+    pack_path.write_bytes(bytes(payload))
+
+    with pytest.raises(ArtifactStoreError, match="Corrupt artifact"):
+        PackedArtifactStore(pack_path).read_bytes("combined.md")
+
+
+def test_packed_store_reads_the_index_footer_without_scanning_records(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pack_path = tmp_path / "artifacts.pack"
+    with PackedArtifactStore(pack_path) as store:
+        for page in range(1, 4):
+            store.write_text(f"pages/{page:04d}.md", f"page {page}")
+        store.write_text("pages/0002.md", "page 2 v2")
+
+    def _fail_scan(*args: object) -> None:
+        raise AssertionError("closed packs must not be scanned")
+
+    monkeypatch.setattr(PackedArtifactStore, "_scan_records", _fail_scan)
+    reopened = PackedArtifactStore(pack_path)
+    assert reopened.list_keys() == [
+        "pages/0001.md",
+        "pages/0002.md",
+        "pages/0003.md",
+    ]
+    assert reopened.read_text("pages/0002.md") == "page 2 v2"
+    monkeypatch.undo()
+
+    # Appending truncates the footer and closing writes a fresh one.
+    reopened.write_text("pages/0004.md", "page 4")
+    reopened.close()
+    assert PackedArtifactStore(pack_path).list_keys("pages")[-1] == "pages/0004.md"
+
+
+def test_packed_store_treats_an_empty_file_as_a_new_pack(tmp_path: Path) -> None:
+    pack_path = tmp_path / "artifacts.pack"
+    pack_path.write_bytes(b"")
+
+    with PackedArtifactStore(pack_path) as store:
+        assert store.list_keys() == []
+        store.write_text("combined.md", "content")
+
+    assert PackedArtifactStore(pack_path).read_text("combined.md") == "content"
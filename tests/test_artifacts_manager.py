@@ -40,10 +40,11 @@ def test_create_document_artifacts_creates_expected_layout(tmp_path: Path) -> No
 
     assert document.original_dir.is_dir()
     assert document.ocr_dir.is_dir()
-    assert document.pages_dir.is_dir()
-    assert document.tables_dir.is_dir()
-    assert document.images_dir.is_dir()
     assert document.page_renders_dir.is_dir()
+    # The per-file OCR trees are left to the OCR client's "files" layout.
+    assert not document.pages_dir.exists()
+    assert not document.tables_dir.exists()
+    assert not document.images_dir.exists()
 
 
 def test_create_llm_artifacts_creates_expected_files(tmp_path: Path) -> None:
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import errno
 import json
+import shutil
 import sqlite3
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
+from zipfile import ZIP_STORED, ZipFile
 
 import pytest
 
 import app.storage.retention as retention_module
+from app.storage import trash as trash_module
 from app.storage.db import connection
-from app.storage.models import DeleteRunResult
+from app.storage.models import DeleteRunResult, RunRecord
 from app.storage.repo import StorageRepo
 from app.storage.retention import purge_runs_older_than_days
+from app.storage.trash import RunTrash
 from app.storage.zip_export import ZipExportError
 
 
@@ -357,3 +364,234 @@ def test_retention_best_effort_reports_failures(
     assert report.failed_runs == 1
     assert report.skipped_runs == 0
     assert any(run_b.run_id in item for item in report.errors)
+
+
+def test_retention_parallel_export_and_batched_delete_keep_candidate_order(
+    tmp_path: Path,
+) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    session = repo.create_session("session-retention-parallel")
+    runs = [_create_run(repo, session_id=session.session_id) for _ in range(3)]
+    for index, run in enumerate(runs):
+        _set_run_created_at(
+            repo=repo,
+            run_id=run.run_id,
+            created_at=f"2025-01-0{index + 1}T00:00:00+00:00",
+        )
+    # The middle run's backup fails, so it must be skipped but stay in order.
+    (Path(runs[1].artifacts_root_path) / "logs" / "run.log").unlink()
+    (Path(runs[1].artifacts_root_path) / "escape.txt").symlink_to(tmp_path)
+
+    report = purge_runs_older_than_days(
+        repo=repo,
+        days=30,
+        now=datetime(2026, 2, 25, tzinfo=timezone.utc),
+        export_before_delete=True,
+        export_dir=tmp_path / "backups",
+        report_dir=tmp_path / "retention-reports",
+        export_workers=2,
+        delete_workers=2,
+        metadata_batch_size=2,
+        store_only=True,
+    )
+
+    assert [entry["run_id"] for entry in report.audit_entries] == [
+        run.run_id for run in runs
+    ]
+    assert [entry["status"] for entry in report.audit_entries] == [
+        "deleted",
+        "failed",
+        "deleted",
+    ]
+    assert report.deleted_run_ids == [runs[0].run_id, runs[2].run_id]
+    assert report.skipped_runs == 1
+    assert len(report.errors) == 1
+    assert "BACKUP_EXPORT_FAILED" in report.errors[0]
+    assert repo.get_run(runs[1].run_id) is not None
+    for index in (0, 2):
+        assert repo.get_run(runs[index].run_id) is None
+        assert not Path(runs[index].artifacts_root_path).exists()
+        backup_path = report.audit_entries[index]["backup_zip_path"]
+        assert isinstance(backup_path, str)
+        with ZipFile(backup_path) as archive:
+            assert {info.compress_type for info in archive.infolist()} == {
+                ZIP_STORED
+            }
+
+
+def test_retention_streams_and_settles_one_run_at_a_time_by_default(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    session = repo.create_session("session-retention-interleave")
+    runs = [_create_run(repo, session_id=session.session_id) for _ in range(3)]
+    for index, run in enumerate(runs):
+        _set_run_created_at(
+            repo=repo,
+            run_id=run.run_id,
+            created_at=f"2025-01-0{index + 1}T00:00:00+00:00",
+        )
+    events: list[tuple[str, str]] = []
+    original_export = retention_module.export_run_bundle
+    original_delete = repo.delete_run
+    original_iter_runs = repo.iter_runs
+
+    def _record_scan(**kwargs: Any) -> Iterator[RunRecord]:
+        for run in original_iter_runs(**kwargs):
+            events.append(("scan", run.run_id))
+            yield run
+
+    def _record_export(**kwargs: object) -> Path:
+        events.append(("export", Path(str(kwargs["artifacts_root_path"])).name))
+        return original_export(**kwargs)
+
+    def _record_delete(run_id: str) -> DeleteRunResult:
+        events.append(("delete", run_id))
+        return original_delete(run_id)
+
+    monkeypatch.setattr(retention_module, "export_run_bundle", _record_export)
+    monkeypatch.setattr(repo, "delete_run", _record_delete)
+    monkeypatch.setattr(repo, "iter_runs", _record_scan)
+
+    report = purge_runs_older_than_days(
+        repo=repo,
+        days=30,
+        now=datetime(2026, 2, 25, tzinfo=timezone.utc),
+        export_before_delete=True,
+        export_dir=tmp_path / "backups",
+        report_dir=tmp_path / "retention-reports",
+    )
+
+    assert report.deleted_run_ids == [run.run_id for run in runs]
+    assert events == [
+        (action, run.run_id) for run in runs for action in ("scan", "export", "delete")
+    ]
+
+
+def test_delete_runs_reports_batched_metadata_failure_per_run(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    session = repo.create_session("session-delete-runs")
+    runs = [_create_run(repo, session_id=session.session_id) for _ in range(3)]
+    original_delete_metadata = repo._delete_runs_metadata
+
+    def _fail_second_batch(*, run_ids: list[str]) -> set[str]:
+        if runs[2].run_id in run_ids:
+            raise sqlite3.Error("db locked")
+        return original_delete_metadata(run_ids=run_ids)
+
+    monkeypatch.setattr(repo, "_delete_runs_metadata", _fail_second_batch)
+
+    results = repo.delete_runs(
+        [run.run_id for run in runs] + ["missing-run"],
+        workers=2,
+        metadata_batch_size=2,
+    )
+
+    assert [result.run_id for result in results] == [
+        *(run.run_id for run in runs),
+        "missing-run",
+    ]
+    assert [result.deleted for result in results] == [True, True, False, False]
+    assert results[2].error_code == "DELETE_DB_ERROR"
+    assert results[2].artifacts_deleted is True
+    assert results[3].error_code == "RUN_NOT_FOUND"
+    assert repo.get_run(runs[2].run_id) is not None
+
+
+def test_delete_run_moves_artifacts_to_trash_until_reaped(tmp_path: Path) -> None:
+    repo = StorageRepo(
+        db_path=tmp_path / "kaucja.sqlite3",
+        reap_trash_in_background=False,
+    )
+    session = repo.create_session("session-trash")
+    run = _create_run(repo, session_id=session.session_id)
+    artifacts_root = Path(run.artifacts_root_path)
+    trash_dir = tmp_path / ".trash"
+
+    result = repo.delete_run(run.run_id)
+
+    assert result.deleted is True
+    assert result.artifacts_deleted is True
+    assert repo.get_run(run.run_id) is None
+    assert not artifacts_root.exists()
+    trashed = list(trash_dir.iterdir())
+    assert [entry.name.split(".")[0] for entry in trashed] == [run.run_id]
+    assert (trashed[0] / "documents" / "0000001" / "ocr" / "combined.md").is_file()
+
+    assert repo.reap_trash() == 1
+    assert list(trash_dir.iterdir()) == []
+    assert repo.reap_trash() == 0
+
+
+def test_trash_left_by_interrupted_reap_is_reclaimed_on_startup(
+    tmp_path: Path,
+) -> None:
+    repo = StorageRepo(
+        db_path=tmp_path / "kaucja.sqlite3",
+        reap_trash_in_background=False,
+    )
+    session = repo.create_session("session-trash-restart")
+    runs = [_create_run(repo, session_id=session.session_id) for _ in range(2)]
+    results = repo.delete_runs([run.run_id for run in runs], metadata_batch_size=2)
+    assert all(result.deleted for result in results)
+    trash_dir = tmp_path / ".trash"
+    assert len(list(trash_dir.iterdir())) == 2
+
+    restarted = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+
+    assert restarted.trash.wait(timeout=10)
+    assert list(trash_dir.iterdir()) == []
+
+
+def test_trash_reaper_is_shared_and_retries_failed_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(trash_module, "_REAP_RETRY_DELAYS", (0.01, 0.01))
+    trash_dir = tmp_path / ".trash"
+    first = RunTrash(trash_dir)
+    second = RunTrash(tmp_path / "sub" / ".." / ".trash")
+    assert first._reaper is second._reaper
+
+    real_rmtree = shutil.rmtree
+    attempts: list[str] = []
+
+    def _flaky_rmtree(path: str) -> None:
+        attempts.append(path)
+        if len(attempts) == 1:
+            raise PermissionError(errno.EBUSY, "busy", path)
+        real_rmtree(path)
+
+    monkeypatch.setattr(trash_module.shutil, "rmtree", _flaky_rmtree)
+    tree = tmp_path / "run-1"
+    (tree / "logs").mkdir(parents=True)
+    (tree / "logs" / "run.log").write_text("line\n", encoding="utf-8")
+
+    assert first.discard(tree, label="run-1") is not None
+    assert second.wait(timeout=10)
+
+    assert len(attempts) == 2
+    assert list(trash_dir.iterdir()) == []
+
+
+def test_trash_deletes_in_place_when_rename_crosses_filesystems(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    trash = RunTrash(tmp_path / ".trash", background=False)
+    tree = tmp_path / "run-1"
+    (tree / "logs").mkdir(parents=True)
+    (tree / "logs" / "run.log").write_text("line\n", encoding="utf-8")
+
+    def _cross_device_replace(source: Path, target: Path) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link", str(source))
+
+    monkeypatch.setattr(trash_module.os, "replace", _cross_device_replace)
+
+    assert trash.discard(tree, label="run-1") is None
+    assert not tree.exists()
+    assert not trash.has_entries()
@@ -12,6 +12,11 @@ from mistralai.models.ocrrequest import Document
 
 from app.ocr_client.mistral_ocr import MistralOCRClient
 from app.ocr_client.types import OCROptions
+from app.storage.artifact_reader import (
+    safe_list_ocr_pages,
+    safe_load_ocr_page,
+    safe_read_ocr_artifact_bytes,
+)
 
 
 def _install_fake_fitz(
@@ -109,10 +114,20 @@ def test_mistral_ocr_client_saves_expected_artifacts(
     assert result.pages_count == 2
     assert Path(result.raw_response_path).is_file()
     assert Path(result.combined_markdown_path).is_file()
-    assert (output_dir / "pages" / "0001.md").is_file()
-    assert (output_dir / "pages" / "0002.md").is_file()
-    assert (output_dir / "tables" / "tbl-0.html").is_file()
-    assert (output_dir / "images" / "img-0.png").is_file()
+    assert result.artifacts_pack_path == str((output_dir / "ocr.pack").resolve())
+    assert not (output_dir / "pages").exists()
+    assert result.tables_dir is None
+    assert result.images_dir is None
+    assert safe_list_ocr_pages(output_dir) == ([1, 2], None)
+    assert safe_load_ocr_page(output_dir, 2) == ("Second page markdown", None)
+    assert safe_read_ocr_artifact_bytes(output_dir, "tables/tbl-0.html") == (
+        b"<table><tr><td>A</td></tr></table>",
+        None,
+    )
+    assert safe_read_ocr_artifact_bytes(output_dir, "images/img-0.png") == (
+        b"fake-image",
+        None,
+    )
     assert Path(result.quality_path).is_file()
     assert (output_dir / "page_renders" / "0001.png").is_file()
     assert (output_dir / "page_renders" / "0001.png").read_bytes() == b"rendered-page"
@@ -121,13 +136,53 @@ def test_mistral_ocr_client_saves_expected_artifacts(
     assert "[tbl-0.html](tbl-0.html)" in combined_markdown
     assert "![img-0.png](img-0.png)" in combined_markdown
 
-    raw_payload = json.loads(Path(result.raw_response_path).read_text(encoding="utf-8"))
+    raw_text = Path(result.raw_response_path).read_text(encoding="utf-8")
+    raw_payload = json.loads(raw_text)
     assert len(raw_payload["pages"]) == 2
+    assert "image_base64" not in raw_text
+    assert raw_payload["pages"][0]["images"] == [
+        {"mime_type": "image/png", "image_ref": "images/img-0.png"}
+    ]
     quality_payload = json.loads(Path(result.quality_path).read_text(encoding="utf-8"))
     assert "warnings" in quality_payload
     assert "bad_pages" in quality_payload
 
 
+def test_mistral_ocr_files_layout_keeps_one_file_per_artifact(
+    tmp_path: Path,
+    monkeypatch: object,
+) -> None:
+    input_path = tmp_path / "doc.pdf"
+    input_path.write_bytes(b"pdf-bytes")
+    _install_fake_fitz(monkeypatch)
+    output_dir = tmp_path / "ocr"
+    output_dir.mkdir()
+    # A pack left by an earlier packed run must not shadow the new files.
+    (output_dir / "ocr.pack").write_bytes(b"stale")
+    client = MistralOCRClient(
+        process_service=FakeProcessService(),
+        upload_service=FakeUploadService(),
+    )
+
+    result = client.process_document(
+        input_path=input_path,
+        doc_id="0000001",
+        options=OCROptions(artifact_layout="files"),
+        output_dir=output_dir,
+    )
+
+    assert result.artifacts_pack_path is None
+    assert not (output_dir / "ocr.pack").exists()
+    assert result.images_dir == str((output_dir / "images").resolve())
+    assert (output_dir / "pages" / "0001.md").is_file()
+    assert (output_dir / "pages" / "0002.md").is_file()
+    assert (output_dir / "tables" / "tbl-0.html").is_file()
+    assert (output_dir / "images" / "img-0.png").read_bytes() == b"fake-image"
+    assert safe_load_ocr_page(output_dir, 1)[0] == (
+        "Page one [tbl-0.html](tbl-0.html) ![img-0.png](img-0.png)"
+    )
+
+
 def test_mistral_ocr_uses_uploaded_file_id_for_request(
     tmp_path: Path,
     monkeypatch: object,
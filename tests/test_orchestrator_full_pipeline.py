@@ -264,6 +264,17 @@ def test_full_pipeline_success_persists_artifacts_db_and_metrics(
     assert llm_output is not None
     assert llm_output.response_valid is True
 
+    summary = orchestrator.repo.get_run_summary(result.run_id)
+    assert summary is not None
+    assert summary.total_cost_usd == 0.0001
+    assert summary.checklist_items == len(llm_payload["checklist"])
+    assert summary.checklist_confirmed == 1
+    assert summary.checklist_missing == len(llm_payload["checklist"]) - 1
+    assert summary.critical_gaps_count == 1
+    assert summary.next_questions_count == 1
+    assert summary.comparison_json is not None
+    assert summary.comparison_json["checklist"] == llm_payload["checklist"]
+
     artifacts_root = Path(run.artifacts_root_path)
     assert (artifacts_root / "llm" / "request.txt").is_file()
     assert (artifacts_root / "llm" / "response_raw.txt").is_file()
@@ -281,6 +292,7 @@ def test_full_pipeline_success_persists_artifacts_db_and_metrics(
     assert "artifacts" in manifest
     assert "metrics" in manifest
     assert "validation" in manifest
+    assert manifest["artifacts"]["documents"][0]["ocr_artifacts_pack_path"] is None
 
 
 def test_full_pipeline_llm_api_error_marks_run_failed(
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
+from typing import Any
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import pytest
 
 import app.storage.restore as restore_module
 from app.storage.repo import StorageRepo
-from app.storage.restore import RestoreSafetyLimits, restore_run_bundle
+from app.storage.restore import (
+    RestoreSafetyLimits,
+    restore_run_bundle,
+    restore_run_bundles,
+)
 from app.storage.zip_export import export_run_bundle
 
 
@@ -342,6 +348,89 @@ def test_restore_fails_on_bundle_manifest_checksum_mismatch(tmp_path: Path) -> N
     assert repo.get_run(run_id) is None
 
 
+def test_restore_streams_each_member_once_across_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    session_id = "session-parallel"
+    run_id = _seed_restorable_run(repo=repo, session_id=session_id)
+    run = repo.get_run(run_id)
+    assert run is not None
+    original_files = {
+        path.relative_to(run.artifacts_root_path).as_posix(): path.read_bytes()
+        for path in Path(run.artifacts_root_path).rglob("*")
+        if path.is_file()
+    }
+    zip_path = export_run_bundle(artifacts_root_path=run.artifacts_root_path)
+    repo.delete_run(run_id)
+
+    opened_members: list[str] = []
+    handles: list[object] = []
+
+    class CountingZipFile(ZipFile):
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            super().__init__(*args, **kwargs)
+            handles.append(self)
+
+        def open(self, name, *args, **kwargs):  # type: ignore[no-untyped-def]
+            opened_members.append(name if isinstance(name, str) else name.filename)
+            return super().open(name, *args, **kwargs)
+
+    monkeypatch.setattr(restore_module, "ZipFile", CountingZipFile)
+
+    result = restore_run_bundle(repo=repo, zip_path=zip_path, workers=3)
+
+    assert result.status == "restored"
+    assert result.files_checked == len(original_files)
+    # run.json is read once up front for metadata; every other member is
+    # decompressed exactly once while it is hashed and written.
+    assert sorted(opened_members) == sorted(
+        [*original_files, "run.json", "bundle_manifest.json"]
+    )
+    assert len(handles) == 4
+    restored_root = Path(result.artifacts_root_path or "")
+    assert {
+        relative_path: (restored_root / relative_path).read_bytes()
+        for relative_path in original_files
+    } == original_files
+
+
+def test_restore_parallel_integrity_failure_leaves_no_files(tmp_path: Path) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    session_id = "session-parallel-integrity"
+    run_id = _seed_restorable_run(repo=repo, session_id=session_id)
+    run = repo.get_run(run_id)
+    assert run is not None
+    source_zip = export_run_bundle(artifacts_root_path=run.artifacts_root_path)
+    tampered_zip = tmp_path / "tampered.zip"
+    _tamper_archive_entry(
+        source_zip_path=source_zip,
+        target_zip_path=tampered_zip,
+        entry_name="documents/0000001/ocr/combined.md",
+        payload=b"tampered",
+    )
+    repo.delete_run(run_id)
+
+    verify_result = restore_run_bundle(
+        repo=repo,
+        zip_path=tampered_zip,
+        verify_only=True,
+        workers=4,
+    )
+    result = restore_run_bundle(repo=repo, zip_path=tampered_zip, workers=4)
+
+    for failed in (verify_result, result):
+        assert failed.status == "failed"
+        assert failed.error_code == "RESTORE_INVALID_ARCHIVE"
+        assert "Integrity mismatch for 'documents/0000001/ocr/combined.md'" in (
+            failed.error_message or ""
+        )
+        assert failed.manifest_verification_status == "failed"
+        assert failed.files_checked == 0
+    assert not Path(run.artifacts_root_path).exists()
+    assert repo.get_run(run_id) is None
+
+
 def test_restore_legacy_zip_without_bundle_manifest_warns(tmp_path: Path) -> None:
     repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
     run_id = "legacy-run"
@@ -636,3 +725,111 @@ def test_restore_db_failure_without_rollback_keeps_files(
     assert result.rollback_attempted is False
     assert result.rollback_succeeded is None
     assert Path(run.artifacts_root_path).exists()
+
+
+def _export_seeded_runs(
+    *,
+    repo: StorageRepo,
+    session_id: str,
+    count: int,
+) -> list[tuple[str, Path]]:
+    exported: list[tuple[str, Path]] = []
+    for _ in range(count):
+        run_id = _seed_restorable_run(repo=repo, session_id=session_id)
+        run = repo.get_run(run_id)
+        assert run is not None
+        zip_path = export_run_bundle(artifacts_root_path=run.artifacts_root_path)
+        exported.append((run_id, zip_path))
+    for run_id, _ in exported:
+        repo.delete_run(run_id)
+    return exported
+
+
+def test_bulk_restore_reports_each_archive(tmp_path: Path) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    exported = _export_seeded_runs(repo=repo, session_id="session-bulk", count=3)
+    tampered_zip = tmp_path / "tampered.zip"
+    _tamper_archive_entry(
+        source_zip_path=exported[0][1],
+        target_zip_path=tampered_zip,
+        entry_name="logs/run.log",
+        payload=b"tampered-log-content\n",
+    )
+    zip_paths = [
+        exported[1][1],
+        tampered_zip,
+        exported[2][1],
+        exported[1][1],
+        tmp_path / "missing.zip",
+    ]
+
+    bulk_result = restore_run_bundles(
+        repo=repo,
+        zip_paths=zip_paths,
+        workers=3,
+        metadata_batch_size=2,
+    )
+
+    assert bulk_result.archives_total == 5
+    assert bulk_result.restored_archives == 2
+    assert bulk_result.failed_archives == 3
+    assert [archive.zip_path for archive in bulk_result.archives] == [
+        str(path) for path in zip_paths
+    ]
+    results = [archive.result for archive in bulk_result.archives]
+    assert "Integrity mismatch" in (results[1].error_message or "")
+    assert results[2].status == "restored"
+    assert results[4].error_code == "RESTORE_INVALID_ARCHIVE"
+    # The same bundle listed twice is restored by whichever worker claims it
+    # first; the other copy is rejected instead of racing for the run tree.
+    assert sorted(
+        str(result.error_code) for result in (results[0], results[3])
+    ) == ["None", "RESTORE_RUN_EXISTS"]
+    assert repo.get_run(exported[0][0]) is None
+    for run_id, _ in exported[1:]:
+        restored_run = repo.get_run(run_id)
+        assert restored_run is not None
+        assert Path(restored_run.artifacts_root_path).is_dir()
+        assert len(repo.list_documents(run_id=run_id)) == 1
+        assert repo.get_llm_output(run_id=run_id) is not None
+
+
+def test_bulk_restore_rolls_back_only_the_failing_archive(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    exported = _export_seeded_runs(repo=repo, session_id="session-bulk-db", count=3)
+    failing_run_id = exported[1][0]
+    write_metadata_rows = restore_module._write_metadata_rows
+
+    def _failing_write(conn: sqlite3.Connection, rows: Any) -> None:
+        if rows.run_id == failing_run_id:
+            raise sqlite3.OperationalError("db failed")
+        write_metadata_rows(conn, rows)
+
+    monkeypatch.setattr(restore_module, "_write_metadata_rows", _failing_write)
+
+    bulk_result = restore_run_bundles(
+        repo=repo,
+        zip_paths=[zip_path for _, zip_path in exported],
+        metadata_batch_size=10,
+    )
+
+    results = {archive.result.run_id: archive.result for archive in bulk_result.archives}
+    assert bulk_result.restored_archives == 2
+    assert bulk_result.failed_archives == 1
+    failed = results[failing_run_id]
+    assert failed.error_code == "RESTORE_DB_ERROR"
+    assert failed.errors == ["OperationalError: db failed"]
+    assert failed.rollback_attempted is True
+    assert failed.rollback_succeeded is True
+    assert not Path(failed.artifacts_root_path or "").exists()
+    assert repo.get_run(failing_run_id) is None
+    for run_id, _ in (exported[0], exported[2]):
+        assert results[run_id].status == "restored"
+        assert results[run_id].warnings[-1] == (
+            "Batched metadata write failed; retried in a separate transaction: "
+            "OperationalError: db failed"
+        )
+        assert repo.get_run(run_id) is not None
+
@@ -236,3 +236,59 @@ def test_compare_runs_handles_different_provider_and_prompt_with_missing_llm_art
     assert diff["metadata"]["prompt_version_changed"] is True
     assert isinstance(diff["checklist_diff"], list)
     assert isinstance(json.dumps(diff, ensure_ascii=False), str)
+
+
+def test_build_run_snapshot_reads_summary_without_artifacts(tmp_path: Path) -> None:
+    repo = StorageRepo(db_path=tmp_path / "kaucja.sqlite3")
+    session = repo.create_session("session-summary")
+    run = repo.create_run(
+        session_id=session.session_id,
+        provider="openai",
+        model="gpt-5.1",
+        prompt_name="kaucja_gap_analysis",
+        prompt_version="v001",
+        schema_version="v001",
+        status="completed",
+    )
+    metrics = {
+        "timings": {"t_total_ms": 90.0},
+        "usage": {"input_tokens": 10},
+        "usage_normalized": {"total_tokens": 30},
+        "cost": {"total_cost_usd": 0.3},
+    }
+    checklist = [
+        _item(
+            item_id="CONTRACT_EXISTS",
+            status="confirmed",
+            confidence="high",
+            findings_quote="quote",
+            ask="",
+        )
+    ]
+    repo.update_run_metrics(
+        run_id=run.run_id,
+        timings_json=metrics["timings"],
+        usage_json=metrics["usage"],
+        usage_normalized_json=metrics["usage_normalized"],
+        cost_json=metrics["cost"],
+        parsed_json=_payload(checklist=checklist, gaps=["gap-1"], questions=["q1"]),
+    )
+    # The summary answers the comparison from SQL alone.
+    artifacts_root = Path(run.artifacts_root_path)
+    for path in sorted(artifacts_root.rglob("*"), reverse=True):
+        if path.is_file():
+            path.unlink()
+
+    snapshot = build_run_snapshot(repo=repo, run_id=run.run_id)
+
+    assert snapshot["exists"] is True
+    assert snapshot["checklist"] == checklist
+    assert snapshot["critical_gaps_summary"] == ["gap-1"]
+    assert snapshot["next_questions_to_user"] == ["q1"]
+    assert snapshot["metrics"] == {
+        "timings": {"t_total_ms": 90.0},
+        "usage": {},
+        "usage_normalized": {"total_tokens": 30},
+        "cost": {"total_cost_usd": 0.3},
+    }
+    assert snapshot["warnings"] == []
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from app.storage.models import RunCursor
 from app.storage.repo import StorageRepo
 
 
@@ -259,6 +260,90 @@ def test_storage_repo_list_runs_filters(tmp_path: Path) -> None:
     assert len(repo.list_runs(limit=1)) == 1
 
 
+def test_storage_repo_pages_runs_by_keyset_cursor(tmp_path: Path) -> None:
+    db_path = tmp_path / "kaucja.sqlite3"
+    repo = StorageRepo(db_path=db_path)
+    session = repo.create_session("session-a")
+    created_at_values = [
+        "2026-01-01T00:00:00+00:00",
+        "2026-01-02T00:00:00+00:00",
+        "2026-01-02T00:00:00+00:00",
+        "2026-01-02T00:00:00+00:00",
+        "2026-01-03T00:00:00+00:00",
+    ]
+    run_ids: list[str] = []
+    for created_at in created_at_values:
+        run = repo.create_run(
+            session_id=session.session_id,
+            provider="openai",
+            model="gpt-5.1",
+            prompt_name="kaucja_gap_analysis",
+            prompt_version="v001",
+            schema_version="v001",
+            status="completed",
+        )
+        repo.update_run_metrics(
+            run_id=run.run_id,
+            timings_json={},
+            usage_json={},
+            usage_normalized_json={},
+            cost_json={"total_cost_usd": 1.0},
+        )
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "UPDATE runs SET created_at = ? WHERE run_id = ?",
+                (created_at, run.run_id),
+            )
+        run_ids.append(run.run_id)
+
+    expected_oldest_first = [
+        run_id
+        for _, run_id in sorted(zip(created_at_values, run_ids, strict=True))
+    ]
+
+    first_page = repo.list_runs(limit=2)
+    second_page = repo.list_runs(limit=2, after=RunCursor.after_run(first_page[-1]))
+    third_page = repo.list_runs(limit=2, after=RunCursor.after_run(second_page[-1]))
+    assert [run.run_id for run in first_page + second_page + third_page] == list(
+        reversed(expected_oldest_first)
+    )
+    assert first_page[0].cost_json == {"total_cost_usd": 1.0}
+
+    compact_runs = list(
+        repo.iter_runs(page_size=2, oldest_first=True, include_json=False)
+    )
+    assert [run.run_id for run in compact_runs] == expected_oldest_first
+    assert all(run.cost_json is None for run in compact_runs)
+    assert all(run.timings_json is None for run in compact_runs)
+    assert compact_runs[0].artifacts_root_path
+
+    assert [
+        run.run_id
+        for run in repo.iter_runs(date_to="2026-01-02", page_size=3, oldest_first=True)
+    ] == expected_oldest_first[:4]
+
+    with pytest.raises(ValueError, match="page_size"):
+        list(repo.iter_runs(page_size=0))
+
+
+def test_storage_repo_indexes_run_list_filters(tmp_path: Path) -> None:
+    db_path = tmp_path / "kaucja.sqlite3"
+    StorageRepo(db_path=db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'runs'"
+        ).fetchall()
+
+    index_names = {name for (name,) in rows}
+    assert {
+        "idx_runs_created_at",
+        "idx_runs_provider_created_at",
+        "idx_runs_model_created_at",
+        "idx_runs_prompt_version_created_at",
+    }.issubset(index_names)
+
+
 def test_storage_repo_get_run_bundle_returns_run_documents_and_llm_output(
     tmp_path: Path,
 ) -> None:
@@ -297,3 +382,93 @@ def test_storage_repo_get_run_bundle_returns_run_documents_and_llm_output(
     assert bundle.documents[0].doc_id == "0000001"
     assert bundle.llm_output is not None
     assert bundle.llm_output.response_valid is True
+
+
+def test_storage_repo_run_summaries_follow_metrics_and_cascade(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "kaucja.sqlite3"
+    repo = StorageRepo(db_path=db_path)
+    session = repo.create_session("session-summaries")
+    runs = [
+        repo.create_run(
+            session_id=session.session_id,
+            provider="openai",
+            model="gpt-5.1",
+            prompt_name="kaucja_gap_analysis",
+            prompt_version="v001",
+            schema_version="v001",
+            status="completed",
+        )
+        for _ in range(2)
+    ]
+    finalised, legacy = runs
+    repo.update_run_metrics(
+        run_id=finalised.run_id,
+        timings_json={"t_total_ms": 1.0},
+        usage_json={},
+        usage_normalized_json={},
+        cost_json={},
+    )
+    repo.update_run_metrics(
+        run_id=finalised.run_id,
+        timings_json={"t_total_ms": 12.5},
+        usage_json={},
+        usage_normalized_json={
+            "input_tokens": 3,
+            "output_tokens": 4,
+            "total_tokens": 7,
+        },
+        cost_json={"total_cost_usd": 0.25},
+        parsed_json={
+            "checklist": [
+                {"item_id": "A", "status": "confirmed"},
+                {"item_id": "B", "status": "missing"},
+                {"item_id": "C", "status": "missing"},
+            ],
+            "critical_gaps_summary": ["gap"],
+            "next_questions_to_user": [],
+        },
+    )
+    # A run finalised before summaries existed has metrics but no summary row.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            UPDATE runs
+            SET timings_json = ?, usage_normalized_json = ?, cost_json = ?
+            WHERE run_id = ?
+            """,
+            (
+                '{"t_total_ms": 5.0}',
+                '{"total_tokens": 9}',
+                '{"total_cost_usd": 0.5}',
+                legacy.run_id,
+            ),
+        )
+
+    stored = repo.get_run_summary(finalised.run_id)
+    assert stored is not None
+    assert stored.total_cost_usd == 0.25
+    assert stored.total_tokens == 7
+    assert stored.t_total_ms == 12.5
+    assert (stored.checklist_items, stored.checklist_confirmed) == (3, 1)
+    assert stored.checklist_missing == 2
+    assert stored.critical_gaps_count == 1
+    assert stored.comparison_json is not None
+    assert repo.get_run_summary(legacy.run_id) is None
+
+    summaries = repo.get_run_summaries([finalised.run_id, legacy.run_id, "missing"])
+    assert set(summaries) == {finalised.run_id, legacy.run_id}
+    assert summaries[finalised.run_id] == stored
+    derived = summaries[legacy.run_id]
+    assert derived.total_cost_usd == 0.5
+    assert derived.total_tokens == 9
+    assert derived.checklist_items == 0
+    assert derived.comparison_json is None
+    # Reading history never writes.
+    assert repo.get_run_summary(legacy.run_id) is None
+
+    assert repo.delete_run(finalised.run_id).deleted is True
+    with sqlite3.connect(db_path) as conn:
+        remaining = conn.execute("SELECT run_id FROM run_summaries").fetchall()
+    assert remaining == []
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 import pytest
 
+from app.storage import zip_export
 from app.storage.zip_export import ZipExportError, export_run_bundle
 
 
@@ -103,3 +105,82 @@ def test_export_run_bundle_adds_signature_when_key_provided(tmp_path: Path) -> N
         assert signature.get("algorithm") == "hmac-sha256"
         signature_hex = str(signature.get("hmac_sha256") or "")
         assert len(signature_hex) == 64
+
+
+def test_export_run_bundle_streams_chunks_byte_identical_to_in_memory_zip(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = tmp_path / "run-artifacts"
+    _build_run_artifacts(root)
+    payload = bytes(range(256)) * 300
+    (root / "documents" / "0000001" / "original.pdf").write_bytes(payload)
+    monkeypatch.setattr(zip_export, "_EXPORT_CHUNK_BYTES", 1000)
+
+    zip_path = export_run_bundle(
+        artifacts_root_path=root,
+        output_dir=tmp_path / "streamed",
+        signing_key="test-signing-key",
+    )
+
+    with ZipFile(zip_path, "r") as archive:
+        entries = {name: archive.read(name) for name in archive.namelist()}
+    manifest_payload = json.loads(entries["bundle_manifest.json"].decode("utf-8"))
+    pdf_entry = next(
+        item
+        for item in manifest_payload["files"]
+        if item["relative_path"] == "documents/0000001/original.pdf"
+    )
+    assert pdf_entry["size_bytes"] == len(payload)
+    assert pdf_entry["sha256"] == hashlib.sha256(payload).hexdigest()
+
+    reference_path = tmp_path / "reference.zip"
+    with ZipFile(reference_path, mode="w") as reference:
+        for name in sorted(entries):
+            zip_info = ZipInfo(filename=name)
+            zip_info.date_time = (1980, 1, 1, 0, 0, 0)
+            zip_info.compress_type = ZIP_DEFLATED
+            reference.writestr(zip_info, entries[name])
+    assert zip_path.read_bytes() == reference_path.read_bytes()
+
+
+def test_export_run_bundle_fails_when_artifact_changes_mid_export(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = tmp_path / "run-artifacts"
+    _build_run_artifacts(root)
+    collect_archive_files = zip_export._collect_archive_files
+
+    def collect_then_modify(root_path: Path, file_paths: list[Path]):
+        archive_files = collect_archive_files(root_path, file_paths)
+        (root / "logs" / "run.log").write_text("line-1\nline-2\n", encoding="utf-8")
+        return archive_files
+
+    monkeypatch.setattr(zip_export, "_collect_archive_files", collect_then_modify)
+
+    with pytest.raises(ZipExportError, match="Artifact changed during export"):
+        export_run_bundle(artifacts_root_path=root)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["run-artifacts"]
+
+
+def test_export_run_bundle_applies_compression_level(tmp_path: Path) -> None:
+    root = tmp_path / "run-artifacts"
+    _build_run_artifacts(root)
+    (root / "documents" / "0000001" / "ocr" / "combined.md").write_text(
+        "kaucja zwrot " * 20000, encoding="utf-8"
+    )
+
+    fastest = export_run_bundle(
+        artifacts_root_path=root, output_dir=tmp_path / "l1", compression_level=1
+    )
+    smallest = export_run_bundle(
+        artifacts_root_path=root, output_dir=tmp_path / "l9", compression_level=9
+    )
+
+    assert fastest.stat().st_size > smallest.stat().st_size
+    with ZipFile(fastest) as left, ZipFile(smallest) as right:
+        assert {name: left.read(name) for name in left.namelist()} == {
+            name: right.read(name) for name in right.namelist()
+        }